@@ -1,4 +1,6 @@
-from typing import Union, Any
+import math
+
+from typing import Union, Any, Dict, Tuple
 
 import pygame
 
@@ -7,16 +9,57 @@ from pygame_gui.core.interfaces.colour_gradient_interface import (
 )
 
 
+def _get_rotated_size(size: Tuple[int, int], angle: float) -> Tuple[int, int]:
+    """
+    Work out the size of the surface pygame.transform.rotate() would produce from a surface of
+    the given size, without having to rotate one.
+
+    :param size: The size of the surface before rotation.
+    :param angle: The rotation in degrees.
+
+    :return: The size after rotation.
+    """
+    width, height = size
+    if angle % 90 == 0:
+        if angle % 180 == 0:
+            return width, height
+        return height, width
+    radians = math.radians(angle)
+    cos_angle = math.cos(radians)
+    sin_angle = math.sin(radians)
+    rotated_width = int(abs(cos_angle * width) + abs(sin_angle * height))
+    rotated_height = int(abs(sin_angle * width) + abs(cos_angle * height))
+    return rotated_width, rotated_height
+
+
+def _get_surface_bytes(surface: pygame.surface.Surface) -> int:
+    """
+    Get roughly how much memory a surface's pixels take up.
+
+    :param surface: The surface to measure.
+
+    :return: The size of the surface's pixels in bytes.
+    """
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
 class ColourGradient(IColourGradientInterface):
     """
     Creates a small surface containing a smooth gradient between two or three colours.
 
+    Gradients scaled and rotated to fit a particular size are kept, up to max_cached_sizes of
+    them using no more than max_cached_bytes of memory between them, so that redrawing the
+    same shapes does not have to build them again.
+
     :param angle_direction: Angle direction of the gradient in degrees.
     :param colour_1: The first colour of the gradient.
     :param colour_2: The second colour of the gradient.
     :param colour_3: An optional third colour for the gradient.
     """
 
+    max_cached_sizes = 8
+    max_cached_bytes = 4 * 1024 * 1024
+
     def __init__(
         self,
         angle_direction: int,
@@ -47,6 +90,12 @@ class ColourGradient(IColourGradientInterface):
 
         self.gradient_surface = pygame.transform.rotozoom(colour_pixels_surf, 0, 30)
 
+        # finished gradient surfaces by (size, angle), least recently used first
+        self._sized_gradients: Dict[
+            Tuple[Tuple[int, int], int], pygame.surface.Surface
+        ] = {}
+        self._sized_gradients_bytes = 0
+
     def __eq__(self, other: Any) -> bool:
         """
         Checks if this gradient is equal to another when compared with the == symbol.
@@ -104,30 +153,10 @@ class ColourGradient(IColourGradientInterface):
         :param rect: The rectangle on the surface to apply the gradient to. If None, applies to the
                      whole surface.
         """
-        # scale the gradient up to the right size
         input_surface_size = input_surface.get_size()
         if rect is not None:
             input_surface_size = rect.size
-        gradient_size = input_surface_size
-        if self.angle_direction != 0:
-            if rect is not None:
-                clip_area_surf = pygame.surface.Surface(
-                    rect.size, flags=pygame.SRCALPHA, depth=32
-                )
-                inverse_rotated_input = pygame.transform.rotate(
-                    clip_area_surf, -self.angle_direction
-                )
-            else:
-                inverse_rotated_input = pygame.transform.rotate(
-                    input_surface, -self.angle_direction
-                )
-            gradient_size = inverse_rotated_input.get_rect().size
-        gradient_surf = pygame.surface.Surface(
-            gradient_size, flags=pygame.SRCALPHA, depth=32
-        )
-
-        pygame.transform.scale(self.gradient_surface, gradient_size, gradient_surf)
-        gradient_surf = pygame.transform.rotate(gradient_surf, self.angle_direction)
+        gradient_surf = self._get_sized_gradient(input_surface_size)
 
         if rect is not None:
             input_surface.set_clip(rect)
@@ -147,3 +176,39 @@ class ColourGradient(IColourGradientInterface):
                 gradient_placement_rect,
                 special_flags=pygame.BLEND_RGBA_MULT,
             )
+
+    def _get_sized_gradient(self, size: Tuple[int, int]) -> pygame.surface.Surface:
+        """
+        Get this gradient scaled and rotated to cover an area of the given size, reusing one
+        we made earlier if we can.
+
+        :param size: The size of the area to cover.
+
+        :return: The gradient surface, which should not be drawn on.
+        """
+        cache_key = (tuple(size), self.angle_direction)
+        gradient_surf = self._sized_gradients.pop(cache_key, None)
+        if gradient_surf is None:
+            # scale the gradient up to the right size
+            gradient_size = size
+            if self.angle_direction != 0:
+                gradient_size = _get_rotated_size(size, -self.angle_direction)
+            gradient_surf = pygame.surface.Surface(
+                gradient_size, flags=pygame.SRCALPHA, depth=32
+            )
+            pygame.transform.scale(self.gradient_surface, gradient_size, gradient_surf)
+            gradient_surf = pygame.transform.rotate(gradient_surf, self.angle_direction)
+            surf_bytes = _get_surface_bytes(gradient_surf)
+            if surf_bytes > self.max_cached_bytes:
+                # too big to keep at all, don't throw away the rest for it
+                return gradient_surf
+            while self._sized_gradients and (
+                len(self._sized_gradients) >= self.max_cached_sizes
+                or self._sized_gradients_bytes + surf_bytes > self.max_cached_bytes
+            ):
+                oldest_key = next(iter(self._sized_gradients))
+                oldest_surf = self._sized_gradients.pop(oldest_key)
+                self._sized_gradients_bytes -= _get_surface_bytes(oldest_surf)
+            self._sized_gradients_bytes += surf_bytes
+        self._sized_gradients[cache_key] = gradient_surf
+        return gradient_surf
@@ -1,11 +1,12 @@
 import math
 
 from collections import deque
-from typing import Dict, List, Union, Tuple, Optional, Deque
+from typing import Dict, List, Union, Tuple, Optional, Deque, Callable
 
 import pygame
 
 from pygame_gui.core.interfaces import IUIManagerInterface
+from pygame_gui.core.surface_cache import SurfaceCache, SurfaceCacheID, ShapeCacheKey
 from pygame_gui.core.utility import basic_blit
 
 from pygame_gui.core.text import TextLineChunkFTFont, TextBoxLayout
@@ -16,15 +17,19 @@ class DrawableShapeState:
     """
     Represents a single state of a drawable shape.
 
+    The state's surface may be shared with other shapes that look exactly the same, in which
+    case it is copied the first time this state needs to draw something of its own on top.
+
     :param state_id: The ID/name of this state.
 
     """
 
     def __init__(self, state_id: str):
         self.state_id = state_id
-        self.surface = pygame.surface.Surface((0, 0), flags=pygame.SRCALPHA, depth=32)
+        self._surface = pygame.surface.Surface((0, 0), flags=pygame.SRCALPHA, depth=32)
+        self.surface_is_shared = False
         self.has_fresh_surface = False
-        self.cached_background_id = None  # type: Union[str, None]
+        self.cached_background_id: Optional[SurfaceCacheID] = None
         self.transition = None  # type: Union[DrawableStateTransition, None]
 
         self.should_auto_pregen = self.state_id != "disabled"
@@ -34,6 +39,38 @@ class DrawableShapeState:
         self.text_surface: Optional[pygame.Surface] = None
         self.pre_text_surface: Optional[pygame.Surface] = None
 
+    @property
+    def surface(self) -> pygame.surface.Surface:
+        """
+        The surface of this state, which should not be drawn on; use get_writable_surface()
+        for that.
+        """
+        return self._surface
+
+    @surface.setter
+    def surface(self, new_surface: pygame.surface.Surface):
+        self._surface = new_surface
+        self.surface_is_shared = False
+
+    def set_shared_surface(self, shared_surface: pygame.surface.Surface):
+        """
+        Use a surface shared with other shapes as this state's surface, without copying it.
+
+        :param shared_surface: The shared surface.
+        """
+        self._surface = shared_surface
+        self.surface_is_shared = True
+
+    def get_writable_surface(self) -> pygame.surface.Surface:
+        """
+        Gets this state's surface ready to draw on, copying it first if it is shared.
+
+        :return: A surface belonging only to this state.
+        """
+        if self.surface_is_shared:
+            self.surface = self._surface.copy()
+        return self._surface
+
     def get_surface(self) -> pygame.surface.Surface:
         """
         Gets the pygame.surface.Surface of this state. Will be a blend of this state and
@@ -55,24 +92,51 @@ class DrawableShapeState:
 
         """
         if self.transition is not None:
+            previous_step = self.transition.get_blend_step()
             self.transition.update(time_delta)
-            self.has_fresh_surface = True
             if self.transition.finished:
                 self.transition = None
+                self.has_fresh_surface = True
+            elif self.transition.get_blend_step() != previous_step:
+                self.has_fresh_surface = True
+
+
+def _get_frame_bytes(frame: pygame.surface.Surface) -> int:
+    """
+    Get roughly how much memory a blended frame's pixels take up.
+
+    :param frame: The frame to measure.
+
+    :return: The size of the frame's pixels in bytes.
+    """
+    return frame.get_width() * frame.get_height() * frame.get_bytesize()
 
 
 class DrawableStateTransition:
     """
     Starts & controls a transition between two states of a drawable shape.
 
+    The blend moves along in a fixed number of steps, and each blended frame is kept so that
+    later transitions between the same two surfaces, in this shape or in any identical one, can
+    reuse it rather than blending again.
+
     :param states: A dictionary of all the drawable states.
     :param start_state_id: The state to start from.
     :param target_state_id: The state to transition to.
     :param duration: The length of the transition
     :param progress: The initial progress along the transition.
+    :param shape_cache: The cache to share blended frames through, if any.
+    :param blended_frames: Where blended frames kept between transitions are looked up, if
+                           anywhere.
+    :param keep_blended_frame: Called to keep a newly blended frame in blended_frames. Returns
+                               False if there is no room for it, after which this transition
+                               stops offering frames. Frames not kept are still shared while
+                               in use. If None, every frame is kept.
 
     """
 
+    blend_steps = 16
+
     def __init__(
         self,
         states: Dict[str, DrawableShapeState],
@@ -81,8 +145,19 @@ class DrawableStateTransition:
         duration: float,
         *,
         progress: float = 0.0,
+        shape_cache: Optional[SurfaceCache] = None,
+        blended_frames: Optional[
+            Dict[Tuple[pygame.Surface, pygame.Surface, int], pygame.Surface]
+        ] = None,
+        keep_blended_frame: Optional[
+            Callable[[Tuple[pygame.Surface, pygame.Surface, int], pygame.Surface], bool]
+        ] = None,
     ):
         self.states = states
+        self.shape_cache = shape_cache
+        self.blended_frames = blended_frames
+        self.keep_blended_frame = keep_blended_frame
+        self._keeping_blended_frames = blended_frames is not None
         self.duration = duration
         self.remaining_time = self.duration - progress
         self.percentage_start_state = 1.0
@@ -105,24 +180,82 @@ class DrawableStateTransition:
         else:
             self.finished = True
 
+    def get_blend_step(self) -> int:
+        """
+        Get how far along the blend is, rounded to one of our fixed steps.
+
+        :return: The step, from 0 (all start state) to blend_steps (all target state).
+        """
+        if self.finished:
+            return self.blend_steps
+        return int(round(self.percentage_target_state * self.blend_steps))
+
     def produce_blended_result(self) -> pygame.surface.Surface:
         """
         Produces a blend between the images of our start state and our target state. The
         progression of the blend is dictated by the progress of time through the transition.
 
+        The result may be shared, so should not be drawn on.
+
         :return: The blended surface.
 
         """
-        result = self.states[self.start_stat_id].surface.copy()
-        blended_target = self.states[self.target_state_id].surface.copy()
+        start_surface = self.states[self.start_stat_id].surface
+        target_surface = self.states[self.target_state_id].surface
+        step = self.get_blend_step()
+        if step <= 0:
+            return start_surface
+        if (
+            step >= self.blend_steps
+            or start_surface.get_size() != target_surface.get_size()
+        ):
+            return target_surface
+
+        frame_id = (start_surface, target_surface, step)
+        frame = None
+        if self.blended_frames is not None:
+            frame = self.blended_frames.get(frame_id)
+        if frame is None and self.shape_cache is not None:
+            frame = self.shape_cache.find_shared_surface_in_cache(frame_id)
+        if frame is None:
+            frame = self._blend_surfaces(
+                start_surface, target_surface, step / self.blend_steps
+            )
+            if self.shape_cache is not None:
+                self.shape_cache.share_surface(frame_id, frame)
+        if self._keeping_blended_frames and frame_id not in self.blended_frames:
+            if self.keep_blended_frame is None:
+                self.blended_frames[frame_id] = frame
+            elif not self.keep_blended_frame(frame_id, frame):
+                # out of room, don't keep asking for the rest of this transition
+                self._keeping_blended_frames = False
+        return frame
+
+    @staticmethod
+    def _blend_surfaces(
+        start_surface: pygame.surface.Surface,
+        target_surface: pygame.surface.Surface,
+        target_fraction: float,
+    ) -> pygame.surface.Surface:
+        """
+        Cross-fade two surfaces of the same size.
+
+        :param start_surface: The surface we are fading from.
+        :param target_surface: The surface we are fading to.
+        :param target_fraction: How much of the target surface to show, from 0.0 to 1.0.
+
+        :return: The blended surface.
+        """
+        result = start_surface.copy()
+        blended_target = target_surface.copy()
         start_multiply_surface = pygame.surface.Surface(
-            self.states[self.start_stat_id].surface.get_size(),
+            start_surface.get_size(),
             flags=pygame.SRCALPHA,
             depth=32,
         )
         target_multiply_surface = start_multiply_surface.copy()
 
-        start_alpha = int(round(255.0 * self.percentage_start_state))
+        start_alpha = int(round(255.0 * (1.0 - target_fraction)))
         target_alpha = 255 - start_alpha
 
         start_multiply_surface.fill(
@@ -156,6 +289,8 @@ class DrawableShape:
 
     """
 
+    max_transition_frame_bytes = 128 * 1024
+
     def __init__(
         self,
         containing_rect: pygame.Rect,
@@ -259,10 +394,24 @@ class DrawableShape:
 
         self.ui_manager = manager
         self.shape_cache = self.ui_manager.get_theme().shape_cache
+        # transition frames blended between our states' surfaces, kept for the next transition
+        # within max_transition_frame_bytes
+        self.transition_frames: Dict[
+            Tuple[pygame.Surface, pygame.Surface, int], pygame.Surface
+        ] = {}
+        self.transition_frame_bytes = 0
+        # one per state, built when first needed after any change to our size
+        self.shape_cache_keys: Dict[str, ShapeCacheKey] = {}
+        self.redraw_scheduler = self.ui_manager.get_shape_redraw_scheduler()
 
         self.states_to_redraw_queue: Deque[str] = deque([])
         self.need_to_clean_up = True
 
+        # set by the owning element so it gets woken up when we have work for update() to do
+        self.wake_up_callback: Optional[Callable[[], None]] = None
+        # set by the owning element so queued redraws of shapes on screen can be done first
+        self.visibility_callback: Optional[Callable[[], bool]] = None
+
         self.should_trigger_full_rebuild = True
         self.time_until_full_rebuild_after_changing_size = 0.35
         self.full_rebuild_countdown = self.time_until_full_rebuild_after_changing_size
@@ -355,10 +504,17 @@ class DrawableShape:
                 duration = self.state_transition_times[
                     (self.previous_state.state_id, self.active_state.state_id)
                 ]
+                self._prune_transition_frames()
                 if self.previous_state.transition is None:
                     # completely fresh transition
                     self.active_state.transition = DrawableStateTransition(
-                        self.states, prev_id, next_id, duration
+                        self.states,
+                        prev_id,
+                        next_id,
+                        duration,
+                        shape_cache=self.shape_cache,
+                        blended_frames=self.transition_frames,
+                        keep_blended_frame=self._keep_transition_frame,
                     )
                 elif (
                     self.previous_state.transition.start_stat_id
@@ -366,9 +522,93 @@ class DrawableShape:
                 ):
                     progress_time = self.previous_state.transition.remaining_time
                     transition = DrawableStateTransition(
-                        self.states, prev_id, next_id, duration, progress=progress_time
+                        self.states,
+                        prev_id,
+                        next_id,
+                        duration,
+                        progress=progress_time,
+                        shape_cache=self.shape_cache,
+                        blended_frames=self.transition_frames,
+                        keep_blended_frame=self._keep_transition_frame,
                     )
                     self.active_state.transition = transition
+        self._wake_up_owner()
+
+    def _prune_transition_frames(self):
+        """
+        Let go of any kept transition frames blended from surfaces our states no longer use.
+        The dictionary is changed in place, as a running transition may be keeping frames in it.
+        """
+        if not self.transition_frames:
+            return
+        current_surfaces = {id(state.surface) for state in self.states.values()}
+        stale_frame_ids = [
+            frame_id
+            for frame_id in self.transition_frames
+            if id(frame_id[0]) not in current_surfaces
+            or id(frame_id[1]) not in current_surfaces
+        ]
+        for frame_id in stale_frame_ids:
+            frame = self.transition_frames.pop(frame_id)
+            self.transition_frame_bytes -= _get_frame_bytes(frame)
+
+    def _keep_transition_frame(
+        self,
+        frame_id: Tuple[pygame.Surface, pygame.Surface, int],
+        frame: pygame.surface.Surface,
+    ) -> bool:
+        """
+        Keep hold of a blended transition frame for later transitions, if there is room for it
+        within max_transition_frame_bytes.
+
+        Frames already kept are never pushed out by new ones, because a transition visits its
+        frames in order and would push out each frame before it came round again.
+
+        :param frame_id: The start surface, target surface and step the frame was blended for.
+        :param frame: The blended frame.
+
+        :return: True if the frame was kept, False if there was no room for it.
+        """
+        frame_bytes = _get_frame_bytes(frame)
+        if self.transition_frame_bytes + frame_bytes > self.max_transition_frame_bytes:
+            return False
+        self.transition_frames[frame_id] = frame
+        self.transition_frame_bytes += frame_bytes
+        return True
+
+    def is_idle(self) -> bool:
+        """
+        Check if calling update() would do nothing right now. That is, there are no states queued
+        for redrawing, no pending rebuild, no running transition and no fresh surface waiting to
+        be collected.
+
+        :return: True if this shape has nothing to do.
+        """
+        return (
+            not self.states_to_redraw_queue
+            and not self.need_to_clean_up
+            and not self.should_trigger_full_rebuild
+            and self.active_state.transition is None
+            and not self.active_state.has_fresh_surface
+        )
+
+    def is_visible(self) -> bool:
+        """
+        Check if the element that owns this shape is currently on screen. Shapes that don't
+        know their owner count as visible.
+
+        :return: True if the shape may be seen.
+        """
+        if self.visibility_callback is not None:
+            return self.visibility_callback()
+        return True
+
+    def _wake_up_owner(self):
+        """
+        Let the element that owns this shape know that update() has work to do again.
+        """
+        if self.wake_up_callback is not None:
+            self.wake_up_callback()
 
     def update(self, time_delta: float):
         """
@@ -378,8 +618,11 @@ class DrawableShape:
 
         """
         if len(self.states_to_redraw_queue) > 0:
-            state = self.states_to_redraw_queue.popleft()
-            self.redraw_state(state)
+            if self.redraw_scheduler.is_active():
+                self.redraw_scheduler.schedule(self)
+            else:
+                state = self.states_to_redraw_queue.popleft()
+                self.redraw_state(state)
         if self.need_to_clean_up and len(self.states_to_redraw_queue) == 0:
             # last state so clean up
             self.clean_up_temp_shapes()
@@ -399,6 +642,7 @@ class DrawableShape:
         to account for it.
 
         """
+        self.shape_cache_keys.clear()
         shape_params_changed = False
         if (
             "shadow_width" in self.theming
@@ -435,6 +679,33 @@ class DrawableShape:
         self.should_trigger_full_rebuild = False
         self.full_rebuild_countdown = self.time_until_full_rebuild_after_changing_size
 
+    def _get_shape_cache_key(
+        self, state_str: str, shape: str, corner_radius: Optional[List[int]] = None
+    ) -> ShapeCacheKey:
+        """
+        Get the key for a state's surface in the shape cache, building it if we haven't since
+        the shape last changed size.
+
+        :param state_str: The ID string of the state.
+        :param shape: A string for the overall shape of the surface.
+        :param corner_radius: Optional corner radius parameter, only used for rounded rectangles.
+
+        :return: The key.
+        """
+        shape_key = self.shape_cache_keys.get(state_str)
+        if shape_key is None:
+            shape_key = self.shape_cache.build_cache_key(
+                shape,
+                self.containing_rect.size,
+                self.shadow_width,
+                self.border_widths,
+                self.theming[f"{state_str}_border"],
+                self.theming[f"{state_str}_bg"],
+                corner_radius,
+            )
+            self.shape_cache_keys[state_str] = shape_key
+        return shape_key
+
     def _set_corner_params(self):
         self.shape_corner_radius = self.theming["shape_corner_radius"]
         tl_offset = round(
@@ -468,6 +739,11 @@ class DrawableShape:
         Starts the redrawing process for all states of this shape that auto pre-generate.
         Redrawing is done one state at a time so will take a few loops of the game to
         complete if this shape has many states.
+
+        When the redraw scheduler has a time budget the first state is left to it as well, so
+        that many shapes rebuilding at once don't all draw a state in the same loop. Until
+        then the active state keeps showing its old surface, if it is still the right size, or
+        a blank one.
         """
         self.states_to_redraw_queue = deque(
             [
@@ -476,8 +752,49 @@ class DrawableShape:
                 if (state.should_auto_pregen or force_full_redraw)
             ]
         )
-        initial_state = self.states_to_redraw_queue.popleft()
-        self.redraw_state(initial_state)
+        if self.redraw_scheduler.is_active() and self._use_placeholder_surface():
+            self.redraw_scheduler.schedule(self)
+        else:
+            initial_state = self.states_to_redraw_queue.popleft()
+            self.redraw_state(initial_state)
+        self._wake_up_owner()
+
+    def _use_placeholder_surface(self) -> bool:
+        """
+        Give the active state something cheap to show until the scheduler gets round to
+        redrawing it.
+
+        :return: True if the active state has a placeholder, False if it must be drawn now.
+        """
+        size = self.containing_rect.size
+        if (
+            self.active_state.state_id not in self.states_to_redraw_queue
+            or size[0] <= 0
+            or size[1] <= 0
+        ):
+            return False
+        if self.active_state.surface.get_size() != size:
+            self.active_state.set_shared_surface(
+                pygame.surface.Surface(size, flags=pygame.SRCALPHA, depth=32)
+            )
+        self.active_state.generated = False
+        return True
+
+    def ensure_state_drawn(self, state_id: str):
+        """
+        Redraw a state straight away if it is still waiting for the redraw scheduler to draw it
+        for the first time since it was last rebuilt. Needed before using a state's surfaces
+        directly, rather than waiting for a fresh surface.
+
+        :param state_id: The ID/name of the state.
+        """
+        if (
+            state_id in self.states
+            and not self.states[state_id].generated
+            and state_id in self.states_to_redraw_queue
+        ):
+            self.states_to_redraw_queue.remove(state_id)
+            self.redraw_state(state_id)
 
     def align_all_text_rows(self):
         """
@@ -536,6 +853,7 @@ class DrawableShape:
         :return: The surface asked for, or the best available substitute.
 
         """
+        self.ensure_state_drawn(state_name)
         if state_name in self.states and self.states[state_name].surface is not None:
             return self.states[state_name].surface
         elif state_name in self.states and self.states["normal"].surface is not None:
@@ -592,38 +910,33 @@ class DrawableShape:
         if images_key in self.theming:
             images = self.theming[images_key]
             if images:  # Only process if there are actually images
-                state_surface = self.states[state_str].surface
+                state = self.states[state_str]
 
                 # Get corresponding position data
                 positions_key = images_key.replace("_images", "_image_positions")
                 positions = self.theming.get(positions_key, [])
 
-                # Draw each image in layer order (they should already be sorted by layer)
-                for i, image in enumerate(images):
-                    if image is not None:
-                        # Get position for this image (default to center if not specified)
-                        if i < len(positions):
-                            pos_x, pos_y = positions[i]
-                        else:
-                            pos_x, pos_y = 0.5, 0.5  # Default to center
-
-                        # Calculate actual pixel position
-                        surface_rect = state_surface.get_rect()
-                        image_rect = image.get_rect()
-
-                        # Position represents where to place the image based on relative coordinates
-                        # (1.0, 1.0) should place the bottom-right corner of the image at the
-                        # bottom-right of the element
-                        target_x = surface_rect.width * pos_x - image_rect.width * pos_x
-                        target_y = (
-                            surface_rect.height * pos_y - image_rect.height * pos_y
-                        )
-
-                        # Set the image position
-                        image_rect.x = int(target_x)
-                        image_rect.y = int(target_y)
-
-                        state_surface.blit(image, image_rect)
+                # the same images on the same shared surface can be shared too
+                composite_id = None
+                if state.surface_is_shared:
+                    composite_id = (
+                        state.surface,
+                        tuple(images),
+                        tuple(tuple(position) for position in positions),
+                    )
+                    composite_surface = self.shape_cache.find_shared_surface_in_cache(
+                        composite_id
+                    )
+                    if composite_surface is not None:
+                        state.set_shared_surface(composite_surface)
+                        images = []
+
+                if images:
+                    state_surface = state.get_writable_surface()
+                    self._blit_images(state_surface, images, positions)
+                    if composite_id is not None:
+                        self.shape_cache.share_surface(composite_id, state_surface)
+                        state.set_shared_surface(state_surface)
 
         # Handle text
         if add_text:
@@ -631,6 +944,44 @@ class DrawableShape:
                 state_str, text_colour_state_str, text_shadow_colour_state_str
             )
 
+    @staticmethod
+    def _blit_images(
+        state_surface: pygame.surface.Surface,
+        images: List[pygame.surface.Surface],
+        positions: List[Tuple[float, float]],
+    ):
+        """
+        Draw a state's images onto its surface.
+
+        :param state_surface: The surface to draw on.
+        :param images: The images, in layer order.
+        :param positions: The relative position of each image, any without one are centred.
+        """
+        # Draw each image in layer order (they should already be sorted by layer)
+        for i, image in enumerate(images):
+            if image is not None:
+                # Get position for this image (default to center if not specified)
+                if i < len(positions):
+                    pos_x, pos_y = positions[i]
+                else:
+                    pos_x, pos_y = 0.5, 0.5  # Default to center
+
+                # Calculate actual pixel position
+                surface_rect = state_surface.get_rect()
+                image_rect = image.get_rect()
+
+                # Position represents where to place the image based on relative coordinates
+                # (1.0, 1.0) should place the bottom-right corner of the image at the
+                # bottom-right of the element
+                target_x = surface_rect.width * pos_x - image_rect.width * pos_x
+                target_y = surface_rect.height * pos_y - image_rect.height * pos_y
+
+                # Set the image position
+                image_rect.x = int(target_x)
+                image_rect.y = int(target_y)
+
+                state_surface.blit(image, image_rect)
+
     def build_text_layout(self):
         """
         Build a text box layout for this drawable shape if it has some text.
@@ -842,13 +1193,22 @@ class DrawableShape:
         :param text_shadow_colour_state_str: The string identifying the text shadow
                                              colour to use.
         """
-        if self.text_box_layout is not None:
-            # copy the pre-text surface & create a new empty text surface for this state
-            self.states[state_str].pre_text_surface = self.states[
-                state_str
-            ].surface.copy()
-            self.states[state_str].text_surface = pygame.surface.Surface(
-                self.states[state_str].surface.get_size(),
+        if (
+            self.text_box_layout is not None
+            and self.theming["text"] == ""
+            and not self.editable_text
+        ):
+            # nothing to draw, so the surface can stay shared
+            self.states[state_str].pre_text_surface = self.states[state_str].surface
+            self.states[state_str].text_surface = None
+        elif self.text_box_layout is not None:
+            # keep the pre-text surface & create a new empty text surface for this state, the
+            # text goes on a copy so the pre-text surface can stay shared
+            state = self.states[state_str]
+            state.pre_text_surface = state.surface
+            state.surface = state.pre_text_surface.copy()
+            state.text_surface = pygame.surface.Surface(
+                state.surface.get_size(),
                 flags=pygame.SRCALPHA,
                 depth=32,
             )
@@ -968,6 +1328,7 @@ class DrawableShape:
             self.text_box_layout.toggle_cursor()
             self.finalise_text_onto_active_state()
             self.active_state.has_fresh_surface = True
+            self._wake_up_owner()
 
     def redraw_state(self, state_str: str, add_text: bool = True):
         """
@@ -159,6 +159,7 @@ class EllipseDrawableShape(DrawableShape):
             return False
         self.containing_rect.width = int(dimensions[0])
         self.containing_rect.height = int(dimensions[1])
+        self.shape_cache_keys.clear()
         self.click_area_shape.width = int(dimensions[0]) - (2 * self.shadow_width)
         self.click_area_shape.height = int(dimensions[1]) - (2 * self.shadow_width)
 
@@ -212,18 +213,11 @@ class EllipseDrawableShape(DrawableShape):
                 "filled_bar" not in self.theming
                 and "filled_bar_width_percentage" not in self.theming
             ):
-                shape_id = self.shape_cache.build_cache_id(
-                    "ellipse",
-                    self.containing_rect.size,
-                    self.shadow_width,
-                    self.border_widths,
-                    self.theming[border_colour_state_str],
-                    self.theming[bg_colour_state_str],
-                )
+                shape_id = self._get_shape_cache_key(state_str, "ellipse")
 
-                found_shape = self.shape_cache.find_surface_in_cache(shape_id)
+                found_shape = self.shape_cache.find_shared_surface_in_cache(shape_id)
             if found_shape is not None:
-                self.states[state_str].surface = found_shape.copy()
+                self.states[state_str].set_shared_surface(found_shape)
             else:
                 if self.base_surface is not None:
                     self.states[state_str].surface = self.base_surface.copy()
@@ -356,7 +350,7 @@ class EllipseDrawableShape(DrawableShape):
                     and self.states[state_str].surface.get_height() <= 1024
                 ):
                     self.shape_cache.add_surface_to_cache(
-                        self.states[state_str].surface.copy(), shape_id
+                        self.states[state_str].surface, shape_id
                     )
 
             self.finalise_images_and_text(
@@ -368,6 +362,7 @@ class EllipseDrawableShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self._wake_up_owner()
         self.states[state_str].generated = True
 
     @staticmethod
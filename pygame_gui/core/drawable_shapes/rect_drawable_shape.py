@@ -246,6 +246,7 @@ class RectDrawableShape(DrawableShape):
             return False
         self.containing_rect.width = int(dimensions[0])
         self.containing_rect.height = int(dimensions[1])
+        self.shape_cache_keys.clear()
         self.click_area_shape.width = int(dimensions[0]) - (2 * self.shadow_width)
         self.click_area_shape.height = int(dimensions[1]) - (2 * self.shadow_width)
 
@@ -293,19 +294,12 @@ class RectDrawableShape(DrawableShape):
                 "filled_bar" not in self.theming
                 and "filled_bar_width_percentage" not in self.theming
             ):
-                shape_id = self.shape_cache.build_cache_id(
-                    "rectangle",
-                    self.containing_rect.size,
-                    self.shadow_width,
-                    self.border_widths,  # Pass all border widths for caching
-                    self.theming[border_colour_state_str],
-                    self.theming[bg_colour_state_str],
-                )
+                shape_id = self._get_shape_cache_key(state_str, "rectangle")
 
-                found_shape = self.shape_cache.find_surface_in_cache(shape_id)
+                found_shape = self.shape_cache.find_shared_surface_in_cache(shape_id)
 
             if found_shape is not None:
-                self.states[state_str].surface = found_shape.copy()
+                self.states[state_str].set_shared_surface(found_shape)
             else:
                 if self.base_surface is not None:
                     self.states[state_str].surface = self.base_surface.copy()
@@ -455,7 +449,7 @@ class RectDrawableShape(DrawableShape):
                     )
                 ):
                     self.shape_cache.add_surface_to_cache(
-                        self.states[state_str].surface.copy(), shape_id
+                        self.states[state_str].surface, shape_id
                     )
                     self.states[state_str].cached_background_id = shape_id
 
@@ -468,4 +462,5 @@ class RectDrawableShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self._wake_up_owner()
         self.states[state_str].generated = True
@@ -338,6 +338,7 @@ class RoundedRectangleShape(DrawableShape):
             return False
         self.containing_rect.width = int(dimensions[0])
         self.containing_rect.height = int(dimensions[1])
+        self.shape_cache_keys.clear()
         self.click_area_shape.width = int(dimensions[0]) - (2 * self.shadow_width)
         self.click_area_shape.height = int(dimensions[1]) - (2 * self.shadow_width)
 
@@ -396,6 +397,7 @@ class RoundedRectangleShape(DrawableShape):
         self.has_been_resized = True
         self.should_trigger_full_rebuild = True
         self.full_rebuild_countdown = self.time_until_full_rebuild_after_changing_size
+        self._wake_up_owner()
 
         return True
 
@@ -426,110 +428,30 @@ class RoundedRectangleShape(DrawableShape):
                 "filled_bar" not in self.theming
                 and "filled_bar_width_percentage" not in self.theming
             ):
-                shape_id = self.shape_cache.build_cache_id(
-                    "rounded_rectangle",
-                    self.containing_rect.size,
-                    self.shadow_width,
-                    self.border_widths,
-                    border_col,
-                    bg_col,
-                    self.shape_corner_radius,
+                shape_id = self._get_shape_cache_key(
+                    state_str, "rounded_rectangle", self.shape_corner_radius
                 )
 
-                found_shape = self.shape_cache.find_surface_in_cache(shape_id)
+                found_shape = self.shape_cache.find_shared_surface_in_cache(shape_id)
             if found_shape is not None:
-                self.states[state_str].surface = found_shape.copy()
+                self.states[state_str].set_shared_surface(found_shape)
             else:
                 if self.base_surface is not None:
                     self.states[state_str].surface = self.base_surface.copy()
 
-                # Try one AA call method
-                aa_amount = 4
-                self.border_rect = pygame.Rect(
-                    (self.shadow_width * aa_amount, self.shadow_width * aa_amount),
-                    (
-                        self.click_area_shape.width * aa_amount,
-                        self.click_area_shape.height * aa_amount,
-                    ),
-                )
-
-                self.background_rect = pygame.Rect(
-                    (
-                        (self.border_widths["left"] + self.shadow_width) * aa_amount,
-                        (self.border_widths["top"] + self.shadow_width) * aa_amount,
-                    ),
-                    (
-                        self.border_rect.width
-                        - (
-                            (self.border_widths["left"] + self.border_widths["right"])
-                            * aa_amount
-                        ),
-                        self.border_rect.height
-                        - (
-                            (self.border_widths["top"] + self.border_widths["bottom"])
-                            * aa_amount
-                        ),
-                    ),
-                )
-
-                dimension_scale = min(
-                    self.background_rect.width / max(self.border_rect.width, 1),
-                    self.background_rect.height / max(self.border_rect.height, 1),
-                )
-                bg_corner_radii = [0, 0, 0, 0]
-                for i, corner_radius in enumerate(self.shape_corner_radius):
-                    bg_corner_radii[i] = int(corner_radius * dimension_scale)
-
-                bab_surface = pygame.surface.Surface(
-                    (
-                        self.containing_rect.width * aa_amount,
-                        self.containing_rect.height * aa_amount,
-                    ),
-                    flags=pygame.SRCALPHA,
-                    depth=32,
-                )
-                bab_surface.fill(pygame.Color("#00000000"))
-                if self.border_widths["left"] > 0:
-                    shape_surface = self.clear_and_create_shape_surface(
-                        bab_surface,
-                        self.border_rect,
-                        border_overlap,
-                        self.shape_corner_radius,
-                        aa_amount=aa_amount,
-                        clear=False,
-                    )
-                    if isinstance(border_col, ColourGradient):
-                        border_col.apply_gradient_to_surface(shape_surface)
-                    else:
-                        apply_colour_to_surface(border_col, shape_surface)
-
-                    basic_blit(bab_surface, shape_surface, self.border_rect)
-
-                shape_surface = self.clear_and_create_shape_surface(
-                    bab_surface,
-                    self.background_rect,
-                    border_overlap,
-                    bg_corner_radii,
-                    aa_amount=aa_amount,
-                )
-
+                bab_surface = None
                 if (
-                    "filled_bar" in self.theming
-                    and "filled_bar_width_percentage" in self.theming
+                    shape_id is not None
+                    and not isinstance(bg_col, ColourGradient)
+                    and not isinstance(border_col, ColourGradient)
                 ):
-                    self._redraw_filled_bar(bg_col, shape_surface)
-                else:
-                    if isinstance(bg_col, ColourGradient):
-                        bg_col.apply_gradient_to_surface(shape_surface)
-                    else:
-                        apply_colour_to_surface(bg_col, shape_surface)
-
-                basic_blit(bab_surface, shape_surface, self.background_rect)
-
-                # apply AA to background
-                bab_surface = pygame.transform.smoothscale(
-                    bab_surface, self.containing_rect.size
-                )
+                    bab_surface = self._draw_nine_sliced_shape(
+                        bg_col, border_col, border_overlap
+                    )
+                if bab_surface is None:
+                    bab_surface = self._draw_supersampled_shape(
+                        bg_col, border_col, border_overlap
+                    )
 
                 basic_blit(self.states[state_str].surface, bab_surface, (0, 0))
 
@@ -549,7 +471,7 @@ class RoundedRectangleShape(DrawableShape):
                     )
                 ):
                     self.shape_cache.add_surface_to_cache(
-                        self.states[state_str].surface.copy(), shape_id
+                        self.states[state_str].surface, shape_id
                     )
                     self.states[state_str].cached_background_id = shape_id
 
@@ -562,8 +484,303 @@ class RoundedRectangleShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self._wake_up_owner()
         self.states[state_str].generated = True
 
+    def _draw_supersampled_shape(
+        self,
+        bg_col: Union[pygame.Color, ColourGradient],
+        border_col: Union[pygame.Color, ColourGradient],
+        border_overlap: int,
+    ) -> pygame.Surface:
+        """
+        Draw the border and background of the whole shape at four times the size, then scale
+        it down to smooth the edges. Works for any colours, gradients and filled bars, but is
+        slow for large shapes.
+
+        :param bg_col: The colour or gradient of the background.
+        :param border_col: The colour or gradient of the border.
+        :param border_overlap: The amount of overlap between the border and the background.
+
+        :return: The shape surface, the size of the containing rect.
+        """
+        # Try one AA call method
+        aa_amount = 4
+        self.border_rect = pygame.Rect(
+            (self.shadow_width * aa_amount, self.shadow_width * aa_amount),
+            (
+                self.click_area_shape.width * aa_amount,
+                self.click_area_shape.height * aa_amount,
+            ),
+        )
+
+        self.background_rect = pygame.Rect(
+            (
+                (self.border_widths["left"] + self.shadow_width) * aa_amount,
+                (self.border_widths["top"] + self.shadow_width) * aa_amount,
+            ),
+            (
+                self.border_rect.width
+                - (
+                    (self.border_widths["left"] + self.border_widths["right"])
+                    * aa_amount
+                ),
+                self.border_rect.height
+                - (
+                    (self.border_widths["top"] + self.border_widths["bottom"])
+                    * aa_amount
+                ),
+            ),
+        )
+
+        dimension_scale = min(
+            self.background_rect.width / max(self.border_rect.width, 1),
+            self.background_rect.height / max(self.border_rect.height, 1),
+        )
+        bg_corner_radii = [0, 0, 0, 0]
+        for i, corner_radius in enumerate(self.shape_corner_radius):
+            bg_corner_radii[i] = int(corner_radius * dimension_scale)
+
+        bab_surface = pygame.surface.Surface(
+            (
+                self.containing_rect.width * aa_amount,
+                self.containing_rect.height * aa_amount,
+            ),
+            flags=pygame.SRCALPHA,
+            depth=32,
+        )
+        bab_surface.fill(pygame.Color("#00000000"))
+        if self.border_widths["left"] > 0:
+            shape_surface = self.clear_and_create_shape_surface(
+                bab_surface,
+                self.border_rect,
+                border_overlap,
+                self.shape_corner_radius,
+                aa_amount=aa_amount,
+                clear=False,
+            )
+            if isinstance(border_col, ColourGradient):
+                border_col.apply_gradient_to_surface(shape_surface)
+            else:
+                apply_colour_to_surface(border_col, shape_surface)
+
+            basic_blit(bab_surface, shape_surface, self.border_rect)
+
+        shape_surface = self.clear_and_create_shape_surface(
+            bab_surface,
+            self.background_rect,
+            border_overlap,
+            bg_corner_radii,
+            aa_amount=aa_amount,
+        )
+
+        if (
+            "filled_bar" in self.theming
+            and "filled_bar_width_percentage" in self.theming
+        ):
+            self._redraw_filled_bar(bg_col, shape_surface)
+        else:
+            if isinstance(bg_col, ColourGradient):
+                bg_col.apply_gradient_to_surface(shape_surface)
+            else:
+                apply_colour_to_surface(bg_col, shape_surface)
+
+        basic_blit(bab_surface, shape_surface, self.background_rect)
+
+        # apply AA to background
+        return pygame.transform.smoothscale(bab_surface, self.containing_rect.size)
+
+    def _draw_nine_sliced_shape(
+        self,
+        bg_col: pygame.Color,
+        border_col: pygame.Color,
+        border_overlap: int,
+    ) -> Optional[pygame.Surface]:
+        """
+        Draw the border and background of the shape from nine slices of a small template shape:
+        the four corners are copied as they are, the four edges are stretched and the middle is
+        filled with the background colour. The template is drawn once per combination of
+        corners, borders and colours and kept in the shape cache, so a shape of any size only
+        costs a few blits.
+
+        :param bg_col: The colour of the background.
+        :param border_col: The colour of the border.
+        :param border_overlap: The amount of overlap between the border and the background.
+
+        :return: The shape surface, the size of the containing rect, or None if the shape is too
+                 small to slice.
+        """
+        border_width = self.border_widths["left"]
+        width, height = self.click_area_shape.size
+        dimension_scale = min(
+            (width - (border_width * 2)) / max(width, 1),
+            (height - (border_width * 2)) / max(height, 1),
+        )
+        bg_corner_radii = [
+            int(corner_radius * dimension_scale)
+            for corner_radius in self.shape_corner_radius
+        ]
+        # how far in from the edge the corners reach, with a little room to spare for the
+        # smoothing and the overlap between border and background
+        slice_size = (
+            max(
+                max(corner_radius, border_width + border_overlap + bg_corner_radius)
+                for corner_radius, bg_corner_radius in zip(
+                    self.shape_corner_radius, bg_corner_radii
+                )
+            )
+            + 2
+        )
+        template_size = (slice_size * 2) + 1
+        if width < template_size or height < template_size:
+            return None
+
+        template_id = self.shape_cache.build_cache_key(
+            f"rounded_rectangle_slices_{border_overlap}",
+            (template_size, template_size),
+            0,
+            self.border_widths,
+            border_col,
+            bg_col,
+            list(self.shape_corner_radius) + bg_corner_radii,
+        )
+        template = self.shape_cache.find_surface_in_cache(template_id)
+        if template is None:
+            template = self._draw_nine_slice_template(
+                template_size, bg_col, border_col, border_overlap, bg_corner_radii
+            )
+            self.shape_cache.add_surface_to_cache(template, template_id)
+        # the template is only needed while we draw
+        self.shape_cache.remove_user_from_cache_item(template_id)
+
+        shape_surface = pygame.Surface(
+            self.containing_rect.size, flags=pygame.SRCALPHA, depth=32
+        )
+        shape_surface.fill(pygame.Color("#00000000"))
+        left = top = self.shadow_width
+        right = left + width - slice_size
+        bottom = top + height - slice_size
+        middle_width = width - (slice_size * 2)
+        middle_height = height - (slice_size * 2)
+        far_side = slice_size + 1
+
+        # premultiplied blending onto a clear surface copies the pixels exactly
+        for position, area in (
+            ((left, top), pygame.Rect(0, 0, slice_size, slice_size)),
+            ((right, top), pygame.Rect(far_side, 0, slice_size, slice_size)),
+            ((left, bottom), pygame.Rect(0, far_side, slice_size, slice_size)),
+            ((right, bottom), pygame.Rect(far_side, far_side, slice_size, slice_size)),
+        ):
+            shape_surface.blit(
+                template, position, area, special_flags=pygame.BLEND_PREMULTIPLIED
+            )
+        for position, area, size in (
+            (
+                (left + slice_size, top),
+                pygame.Rect(slice_size, 0, 1, slice_size),
+                (middle_width, slice_size),
+            ),
+            (
+                (left + slice_size, bottom),
+                pygame.Rect(slice_size, far_side, 1, slice_size),
+                (middle_width, slice_size),
+            ),
+            (
+                (left, top + slice_size),
+                pygame.Rect(0, slice_size, slice_size, 1),
+                (slice_size, middle_height),
+            ),
+            (
+                (right, top + slice_size),
+                pygame.Rect(far_side, slice_size, slice_size, 1),
+                (slice_size, middle_height),
+            ),
+        ):
+            shape_surface.blit(
+                pygame.transform.scale(template.subsurface(area), size),
+                position,
+                special_flags=pygame.BLEND_PREMULTIPLIED,
+            )
+        shape_surface.fill(
+            template.get_at((slice_size, slice_size)),
+            pygame.Rect(
+                (left + slice_size, top + slice_size), (middle_width, middle_height)
+            ),
+        )
+        return shape_surface
+
+    def _draw_nine_slice_template(
+        self,
+        template_size: int,
+        bg_col: pygame.Color,
+        border_col: pygame.Color,
+        border_overlap: int,
+        bg_corner_radii: List[int],
+    ) -> pygame.Surface:
+        """
+        Draw a small square version of the shape, without its shadow, for slicing up.
+
+        :param template_size: The width and height of the template.
+        :param bg_col: The colour of the background.
+        :param border_col: The colour of the border.
+        :param border_overlap: The amount of overlap between the border and the background.
+        :param bg_corner_radii: The radii of the background's corners.
+
+        :return: The template surface.
+        """
+        aa_amount = 4
+        border_width = self.border_widths["left"]
+        large_size = template_size * aa_amount
+        large_surface = pygame.Surface(
+            (large_size, large_size), flags=pygame.SRCALPHA, depth=32
+        )
+        large_surface.fill(pygame.Color("#00000000"))
+        if border_width > 0:
+            border_surface = large_surface.copy()
+            RoundedRectangleShape.draw_colourless_rounded_rectangle(
+                [radius * aa_amount for radius in self.shape_corner_radius],
+                border_surface,
+            )
+            apply_colour_to_surface(border_col, border_surface)
+            basic_blit(large_surface, border_surface, (0, 0))
+
+        large_bg_corner_radii = [radius * aa_amount for radius in bg_corner_radii]
+        background_rect = pygame.Rect(
+            (border_width * aa_amount, border_width * aa_amount),
+            (
+                large_size - (border_width * 2 * aa_amount),
+                large_size - (border_width * 2 * aa_amount),
+            ),
+        )
+        subtract_rect = background_rect.inflate(
+            -(border_overlap * 2 * aa_amount), -(border_overlap * 2 * aa_amount)
+        )
+        if subtract_rect.width > 0 and subtract_rect.height > 0:
+            subtract_surface = pygame.Surface(
+                subtract_rect.size, flags=pygame.SRCALPHA, depth=32
+            )
+            subtract_surface.fill(pygame.Color("#00000000"))
+            RoundedRectangleShape.draw_colourless_rounded_rectangle(
+                large_bg_corner_radii, subtract_surface, aa_amount // 2
+            )
+            large_surface.blit(
+                subtract_surface, subtract_rect, special_flags=pygame.BLEND_RGBA_SUB
+            )
+
+        background_surface = pygame.Surface(
+            background_rect.size, flags=pygame.SRCALPHA, depth=32
+        )
+        background_surface.fill(pygame.Color("#00000000"))
+        RoundedRectangleShape.draw_colourless_rounded_rectangle(
+            large_bg_corner_radii, background_surface
+        )
+        apply_colour_to_surface(bg_col, background_surface)
+        basic_blit(large_surface, background_surface, background_rect)
+
+        return pygame.transform.smoothscale(
+            large_surface, (template_size, template_size)
+        )
+
     def _redraw_filled_bar(
         self,
         bg_col: Union[pygame.Color, ColourGradient],
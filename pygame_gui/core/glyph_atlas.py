@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from pygame_gui.core.rect_packer import MaxRectsPacker
+
+
+class GlyphAtlas:
+    """
+    The glyphs of one font in one colour, each rasterised once and packed into a single
+    surface so that strings can be drawn from it with one blits() call rather than being
+    rasterised again every time any of their characters change.
+
+    Glyphs are placed only by their advances, so this is only right for simple, left to right
+    text where the font does no kerning or shaping of the string. It is up to the font to
+    check that before using the atlas. Glyphs that don't fit within the font's line height
+    are never put on the atlas, as a string containing them would be laid out differently.
+
+    :param font: The pygame font to rasterise glyphs with.
+    :param antialiased: Whether to antialias the glyphs.
+    :param colour: The colour of the glyphs.
+    :param size: The size of the atlas surface.
+    """
+
+    def __init__(
+        self,
+        font: pygame.font.Font,
+        antialiased: bool,
+        colour: pygame.Color,
+        size: Tuple[int, int] = (512, 512),
+    ):
+        self.font = font
+        self.antialiased = antialiased
+        self.colour = pygame.Color(colour)
+
+        self.atlas_surface = pygame.Surface(size, flags=pygame.SRCALPHA, depth=32)
+        self.atlas_surface.fill(pygame.Color(0, 0, 0, 0))
+        self.packer = MaxRectsPacker(size)
+        # glyph area on the atlas, x offset from the pen position and advance, by character.
+        # None for characters that won't fit or can't be rasterised on their own.
+        self.glyphs: Dict[str, Optional[Tuple[pygame.Rect, int, int]]] = {}
+
+    def get_glyph(self, character: str) -> Optional[Tuple[pygame.Rect, int, int]]:
+        """
+        Get a glyph's area on the atlas surface, its x offset from the pen position and its
+        advance, rasterising it onto the atlas the first time it is asked for.
+
+        :param character: The character to get the glyph for.
+
+        :return: The glyph's area, offset and advance, or None if it can't be put on the atlas.
+        """
+        if character in self.glyphs:
+            return self.glyphs[character]
+        glyph = None
+        try:
+            metrics = self.font.metrics(character)
+            glyph_surface = self.font.render(character, self.antialiased, self.colour)
+        except pygame.error:
+            metrics = None
+        if (
+            metrics
+            and metrics[0] is not None
+            and glyph_surface.get_height() == self.font.get_height()
+        ):
+            glyph_area = self.packer.insert(glyph_surface.get_size())
+            if glyph_area is not None:
+                glyph_surface = glyph_surface.convert_alpha()
+                if glyph_surface.get_width() > 0 and glyph_surface.get_height() > 0:
+                    glyph_surface = glyph_surface.premul_alpha()
+                self.atlas_surface.blit(glyph_surface, glyph_area)
+                # glyphs reaching left of the pen are rendered shifted right to fit
+                glyph = (glyph_area, min(0, metrics[0][0]), metrics[0][4])
+        self.glyphs[character] = glyph
+        return glyph
+
+    def draw_text(
+        self, text: str, surface: pygame.Surface, position: Tuple[int, int]
+    ) -> bool:
+        """
+        Draw a string onto a surface from the atlas.
+
+        :param text: The text to draw.
+        :param surface: The surface to draw onto.
+        :param position: Where the top left of the first glyph goes on the surface.
+
+        :return: True if the text was drawn, False if any of its glyphs aren't on the atlas,
+                 in which case nothing is drawn.
+        """
+        blit_sequence: List[
+            Tuple[pygame.Surface, Tuple[int, int], pygame.Rect, int]
+        ] = []
+        pen_x, pen_y = position
+        for character in text:
+            glyph = self.get_glyph(character)
+            if glyph is None:
+                return False
+            glyph_area, x_offset, advance = glyph
+            blit_sequence.append(
+                (
+                    self.atlas_surface,
+                    (pen_x + x_offset, pen_y),
+                    glyph_area,
+                    pygame.BLEND_PREMULTIPLIED,
+                )
+            )
+            pen_x += advance
+        surface.blits(blit_sequence, doreturn=False)
+        return True
@@ -1,4 +1,4 @@
-from typing import Union, IO, Optional, Dict, Tuple, Any
+from typing import Union, IO, Optional, Dict, Tuple, Any, Iterable
 from os import PathLike
 
 import pygame
@@ -6,6 +6,7 @@ from pygame import Color, Surface, Rect
 from pygame.freetype import Font
 
 from pygame_gui.core.interfaces.gui_font_interface import IGUIFontInterface
+from pygame_gui.core.text_measurement_cache import TextMeasurementCache
 
 AnyPath = Union[str, bytes, PathLike]
 FileArg = Union[AnyPath, IO]
@@ -42,6 +43,8 @@ class GUIFontFreetype(IGUIFontInterface):
 
         self.point_size = size
 
+        self.measurement_cache = TextMeasurementCache()
+
         if style is not None:
             self.__internal_font.antialiased = style["antialiased"]
 
@@ -72,12 +75,36 @@ class GUIFontFreetype(IGUIFontInterface):
         return int(self.point_size)
 
     def get_rect(self, text: str) -> Rect:
-        supposed_rect = self.__internal_font.get_rect(text)
-        text_surface, _ = self.__internal_font.render(text, pygame.Color("white"))
-        return pygame.Rect(supposed_rect.topleft, text_surface.get_size())
+        # underlining can change the rendered size
+        cache_key = (
+            "rect",
+            text,
+            self.__internal_font.underline,
+            self.__internal_font.underline_adjustment,
+        )
+        rect = self.measurement_cache.find_measurement(cache_key)
+        if rect is None:
+            supposed_rect = self.__internal_font.get_rect(text)
+            text_surface, _ = self.__internal_font.render(text, pygame.Color("white"))
+            rect = pygame.Rect(supposed_rect.topleft, text_surface.get_size())
+            self.measurement_cache.add_measurement(cache_key, rect)
+        return rect.copy()
 
     def get_metrics(self, text: str):
-        return self.__internal_font.get_metrics(text)
+        cache_key = ("metrics", text)
+        metrics = self.measurement_cache.find_measurement(cache_key)
+        if metrics is None:
+            metrics = self.__internal_font.get_metrics(text)
+            self.measurement_cache.add_measurement(cache_key, metrics)
+        return list(metrics)
+
+    def prewarm_measurements(self, texts: Iterable[str]):
+        for text in texts:
+            self.get_rect(text)
+            self.get_metrics(text)
+
+    def get_measurement_stats(self) -> Dict[str, Union[int, float]]:
+        return self.measurement_cache.get_stats()
 
     def render_premul(self, text: str, text_color: Color) -> Surface:
         text_surface, _ = self.__internal_font.render(text, text_color)
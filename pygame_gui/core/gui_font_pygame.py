@@ -1,4 +1,6 @@
-from typing import Union, IO, Optional, Dict, Tuple, Any
+import unicodedata
+
+from typing import Union, IO, Optional, Dict, Tuple, Any, Iterable
 from os import PathLike
 
 import pygame
@@ -6,11 +8,16 @@ from pygame.font import Font
 from pygame import Color, Surface, Rect
 
 from pygame_gui.core.interfaces.gui_font_interface import IGUIFontInterface
+from pygame_gui.core.text_measurement_cache import TextMeasurementCache
+from pygame_gui.core.glyph_atlas import GlyphAtlas
 
 
 AnyPath = Union[str, bytes, PathLike]
 FileArg = Union[AnyPath, IO]
 
+# scripts from Hebrew onwards may be right to left or need shaping
+FIRST_COMPLEX_SCRIPT_CODE_POINT = 0x0590
+
 
 class GUIFontPygame(IGUIFontInterface):
     """
@@ -24,14 +31,21 @@ class GUIFontPygame(IGUIFontInterface):
     :param size: the font point size
     :param force_style: whether we force the styling when the available font does not support it.
     :param style: a style dictionary to set styling parameters like bold and italic
+    :param use_glyph_atlas: whether to draw simple text from atlases of glyphs rasterised once,
+                            rather than rasterising the whole string each time. Text the atlas
+                            can't draw exactly the same, such as right to left, complex script,
+                            kerned or ligature text, is still rasterised whole.
     """
 
+    max_glyph_atlases = 8
+
     def __init__(
         self,
         file: Optional[FileArg],
         size: Union[int, float],
         force_style: bool = False,
         style: Optional[Dict[str, Any]] = None,
+        use_glyph_atlas: bool = False,
     ):
         self.point_size = int(size)
         self.__internal_font: Font = Font(
@@ -47,6 +61,16 @@ class GUIFontPygame(IGUIFontInterface):
         self.antialiased = True
         self.direction = pygame.DIRECTION_LTR
 
+        self.measurement_cache = TextMeasurementCache()
+
+        self.use_glyph_atlas = use_glyph_atlas
+        # one atlas per text colour, least recently used first
+        self._glyph_atlases: Dict[Tuple[int, int, int, int], GlyphAtlas] = {}
+        # what we know about drawing characters and pairs of them from glyph atlases
+        self._atlas_glyph_advances: Dict[str, Optional[int]] = {}
+        self._atlas_safe_pairs: Dict[str, bool] = {}
+        self._renders_at_line_height: Optional[bool] = None
+
         if style is not None:
             self.antialiased = style["antialiased"]
             self.italic = style["italic"]
@@ -87,27 +111,212 @@ class GUIFontPygame(IGUIFontInterface):
         return self.point_size
 
     def get_rect(self, text: str) -> Rect:
-        # only way to get accurate font layout data with kerning is to render it ourselves it seems
-        if text != "":
-            text_surface = self.__internal_font.render(
-                text, self.antialiased, pygame.Color("white")
-            )
-            ascent = self.__internal_font.get_ascent()
-            return pygame.Rect((0, ascent), text_surface.get_size())
-        else:
-            return pygame.Rect(0, 0, 0, 0)
+        # underlining can change the rendered size
+        cache_key = ("rect", text, self.__internal_font.underline)
+        rect = self.measurement_cache.find_measurement(cache_key)
+        if rect is None:
+            # only way to get accurate font layout data with kerning is to render it ourselves
+            # it seems, unless the text is simple enough to draw from a glyph atlas
+            if self._can_draw_from_glyph_atlas(text):
+                rect = pygame.Rect(
+                    (0, self.__internal_font.get_ascent()),
+                    (
+                        self.__internal_font.size(text)[0],
+                        self.__internal_font.get_height(),
+                    ),
+                )
+            elif text != "":
+                text_surface = self.__internal_font.render(
+                    text, self.antialiased, pygame.Color("white")
+                )
+                ascent = self.__internal_font.get_ascent()
+                rect = pygame.Rect((0, ascent), text_surface.get_size())
+            else:
+                rect = pygame.Rect(0, 0, 0, 0)
+            self.measurement_cache.add_measurement(cache_key, rect)
+        return rect.copy()
 
     def get_metrics(self, text: str):
         # this may need to be broken down further in the wrapper
-        return self.__internal_font.metrics(text)
+        cache_key = ("metrics", text)
+        metrics = self.measurement_cache.find_measurement(cache_key)
+        if metrics is None:
+            metrics = self.__internal_font.metrics(text)
+            self.measurement_cache.add_measurement(cache_key, metrics)
+        return list(metrics)
 
-    def render_premul(self, text: str, text_color: Color) -> Surface:
-        text_surface = self.__internal_font.render(text, self.antialiased, text_color)
+    def prewarm_measurements(self, texts: Iterable[str]):
+        for text in texts:
+            self.get_rect(text)
+            self.get_metrics(text)
+
+    def get_measurement_stats(self) -> Dict[str, Union[int, float]]:
+        return self.measurement_cache.get_stats()
+
+    def _can_draw_from_glyph_atlas(self, text: str) -> bool:
+        """
+        Check if a string can be drawn from a glyph atlas exactly as it would be rendered
+        whole: left to right with no complex scripts, no glyphs reaching outside their
+        advance or the font's line height, and no pair of neighbouring characters that the
+        font kerns, joins into a ligature, swaps for a contextual alternate or antialiases
+        differently where their glyphs meet.
+
+        :param text: The text to check.
+        """
+        if (
+            not self.use_glyph_atlas
+            or text == ""
+            or self.direction != pygame.DIRECTION_LTR
+            or self.__internal_font.underline
+            or self.__internal_font.strikethrough
+        ):
+            return False
+        if self._renders_at_line_height is None:
+            # some fonts render text taller than their line height
+            test_render = self.__internal_font.render(
+                "A", self.antialiased, pygame.Color("white")
+            )
+            self._renders_at_line_height = (
+                test_render.get_height() == self.__internal_font.get_height()
+            )
+        if not self._renders_at_line_height:
+            return False
+        previous_character = ""
+        for character in text:
+            if self._get_atlas_glyph_advance(character) is None:
+                return False
+            if previous_character and not self._is_atlas_safe_pair(
+                previous_character + character
+            ):
+                return False
+            previous_character = character
+        return True
+
+    def _get_atlas_glyph_advance(self, character: str) -> Optional[int]:
+        """
+        Get the advance of a character's glyph, if it is simple enough to draw from a glyph
+        atlas.
+
+        :param character: The character to check.
+
+        :return: The advance, or None if the character can't be drawn from a glyph atlas.
+        """
+        if character in self._atlas_glyph_advances:
+            return self._atlas_glyph_advances[character]
+        advance = None
+        if ord(character) < FIRST_COMPLEX_SCRIPT_CODE_POINT and not (
+            unicodedata.combining(character)
+        ):
+            glyph_metrics = self.__internal_font.metrics(character)[0]
+            if glyph_metrics is not None:
+                min_x, max_x, min_y, max_y, glyph_advance = glyph_metrics
+                # glyphs reaching left of the pen would shift the text when first in a string,
+                # and glyphs reaching past their advance may overlap any of the glyphs after them
+                if (
+                    min_x >= 0
+                    and max_x <= glyph_advance
+                    and max_y <= self.__internal_font.get_ascent()
+                    and min_y >= self.__internal_font.get_descent()
+                ):
+                    advance = glyph_advance
+        self._atlas_glyph_advances[character] = advance
+        return advance
+
+    def _is_atlas_safe_pair(self, pair: str) -> bool:
+        """
+        Check if a pair of characters rendered whole comes out pixel for pixel the same as
+        their two glyphs drawn side by side from a glyph atlas. Comparing the pixels catches
+        kerning, ligatures and contextual alternates, even those that keep the pair's width,
+        as well as glyphs that antialias differently where their boxes meet.
+
+        :param pair: The two characters.
+        """
+        is_safe = self._atlas_safe_pairs.get(pair)
+        if is_safe is None:
+            colour = pygame.Color("white")
+            pair_render = self._rasterise_premul(pair, colour)
+            atlas_render = pygame.Surface(
+                pair_render.get_size(), depth=32, flags=pygame.SRCALPHA
+            )
+            atlas_render.fill((0, 0, 0, 0))
+            atlas_render.blits(
+                [
+                    (
+                        self._rasterise_premul(pair[0], colour),
+                        (0, 0),
+                        None,
+                        pygame.BLEND_PREMULTIPLIED,
+                    ),
+                    (
+                        self._rasterise_premul(pair[1], colour),
+                        (self._get_atlas_glyph_advance(pair[0]), 0),
+                        None,
+                        pygame.BLEND_PREMULTIPLIED,
+                    ),
+                ],
+                doreturn=False,
+            )
+            is_safe = pygame.image.tobytes(pair_render, "RGBA") == (
+                pygame.image.tobytes(atlas_render, "RGBA")
+            )
+            self._atlas_safe_pairs[pair] = is_safe
+        return is_safe
+
+    def _rasterise_premul(self, text: str, text_colour: Color) -> Surface:
+        """
+        Rasterise a whole string with the internal font and premultiply its alpha.
+
+        :param text: The text to rasterise.
+        :param text_colour: The colour to rasterise it in.
+
+        :return: The rasterised text.
+        """
+        text_surface = self.__internal_font.render(text, self.antialiased, text_colour)
         text_surface = text_surface.convert_alpha()
         if text_surface.get_width() > 0 and text_surface.get_height() > 0:
             text_surface = text_surface.premul_alpha()
         return text_surface
 
+    def _draw_from_glyph_atlas(
+        self,
+        text: str,
+        text_colour: Color,
+        surface: Surface,
+        position: Tuple[int, int],
+    ) -> bool:
+        """
+        Draw some text from the glyph atlas for its colour, if it can be drawn from one.
+
+        :param text: The text to draw.
+        :param text_colour: The colour to draw it in.
+        :param surface: The surface to draw onto.
+        :param position: Where the top left of the text goes on the surface.
+
+        :return: True if the text was drawn.
+        """
+        if not self._can_draw_from_glyph_atlas(text):
+            return False
+        atlas_key = tuple(pygame.Color(text_colour))
+        glyph_atlas = self._glyph_atlases.pop(atlas_key, None)
+        if glyph_atlas is None:
+            glyph_atlas = GlyphAtlas(
+                self.__internal_font, self.antialiased, pygame.Color(text_colour)
+            )
+            if len(self._glyph_atlases) >= self.max_glyph_atlases:
+                del self._glyph_atlases[next(iter(self._glyph_atlases))]
+        self._glyph_atlases[atlas_key] = glyph_atlas
+        return glyph_atlas.draw_text(text, surface, position)
+
+    def render_premul(self, text: str, text_color: Color) -> Surface:
+        if self.use_glyph_atlas:
+            text_surface = pygame.Surface(
+                self.get_rect(text).size, depth=32, flags=pygame.SRCALPHA
+            )
+            text_surface.fill((0, 0, 0, 0))
+            if self._draw_from_glyph_atlas(text, text_color, text_surface, (0, 0)):
+                return text_surface
+        return self._rasterise_premul(text, text_color)
+
     def render_premul_to(
         self,
         text: str,
@@ -117,10 +326,15 @@ class GUIFontPygame(IGUIFontInterface):
     ) -> Surface:
         text_surface = pygame.Surface(surf_size, depth=32, flags=pygame.SRCALPHA)
         text_surface.fill((0, 0, 0, 0))
-        temp_surf = self.__internal_font.render(text, self.antialiased, text_colour)
-        temp_surf = temp_surf.convert_alpha()
+        if self._draw_from_glyph_atlas(
+            text,
+            text_colour,
+            text_surface,
+            (surf_position[0], surf_position[1] - self.__internal_font.get_ascent()),
+        ):
+            return text_surface
+        temp_surf = self._rasterise_premul(text, text_colour)
         if temp_surf.get_width() > 0 and temp_surf.get_height() > 0:
-            temp_surf = temp_surf.premul_alpha()
             text_surface.blit(
                 temp_surf,
                 (
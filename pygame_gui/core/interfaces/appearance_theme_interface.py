@@ -258,6 +258,15 @@ class IUIAppearanceThemeInterface(metaclass=ABCMeta):
         :return:
         """
 
+    @abstractmethod
+    def get_theme_data_hash(self) -> str:
+        """
+        Get a hash of the theme data currently in this theme. Useful for telling if anything
+        drawn with the theme could have changed.
+
+        :return: The hash, as a hex string.
+        """
+
     @property
     @abstractmethod
     def shape_cache(self) -> SurfaceCache:
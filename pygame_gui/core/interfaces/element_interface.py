@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Union, List, Set, Dict, Optional
+from typing import Union, List, Set, Dict, Optional, FrozenSet
 
 import pygame
 
@@ -280,6 +280,17 @@ class IUIElementInterface(IGUISpriteInterface, metaclass=ABCMeta):
 
         """
 
+    @classmethod
+    @abstractmethod
+    def get_handled_event_types(cls) -> Optional[FrozenSet[int]]:
+        """
+        The pygame event types that this class of element does anything with in
+        process_event(). The UI manager only passes elements the event types they handle.
+
+        :return: A set of event types, or None if this element should be passed every event.
+
+        """
+
     @abstractmethod
     def focus(self):
         """
@@ -351,8 +362,8 @@ class IUIElementInterface(IGUISpriteInterface, metaclass=ABCMeta):
     @abstractmethod
     def _set_image(self, new_image: Union[pygame.surface.Surface, None]):
         """
-        Wraps setting the image variable of this element so that we also set the current image
-        clip on the image at the same time.
+        Wraps setting the image variable of this element. The image is copied, so the element
+        is free to draw on it.
 
         :param new_image: The new image to set.
 
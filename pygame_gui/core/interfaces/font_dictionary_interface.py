@@ -166,6 +166,16 @@ class IUIFontDictionaryInterface(metaclass=ABCMeta):
 
         """
 
+    def set_glyph_atlas_rendering(self, enabled: bool):
+        """
+        Switch drawing simple text from atlases of glyphs, rasterised once each, on or off for
+        all fonts.
+
+        Does nothing by default, for font dictionaries that always render text whole.
+
+        :param enabled: True to draw text from glyph atlases where possible.
+        """
+
     @abstractmethod
     def ensure_debug_font_loaded(self):
         """
@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import Tuple
+from typing import Tuple, Iterable, Dict, Union
 from pygame import Surface, Color, Rect
 
 
@@ -57,6 +57,26 @@ class IGUIFontInterface(metaclass=ABCMeta):
         :return:
         """
 
+    def prewarm_measurements(self, texts: Iterable[str]):
+        """
+        Measure some strings ahead of time, so that later layout of them is quicker.
+
+        Does nothing by default, for fonts that don't keep a cache of measurements.
+
+        :param texts: The strings we expect to be measuring, e.g. common labels.
+        """
+
+    def get_measurement_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get statistics on how well this font's cache of text measurements is working.
+
+        Fonts that don't keep a cache of measurements report it as empty.
+
+        :return: A dictionary with the 'hits', 'misses', 'hit_rate', 'count' of stored
+                 measurements and 'max_measurements'.
+        """
+        return {"hits": 0, "misses": 0, "hit_rate": 0.0, "count": 0, "max_measurements": 0}
+
     @abstractmethod
     def get_point_size(self) -> int:
         """
@@ -99,6 +99,20 @@ class IGUISpriteInterface(metaclass=ABCMeta):
         :param time_delta: the time passed in seconds between calls to this function.
         """
 
+    @abstractmethod
+    def can_sleep(self) -> bool:
+        """
+        Checked after updating. Sprites that can sleep are not updated again until woken up.
+
+        :return: True if this sprite has nothing to do in update() for now.
+        """
+
+    @abstractmethod
+    def wake_up(self):
+        """
+        Make sure this sprite is updated by its groups, if it was sleeping.
+        """
+
     @property
     @abstractmethod
     def visible(self):
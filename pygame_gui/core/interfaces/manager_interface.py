@@ -12,6 +12,7 @@ from pygame_gui.core.interfaces.window_stack_interface import IUIWindowStackInte
 from pygame_gui.core.interfaces.tool_tip_interface import IUITooltipInterface
 from pygame_gui.core.object_id import ObjectID
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
+from pygame_gui.core.shape_redraw_scheduler import ShapeRedrawScheduler
 
 
 class IUIManagerInterface(metaclass=ABCMeta):
@@ -95,6 +96,41 @@ class IUIManagerInterface(metaclass=ABCMeta):
         :return: The UI's sprite group.
         """
 
+    @abstractmethod
+    def get_shape_redraw_scheduler(self) -> ShapeRedrawScheduler:
+        """
+        Gets the scheduler that shares out redrawing of drawable shape states across update loops.
+
+        :return: The UI's shape redraw scheduler.
+        """
+
+    @abstractmethod
+    def set_shape_redraw_time_budget(self, budget: Optional[float]):
+        """
+        Limit the time spent redrawing queued drawable shape states each update loop, across
+        the whole UI.
+
+        :param budget: A time budget in seconds, or None to let every shape redraw one queued state
+                       per update.
+        """
+
+    @abstractmethod
+    def save_shape_cache(self) -> bool:
+        """
+        Save the shape cache to the shape_cache_directory this manager was created with, so the
+        next run can skip drawing shapes it has seen before.
+
+        :return: True if the cache was saved, False if it failed or there is no directory set.
+        """
+
+    @abstractmethod
+    def get_cache_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Get statistics from the caches that save redrawing shapes and shadows.
+
+        :return: A dictionary with the 'shape_cache' and 'shadow_generator' statistics.
+        """
+
     @abstractmethod
     def get_window_stack(self) -> IUIWindowStackInterface:
         """
@@ -170,13 +206,35 @@ class IUIManagerInterface(metaclass=ABCMeta):
         """
 
     @abstractmethod
-    def draw_ui(self, window_surface: pygame.surface.Surface):
+    def draw_ui(
+        self,
+        window_surface: pygame.surface.Surface,
+        background: Optional[pygame.surface.Surface] = None,
+    ) -> List[pygame.Rect]:
         """
         Draws the UI.
 
         :param window_surface: The screen or window surface on which we are going to draw all of
          our UI Elements.
+        :param background: Only used in dirty rectangle mode, a surface to clear changed areas with.
+
+        :return: A list of the areas of the window surface that have changed.
+        """
+
+    @abstractmethod
+    def set_dirty_rect_mode(self, is_active: bool):
+        """
+        Switch dirty rectangle drawing on or off.
+
+        :param is_active: True to only redraw the areas of the UI that have changed each frame.
+        """
+
+    @abstractmethod
+    def repaint_rect(self, screen_rect: pygame.Rect):
+        """
+        In dirty rectangle mode, mark an area of the window surface to be redrawn next frame.
 
+        :param screen_rect: The area to redraw.
         """
 
     @abstractmethod
@@ -1,19 +1,28 @@
 from operator import truth
 from abc import abstractmethod
 from collections.abc import Iterable
-from typing import Union, Optional, Dict, List
+from typing import Union, Optional, Dict, List, Tuple
 
 
 import pygame
 from pygame.rect import Rect
 
+from pygame_gui.core.spatial_hash_grid import SpatialHashGrid
+
 
 class GUISprite:
     """
     A sprite class specifically designed for the GUI. Very similar to pygame's
-    DirtySprite but without the Dirty flag.
+    DirtySprite, the dirty flag is only consulted when the group is in dirty rectangle mode.
     """
 
+    # Sprites that can respond to the mouse outside their rect (e.g. resizable window edges)
+    # set this so groups always include them when looking for sprites near a point.
+    _always_hit_test = False
+    # Sprites that never respond to the mouse (e.g. batched decorations) set this to False so
+    # groups leave them out of the search for sprites near a point entirely.
+    _hit_testable = True
+
     def __init__(
         self,
         groups: Optional[Union[Iterable["LayeredGUIGroup"], "LayeredGUIGroup"]] = None,
@@ -25,6 +34,10 @@ class GUISprite:
         self._image = None
         self._rect = None
 
+        # set whenever the image, visibility or layer changes so a group in dirty rect mode
+        # knows to redraw us even if our rect hasn't moved.
+        self.dirty = 1
+
         self.blit_data = [self._image, self._rect, None, self._blendmode]
 
         # Default 0 unless initialized differently.
@@ -142,6 +155,22 @@ class GUISprite:
         """return the visible value of that sprite"""
         return self._visible
 
+    def can_sleep(self) -> bool:
+        """
+        Checked by groups after updating this sprite. Sprites that can sleep are not updated
+        again until wake_up() is called.
+
+        :return: True if this sprite has nothing to do in update() for now.
+        """
+        return False
+
+    def wake_up(self):
+        """
+        Make sure this sprite is updated by its groups, if it was sleeping.
+        """
+        for group in self.__g:
+            group.wake_sprite(self)
+
     @abstractmethod
     def update(self, time_delta: float):
         """
@@ -161,6 +190,7 @@ class GUISprite:
     @visible.setter
     def visible(self, value):
         self._set_visible(value)
+        self.dirty = 1
         for group in self.groups():
             group.should_update_visibility = True
 
@@ -196,6 +226,7 @@ class GUISprite:
 
     @image.setter
     def image(self, value):
+        self.dirty = 1
         if self._image is None:
             self._image = value
             self.blit_data[0] = self._image
@@ -219,7 +250,45 @@ class GUISprite:
     @rect.setter
     def rect(self, value):
         self._rect = value
-        self.blit_data[1] = self._rect
+        self._on_rect_changed()
+
+    def _on_rect_changed(self):
+        """
+        Call this after moving or resizing the rect in place, so the blit position and any
+        groups' spatial indexes stay in step with it.
+        """
+        self._update_blit_position()
+        for group in self.__g:
+            group.on_sprite_rect_changed(self)
+
+    def _set_blit_area(self, area: Optional[Rect]):
+        """
+        Restrict drawing to just a part of this sprite's image, without copying the image.
+        Used to clip sprites to their containers.
+
+        :param area: The portion of the image to draw, in image space, or None to draw it all.
+        """
+        self.blit_data[2] = area
+        self._update_blit_position()
+        self.dirty = 1
+
+    def _update_blit_position(self):
+        """
+        Keeps the blit destination in step with the rect. When only part of the image is drawn,
+        the destination has to be offset by the top left of that part. Call this after moving
+        the rect in place.
+        """
+        area = self.blit_data[2]
+        if area is None or self._rect is None:
+            self.blit_data[1] = self._rect
+        else:
+            blit_dest = self.blit_data[1]
+            if blit_dest is self._rect or blit_dest is None:
+                blit_dest = Rect(0, 0, 0, 0)
+                self.blit_data[1] = blit_dest
+            blit_dest.update(
+                self._rect.x + area.x, self._rect.y + area.y, area.width, area.height
+            )
 
     @property
     def blendmode(self):
@@ -235,13 +304,24 @@ class GUISprite:
     @blendmode.setter
     def blendmode(self, value):
         self._blendmode = value
+        self.dirty = 1
         self.blit_data[3] = self._blendmode
 
 
 class LayeredGUIGroup:
     """
-    A sprite group specifically for the GUI. Similar to pygame's LayeredDirty group but with the
-    dirty flag stuff removed for simplicity and speed.
+    A sprite group specifically for the GUI. Similar to pygame's LayeredDirty group but by default
+    with the dirty flag stuff switched off for simplicity and speed.
+
+    Dirty rectangle mode can be switched on with set_dirty_rect_mode(). In that mode draw() only
+    redraws the screen areas where a sprite has changed image, position, visibility or layer since
+    the last draw and returns those areas so they can be passed to pygame.display.update().
+
+    The group also keeps a spatial index of sprite rects so that get_sprites_near_point() can find
+    the few sprites under the mouse without testing every sprite.
+
+    Only awake sprites are updated. Sprites go to sleep when their can_sleep() method says they
+    are idle after an update, and are woken again with wake_up().
     """
 
     _spritegroup = True
@@ -255,11 +335,26 @@ class LayeredGUIGroup:
         self.lostsprites = []
         self._default_layer = 0
 
+        # sprites in each layer in draw order, plus cached views of the layers that are only
+        # rebuilt after sprites are added, removed or moved between layers.
+        self._layer_buckets: Dict[int, List[GUISprite]] = {}
+        self._sorted_layers: Optional[List[int]] = None
+        self._top_down_layers: Optional[List[Tuple[int, Tuple[GUISprite, ...]]]] = None
+
+        # a sprite's (layer, sequence) always sorts the same way as its place in _spritelist
+        self._sprite_sequence: Dict[GUISprite, int] = {}
+        self._next_sequence = 0
+        self._hit_grid = SpatialHashGrid()
+        self._awake_sprites = set()
+
         self.add(*sprites)
         self._clip = None
         self.visible = []
         self.should_update_visibility = True
 
+        self._use_dirty_rects = False
+        self._full_repaint_needed = True
+
     def add_internal(self, sprite: GUISprite, layer=None):
         """Do not use this method directly.
 
@@ -304,6 +399,15 @@ class LayeredGUIGroup:
         while mid < leng and sprites_layers[sprites[mid]] <= layer:
             mid += 1
         sprites.insert(mid, sprite)
+        self._add_to_layer_bucket(sprite, layer)
+
+        self._sprite_sequence[sprite] = self._next_sequence
+        self._next_sequence += 1
+        self._awake_sprites.add(sprite)
+        if sprite._always_hit_test:
+            self._hit_grid.add_unbounded(sprite)
+        elif sprite._hit_testable:
+            self._hit_grid.update(sprite, sprite.rect)
 
         self.should_update_visibility = True
 
@@ -314,15 +418,16 @@ class LayeredGUIGroup:
         :return:
         """
         self._spritelist.remove(sprite)
-        # these dirty rects are suboptimal for one frame
+        # only set to something other than the init rect when we are drawing dirty rects
         old_rect = self.spritedict[sprite]
         if old_rect is not self._init_rect:
             self.lostsprites.append(old_rect)  # dirty rect
-        if hasattr(sprite, "rect"):
-            self.lostsprites.append(sprite.rect)  # dirty rect
 
         del self.spritedict[sprite]
-        del self._spritelayers[sprite]
+        self._remove_from_layer_bucket(sprite, self._spritelayers.pop(sprite))
+        del self._sprite_sequence[sprite]
+        self._awake_sprites.discard(sprite)
+        self._hit_grid.remove(sprite)
         self.should_update_visibility = True
 
     def change_layer(self, sprite: GUISprite, new_layer: int):
@@ -336,7 +441,7 @@ class LayeredGUIGroup:
         sprites_layers = self._spritelayers  # speedup
 
         sprites.remove(sprite)
-        sprites_layers.pop(sprite)
+        self._remove_from_layer_bucket(sprite, sprites_layers.pop(sprite))
 
         # add the sprite at the right position
         # bisect algorithmus
@@ -358,26 +463,247 @@ class LayeredGUIGroup:
 
         # add layer info
         sprites_layers[sprite] = new_layer
+        self._add_to_layer_bucket(sprite, new_layer)
+        self._sprite_sequence[sprite] = self._next_sequence
+        self._next_sequence += 1
+        sprite.dirty = 1
         self.should_update_visibility = True
 
-    def draw(self, surface: pygame.Surface):
-        """draw all sprites in the right order onto the given surface"""
-        surface.blits(self.visible)
+    def _add_to_layer_bucket(self, sprite: GUISprite, layer: int):
+        """
+        Add a sprite to the top of its layer's bucket.
+
+        :param sprite: The sprite to add.
+        :param layer: The layer it is in.
+        """
+        if layer in self._layer_buckets:
+            self._layer_buckets[layer].append(sprite)
+        else:
+            self._layer_buckets[layer] = [sprite]
+            self._sorted_layers = None
+        self._top_down_layers = None
+
+    def _remove_from_layer_bucket(self, sprite: GUISprite, layer: int):
+        """
+        Remove a sprite from its layer's bucket, dropping the layer if it is now empty.
+
+        :param sprite: The sprite to remove.
+        :param layer: The layer it was in.
+        """
+        bucket = self._layer_buckets[layer]
+        bucket.remove(sprite)
+        if not bucket:
+            del self._layer_buckets[layer]
+            self._sorted_layers = None
+        self._top_down_layers = None
+
+    def on_sprite_rect_changed(self, sprite: GUISprite):
+        """
+        Called by sprites in this group when their rect has moved or changed size.
+
+        :param sprite: The sprite that has changed.
+        """
+        if sprite._hit_testable and not sprite._always_hit_test:
+            self._hit_grid.update(sprite, sprite.rect)
+
+    def get_sprites_near_point(
+        self, x: float, y: float, extra_sprites: Optional[Iterable[GUISprite]] = None
+    ) -> List[GUISprite]:
+        """
+        Find the sprites whose rects might contain a point, from the top of the draw order to the
+        bottom. This is a coarse test, callers should still do their own precise check.
+
+        :param x: The horizontal position of the point.
+        :param y: The vertical position of the point.
+        :param extra_sprites: Other sprites to include, in their proper order, if they are still
+                              in this group.
+
+        :return: A list of sprites, top-most first.
+        """
+        candidates = self._hit_grid.query_point(x, y)
+        if extra_sprites is not None:
+            candidates.update(
+                sprite for sprite in extra_sprites if sprite in self._sprite_sequence
+            )
+        sprite_layers = self._spritelayers
+        sprite_sequence = self._sprite_sequence
+        return sorted(
+            candidates,
+            key=lambda sprite: (sprite_layers[sprite], sprite_sequence[sprite]),
+            reverse=True,
+        )
+
+    def set_dirty_rect_mode(self, is_active: bool):
+        """
+        Switch dirty rectangle drawing on or off. The first draw after switching will always
+        redraw everything.
+
+        :param is_active: True to only redraw changed areas in draw(), False to redraw everything.
+        """
+        self._use_dirty_rects = is_active
+        self._full_repaint_needed = True
+        self.lostsprites = []
+        for sprite in self.spritedict:
+            self.spritedict[sprite] = self._init_rect
+
+    def get_dirty_rect_mode(self) -> bool:
+        """
+        Check if we are currently only drawing dirty rectangles.
+
+        :return: True if dirty rectangle mode is active.
+        """
+        return self._use_dirty_rects
+
+    def repaint_rect(self, screen_rect: Union[pygame.Rect, pygame.FRect]):
+        """
+        Mark an area of the screen as needing to be redrawn next time draw() is called in dirty
+        rectangle mode. Useful when something other than the GUI has drawn over it.
+
+        :param screen_rect: The area to redraw.
+        """
+        self.lostsprites.append(pygame.Rect(screen_rect))
+
+    def repaint_all(self):
+        """
+        Make the next call to draw() redraw every sprite, even in dirty rectangle mode.
+        """
+        self._full_repaint_needed = True
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        background: Optional[pygame.Surface] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Draw all sprites in the right order onto the given surface.
+
+        :param surface: The surface to draw on.
+        :param background: Only used in dirty rectangle mode. If supplied, the dirty areas are
+                           cleared with the matching area of this surface before sprites are
+                           redrawn on top.
+
+        :return: A list of the areas of the surface that have changed.
+        """
+        if self.should_update_visibility:
+            self.should_update_visibility = False
+            self.update_visibility()
+
+        if not self._use_dirty_rects:
+            surface.blits(self.visible)
+            return [surface.get_rect()]
+
+        dirty_rects = self._collect_dirty_rects(surface.get_rect())
+        if not dirty_rects:
+            return dirty_rects
+
+        if background is not None:
+            for dirty_rect in dirty_rects:
+                surface.blit(background, dirty_rect, dirty_rect)
+
+        clipped_blits = []
+        for image, rect, area, blend in self.visible:
+            for index in rect.collidelistall(dirty_rects):
+                clip_rect = rect.clip(dirty_rects[index])
+                clip_area = clip_rect.move(-rect.x, -rect.y)
+                if area is not None:
+                    clip_area.move_ip(area.x, area.y)
+                clipped_blits.append((image, clip_rect, clip_area, blend))
+        surface.blits(clipped_blits, doreturn=False)
+        return dirty_rects
+
+    def _collect_dirty_rects(self, surface_rect: pygame.Rect) -> List[pygame.Rect]:
+        """
+        Work out which areas of the surface need to be redrawn and merge any that overlap, so
+        we never blend a sprite on top of itself.
+
+        :param surface_rect: The rect of the surface we are drawing to.
+
+        :return: A list of non-overlapping rects, clipped to the surface.
+        """
+        init_rect = self._init_rect
+        if self._full_repaint_needed:
+            self._full_repaint_needed = False
+            self.lostsprites = []
+            for sprite in self._spritelist:
+                sprite.dirty = 0
+                if sprite.visible and sprite.image is not None:
+                    self.spritedict[sprite] = sprite.rect.copy()
+                else:
+                    self.spritedict[sprite] = init_rect
+            return [surface_rect.copy()]
+
+        changed_rects = self.lostsprites
+        self.lostsprites = []
+        for sprite in self._spritelist:
+            old_rect = self.spritedict[sprite]
+            if sprite.visible and sprite.image is not None:
+                if sprite.dirty or old_rect is init_rect or old_rect != sprite.rect:
+                    if old_rect is not init_rect:
+                        changed_rects.append(old_rect)
+                    new_rect = sprite.rect.copy()
+                    changed_rects.append(new_rect)
+                    self.spritedict[sprite] = new_rect
+            elif old_rect is not init_rect:
+                changed_rects.append(old_rect)
+                self.spritedict[sprite] = init_rect
+            sprite.dirty = 0
+
+        dirty_rects: List[pygame.Rect] = []
+        for changed_rect in changed_rects:
+            merged_rect = changed_rect.clip(surface_rect)
+            if merged_rect.width == 0 or merged_rect.height == 0:
+                continue
+            index = merged_rect.collidelist(dirty_rects)
+            while index != -1:
+                merged_rect.union_ip(dirty_rects.pop(index))
+                index = merged_rect.collidelist(dirty_rects)
+            dirty_rects.append(merged_rect)
+        return dirty_rects
 
     def update(self, *args, **kwargs) -> None:
         """
-        Update all the sprites in the groups.
+        Update all the awake sprites in the group, in draw order. Any that can sleep afterwards
+        are left out of future updates until they are woken up.
 
         :param args: the arguments to the sprite's update function.
 
         :param kwargs:
         """
-        for sprite in self.sprites():
-            sprite.update(*args, **kwargs)
+        awake_sprites = self._awake_sprites
+        if awake_sprites:
+            sprite_layers = self._spritelayers
+            sprite_sequence = self._sprite_sequence
+            for sprite in sorted(
+                awake_sprites,
+                key=lambda spr: (sprite_layers[spr], sprite_sequence[spr]),
+            ):
+                if sprite not in sprite_sequence:
+                    continue  # removed by an earlier sprite's update
+                sprite.update(*args, **kwargs)
+                if sprite.can_sleep():
+                    awake_sprites.discard(sprite)
         if self.should_update_visibility:
             self.should_update_visibility = False
             self.update_visibility()
 
+    def wake_sprite(self, sprite: GUISprite):
+        """
+        Make sure a sprite in this group is included in the next update.
+
+        :param sprite: The sprite to wake up.
+        """
+        if sprite in self._sprite_sequence:
+            self._awake_sprites.add(sprite)
+
+    def get_awake_sprite_count(self) -> int:
+        """
+        The number of sprites that will be updated next time update() is called. Useful for
+        checking that idle sprites are going to sleep.
+
+        :return: The number of awake sprites.
+        """
+        return len(self._awake_sprites)
+
     def update_visibility(self):
         """
         Update the list of what is currently visible.
@@ -396,7 +722,12 @@ class LayeredGUIGroup:
 
     def layers(self):
         """return a list of unique defined layers defined."""
-        return sorted(set(self._spritelayers.values()))
+        return self._get_sorted_layers().copy()
+
+    def _get_sorted_layers(self) -> List[int]:
+        if self._sorted_layers is None:
+            self._sorted_layers = sorted(self._layer_buckets)
+        return self._sorted_layers
 
     def get_sprites_from_layer(self, layer) -> List[GUISprite]:
         """return all sprites from a layer ordered as they were added
@@ -408,17 +739,23 @@ class LayeredGUIGroup:
         layer).
 
         """
-        sprites: List[GUISprite] = []
-        sprites_append = sprites.append
-        sprite_layers = self._spritelayers
-        for spr in self._spritelist:
-            if sprite_layers[spr] == layer:
-                sprites_append(spr)
-            elif sprite_layers[spr] > layer:
-                # break after because no other will
-                # follow with same layer
-                break
-        return sprites
+        return list(self._layer_buckets.get(layer, ()))
+
+    def get_layers_top_down(self) -> List[Tuple[int, Tuple[GUISprite, ...]]]:
+        """
+        The layers in this group from the top down, each with its sprites from the top down.
+        This is cached between changes to the group so it is cheap to call every event, but the
+        returned list must not be modified.
+
+        :return: A list of (layer, sprites) pairs.
+        """
+        if self._top_down_layers is None:
+            buckets = self._layer_buckets
+            self._top_down_layers = [
+                (layer, tuple(reversed(buckets[layer])))
+                for layer in reversed(self._get_sorted_layers())
+            ]
+        return self._top_down_layers
 
     def add(self, *sprites, **kwargs):
         """add a sprite or sequence of sprites to a group
@@ -476,4 +813,4 @@ class LayeredGUIGroup:
         return the top layer
 
         """
-        return self._spritelayers[self._spritelist[-1]]
+        return self._get_sorted_layers()[-1]
@@ -0,0 +1,207 @@
+from typing import List, Optional, Tuple
+
+import pygame
+
+
+class MaxRectsPacker:
+    """
+    Packs rectangles into a fixed size area, such as a texture atlas, using the MaxRects
+    algorithm with the best short side fit heuristic.
+
+    The free space is kept as a list of maximal, possibly overlapping, free rectangles. New
+    rectangles go in the free rectangle that leaves the smallest leftover along its shorter
+    side, which tends to keep the remaining free space in large useful pieces. Freed space is
+    merged back with any free rectangles it shares a whole edge with, and once everything has
+    been freed the packer starts again with one big empty rectangle.
+
+    :param size: The width and height of the area to pack into.
+    """
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = (int(size[0]), int(size[1]))
+        self.free_rects: List[pygame.Rect] = [pygame.Rect((0, 0), self.size)]
+        self.used_area = 0
+        self.used_count = 0
+
+    def insert(self, size: Tuple[int, int]) -> Optional[pygame.Rect]:
+        """
+        Reserve space for a rectangle.
+
+        :param size: The width and height of the rectangle to place.
+
+        :return: The reserved rectangle, or None if there is no free space big enough.
+        """
+        width, height = int(size[0]), int(size[1])
+        if width <= 0 or height <= 0:
+            return None
+
+        best_rect = None
+        best_short_side = best_long_side = 0
+        for free_rect in self.free_rects:
+            leftover_x = free_rect.width - width
+            leftover_y = free_rect.height - height
+            if leftover_x < 0 or leftover_y < 0:
+                continue
+            if leftover_x < leftover_y:
+                short_side, long_side = leftover_x, leftover_y
+            else:
+                short_side, long_side = leftover_y, leftover_x
+            if best_rect is None or (short_side, long_side) < (
+                best_short_side,
+                best_long_side,
+            ):
+                best_rect = free_rect
+                best_short_side = short_side
+                best_long_side = long_side
+                if short_side == 0 and long_side == 0:
+                    break
+
+        if best_rect is None:
+            return None
+
+        placed_rect = pygame.Rect(best_rect.topleft, (width, height))
+        self._split_free_rects(placed_rect)
+        self.used_area += width * height
+        self.used_count += 1
+        return placed_rect
+
+    def free(self, rect: pygame.Rect):
+        """
+        Give back space previously reserved with insert().
+
+        :param rect: The rectangle to free.
+        """
+        self.used_area -= rect.width * rect.height
+        self.used_count -= 1
+        if self.used_count <= 0:
+            self.clear()
+            return
+
+        merged_rect = pygame.Rect(rect)
+        merged = True
+        while merged:
+            merged = False
+            for free_rect in self.free_rects:
+                if self._shares_edge(free_rect, merged_rect):
+                    self.free_rects.remove(free_rect)
+                    merged_rect = merged_rect.union(free_rect)
+                    merged = True
+                    break
+
+        self.free_rects = [
+            free_rect
+            for free_rect in self.free_rects
+            if not merged_rect.contains(free_rect)
+        ]
+        if not any(free_rect.contains(merged_rect) for free_rect in self.free_rects):
+            self.free_rects.append(merged_rect)
+
+    def clear(self):
+        """
+        Free everything, leaving one free rectangle covering the whole area.
+        """
+        self.free_rects = [pygame.Rect((0, 0), self.size)]
+        self.used_area = 0
+        self.used_count = 0
+
+    def get_occupancy(self) -> float:
+        """
+        How much of the area is in use.
+
+        :return: The fraction of the area in use, from 0.0 to 1.0.
+        """
+        return self.used_area / (self.size[0] * self.size[1])
+
+    def get_fragmentation(self) -> float:
+        """
+        How broken up the free space is. Zero means the largest free rectangle holds all the free
+        space, values near one mean the free space is scattered in small pieces.
+
+        :return: The fragmentation, from 0.0 to 1.0.
+        """
+        free_area = (self.size[0] * self.size[1]) - self.used_area
+        if free_area <= 0:
+            return 0.0
+        largest_free_area = max(
+            (free_rect.width * free_rect.height for free_rect in self.free_rects),
+            default=0,
+        )
+        return max(0.0, 1.0 - (largest_free_area / free_area))
+
+    def _split_free_rects(self, placed_rect: pygame.Rect):
+        """
+        Cut a newly placed rectangle out of every free rectangle it overlaps, keeping the
+        maximal pieces left around it, then throw away any pieces that sit inside others.
+
+        :param placed_rect: The newly placed rectangle.
+        """
+        kept_rects = []
+        new_rects = []
+        for free_rect in self.free_rects:
+            if not free_rect.colliderect(placed_rect):
+                kept_rects.append(free_rect)
+                continue
+            if placed_rect.left > free_rect.left:
+                new_rects.append(
+                    pygame.Rect(
+                        free_rect.left,
+                        free_rect.top,
+                        placed_rect.left - free_rect.left,
+                        free_rect.height,
+                    )
+                )
+            if placed_rect.right < free_rect.right:
+                new_rects.append(
+                    pygame.Rect(
+                        placed_rect.right,
+                        free_rect.top,
+                        free_rect.right - placed_rect.right,
+                        free_rect.height,
+                    )
+                )
+            if placed_rect.top > free_rect.top:
+                new_rects.append(
+                    pygame.Rect(
+                        free_rect.left,
+                        free_rect.top,
+                        free_rect.width,
+                        placed_rect.top - free_rect.top,
+                    )
+                )
+            if placed_rect.bottom < free_rect.bottom:
+                new_rects.append(
+                    pygame.Rect(
+                        free_rect.left,
+                        placed_rect.bottom,
+                        free_rect.width,
+                        free_rect.bottom - placed_rect.bottom,
+                    )
+                )
+
+        # only the new pieces can be redundant, the untouched free rects were maximal already
+        pruned_new_rects = []
+        for index, new_rect in enumerate(new_rects):
+            if any(free_rect.contains(new_rect) for free_rect in kept_rects):
+                continue
+            if any(
+                other_rect.contains(new_rect)
+                and (other_rect != new_rect or other_index < index)
+                for other_index, other_rect in enumerate(new_rects)
+                if other_index != index
+            ):
+                continue
+            pruned_new_rects.append(new_rect)
+
+        self.free_rects = kept_rects + pruned_new_rects
+
+    @staticmethod
+    def _shares_edge(rect_a: pygame.Rect, rect_b: pygame.Rect) -> bool:
+        """
+        Check if two rectangles sit side by side along the whole of one edge, so that together
+        they make a single larger rectangle.
+        """
+        if rect_a.left == rect_b.left and rect_a.width == rect_b.width:
+            return rect_a.bottom == rect_b.top or rect_b.bottom == rect_a.top
+        if rect_a.top == rect_b.top and rect_a.height == rect_b.height:
+            return rect_a.right == rect_b.left or rect_b.right == rect_a.left
+        return False
@@ -0,0 +1,133 @@
+import heapq
+import time
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # noinspection PyUnresolvedReferences
+    from pygame_gui.core.drawable_shapes.drawable_shape import DrawableShape
+
+
+class ShapeRedrawScheduler:
+    """
+    Shares out the work of redrawing queued drawable shape states across the whole UI, so that
+    bulk rebuilds (theme reloads, window resizes) are spread over several frames within a fixed
+    time budget per frame, rather than every shape redrawing a state in the same frame.
+
+    Each shape's currently active state is redrawn before any of its other states. Shapes whose
+    elements are on screen are served before hidden or off-screen ones and, within those,
+    shapes with an active state to redraw come before shapes that only have states that are
+    not currently showing.
+
+    Scheduling is switched off until a time budget is set. While it is off each shape redraws one
+    queued state every time it is updated.
+    """
+
+    def __init__(self):
+        self._time_budget: Optional[float] = None
+        self._scheduled_shapes: Dict["DrawableShape", None] = {}
+
+    def set_update_time_budget(self, budget: Optional[float]):
+        """
+        Set the amount of time to spend redrawing shape states, per update loop.
+
+        Actual time spent may be somewhat over this budget as a slow redraw may start while we are
+        within the budget. At least one state is always redrawn each loop so the work completes.
+
+        :param budget: A time budget in seconds, or None to switch off scheduling and go back to
+                       shapes redrawing one of their own queued states every update.
+        """
+        self._time_budget = budget
+
+    def get_update_time_budget(self) -> Optional[float]:
+        """
+        Get the time budget per update loop.
+
+        :return: The budget in seconds, or None if scheduling is switched off.
+        """
+        return self._time_budget
+
+    def is_active(self) -> bool:
+        """
+        Check if shapes should leave their queued state redraws to this scheduler.
+
+        :return: True if a time budget is set.
+        """
+        return self._time_budget is not None
+
+    def schedule(self, shape: "DrawableShape"):
+        """
+        Let the scheduler know that a shape has states queued for redrawing.
+
+        :param shape: The shape with a non-empty states_to_redraw_queue.
+        """
+        self._scheduled_shapes[shape] = None
+
+    def unschedule(self, shape: "DrawableShape"):
+        """
+        Forget about a shape's queued states, for example because its element has been killed
+        or has replaced it with a new shape.
+
+        :param shape: The shape to forget about.
+        """
+        self._scheduled_shapes.pop(shape, None)
+
+    def clear(self):
+        """
+        Forget about every scheduled shape.
+        """
+        self._scheduled_shapes.clear()
+
+    def get_scheduled_shape_count(self) -> int:
+        """
+        The number of shapes still waiting for some states to be redrawn.
+
+        :return: The number of shapes.
+        """
+        return len(self._scheduled_shapes)
+
+    def update(self):
+        """
+        Redraw queued shape states, most important first, until the time budget is used up.
+        """
+        if not self._scheduled_shapes or self._time_budget is None:
+            return
+
+        start_time = time.perf_counter()
+        heap: List[Tuple[Tuple[bool, bool], int, "DrawableShape"]] = []
+        for order, shape in enumerate(self._scheduled_shapes):
+            heap.append((self._get_priority(shape), order, shape))
+        heapq.heapify(heap)
+
+        while heap:
+            _, order, shape = heapq.heappop(heap)
+            redraw_queue = shape.states_to_redraw_queue
+            if redraw_queue:
+                state_id = shape.active_state.state_id
+                if state_id in redraw_queue:
+                    redraw_queue.remove(state_id)
+                else:
+                    state_id = redraw_queue.popleft()
+                shape.redraw_state(state_id)
+
+            if redraw_queue:
+                heapq.heappush(heap, (self._get_priority(shape), order, shape))
+            else:
+                self._scheduled_shapes.pop(shape, None)
+
+            if time.perf_counter() - start_time >= self._time_budget:
+                break
+
+    @staticmethod
+    def _get_priority(shape: "DrawableShape") -> Tuple[bool, bool]:
+        """
+        Work out how soon a shape's next queued state should be redrawn, lowest first.
+
+        :param shape: The scheduled shape.
+
+        :return: Whether the shape is hidden, then whether its active state is already drawn.
+        """
+        return (
+            not shape.is_visible(),
+            shape.active_state.state_id not in shape.states_to_redraw_queue,
+        )
@@ -0,0 +1,145 @@
+from typing import Dict, Set, Tuple, Hashable, Iterable, Optional
+
+import pygame
+
+
+class SpatialHashGrid:
+    """
+    A uniform grid that buckets items by the screen area their rectangles cover, so we can
+    quickly find the handful of items that might be under a point without testing them all.
+
+    Items are added and moved incrementally. Rectangles that would cover a very large number
+    of cells are not bucketed at all, instead they are returned by every query - a cheaper
+    option than filling in thousands of cells for a giant scrolling area.
+
+    :param cell_size: The width and height of each grid cell in pixels.
+    :param max_cells_per_item: The number of cells an item can cover before it stops being
+                               bucketed and is instead returned by every query.
+    """
+
+    def __init__(self, cell_size: int = 128, max_cells_per_item: int = 256):
+        self.cell_size = cell_size
+        self.max_cells_per_item = max_cells_per_item
+
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._item_cell_bounds: Dict[Hashable, Tuple[int, int, int, int]] = {}
+        self._unbounded_items: Set[Hashable] = set()
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._item_cell_bounds or item in self._unbounded_items
+
+    def __len__(self) -> int:
+        return len(self._item_cell_bounds) + len(self._unbounded_items)
+
+    def add_unbounded(self, item: Hashable):
+        """
+        Add an item that should be returned by every query regardless of position.
+
+        :param item: The item to add.
+        """
+        self.remove(item)
+        self._unbounded_items.add(item)
+
+    def update(self, item: Hashable, rect: Optional[pygame.Rect | pygame.FRect]):
+        """
+        Add an item to the grid, or move it if it is already in there. Cheap to call when the
+        item hasn't actually changed cells.
+
+        :param item: The item to add or move.
+        :param rect: The item's current screen rectangle. Items with no rect, or an empty one,
+                     are removed from the grid until they get a proper one.
+        """
+        if item in self._unbounded_items and item not in self._item_cell_bounds:
+            # added with add_unbounded(), so its rect doesn't matter
+            return
+        if rect is None or rect.width <= 0 or rect.height <= 0:
+            self._remove_from_cells(item)
+            return
+
+        size = self.cell_size
+        cell_bounds = (
+            int(rect.left) // size,
+            int(rect.top) // size,
+            (int(rect.right) - 1) // size,
+            (int(rect.bottom) - 1) // size,
+        )
+        old_cell_bounds = self._item_cell_bounds.get(item)
+        if cell_bounds == old_cell_bounds:
+            return
+        if old_cell_bounds is not None:
+            self._remove_from_cells(item)
+
+        min_x, min_y, max_x, max_y = cell_bounds
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > self.max_cells_per_item:
+            # too big to be worth bucketing, treat it as if it is everywhere
+            self._item_cell_bounds[item] = cell_bounds
+            self._unbounded_items.add(item)
+            return
+
+        self._item_cell_bounds[item] = cell_bounds
+        cells = self._cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = (cell_x, cell_y)
+                if cell in cells:
+                    cells[cell].add(item)
+                else:
+                    cells[cell] = {item}
+
+    def remove(self, item: Hashable):
+        """
+        Remove an item from the grid, if it is in it.
+
+        :param item: The item to remove.
+        """
+        self._unbounded_items.discard(item)
+        self._remove_from_cells(item)
+
+    def _remove_from_cells(self, item: Hashable):
+        cell_bounds = self._item_cell_bounds.pop(item, None)
+        if cell_bounds is None:
+            return
+        if item in self._unbounded_items:
+            # was too big to bucket, only ended up here via update()
+            self._unbounded_items.discard(item)
+            return
+        min_x, min_y, max_x, max_y = cell_bounds
+        cells = self._cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = (cell_x, cell_y)
+                items = cells.get(cell)
+                if items is not None:
+                    items.discard(item)
+                    if not items:
+                        del cells[cell]
+
+    def query_point(self, x: float, y: float) -> Set[Hashable]:
+        """
+        Find all the items that might cover a point. Items are not tested against the point
+        precisely, only against the grid cell it falls in.
+
+        :param x: The horizontal position of the point.
+        :param y: The vertical position of the point.
+
+        :return: A new set of items.
+        """
+        size = self.cell_size
+        items = self._cells.get((int(x) // size, int(y) // size))
+        if items is None:
+            return set(self._unbounded_items)
+        return items | self._unbounded_items
+
+    def clear(self):
+        """
+        Remove everything from the grid.
+        """
+        self._cells.clear()
+        self._item_cell_bounds.clear()
+        self._unbounded_items.clear()
+
+    def items(self) -> Iterable[Hashable]:
+        """
+        All the items currently in the grid.
+        """
+        return set(self._item_cell_bounds) | self._unbounded_items
@@ -1,10 +1,15 @@
+import json
+import os
+import time
 import warnings
+import weakref
 
-from typing import List, Tuple, Optional, TypedDict, Dict
+from typing import Any, List, Tuple, Optional, TypedDict, Dict, Union
 
 import pygame
 
 from pygame_gui.core.colour_gradient import ColourGradient
+from pygame_gui.core.rect_packer import MaxRectsPacker
 
 
 class ShortTermCacheUsageData(TypedDict):
@@ -24,6 +29,8 @@ class LongTermCacheUsageData(TypedDict):
     surface: pygame.Surface
     current_uses: int
     total_uses: int
+    last_access: int
+    priority: float
 
 
 class CacheSurfaceDate(TypedDict):
@@ -32,7 +39,190 @@ class CacheSurfaceDate(TypedDict):
     """
 
     surface: pygame.Surface
-    free_space_rectangles: List[pygame.Rect]
+    packer: MaxRectsPacker
+
+
+class ShapeCacheKey:
+    """
+    A compact, immutable ID for a cached shape surface, made from the shape's dimensions and
+    parameters. Any surface in the cache with an equal key should be identical.
+
+    The key is a flat tuple of ints and strings, with its hash worked out once up front, so it
+    is quick to look up over and over. Shapes build one per state when their size or theming
+    changes, rather than on every redraw.
+
+    :param shape: A string for the overall shape of the surface (rounded rectangle,
+     rectangle, etc.).
+    :param size: The dimensions of the surface.
+    :param shadow_width: The thickness of the shadow around the shape.
+    :param border_widths: The thickness of the borders around the shape, a dictionary
+     with per-side widths.
+    :param border_colour: The colour of the border.
+    :param bg_colour: The background, or main colour of the surface.
+    :param corner_radius: Optional corner radius parameter, only used for rounded rectangles.
+    """
+
+    __slots__ = ("values", "_hash")
+
+    def __init__(
+        self,
+        shape: str,
+        size: Tuple[int, int],
+        shadow_width: int,
+        border_widths: Dict[str, int],
+        border_colour: Union[pygame.Color, ColourGradient],
+        bg_colour: Union[pygame.Color, ColourGradient],
+        corner_radius: Optional[List[int]] = None,
+    ):
+        self.values: Tuple[Any, ...] = (
+            shape,
+            int(size[0]),
+            int(size[1]),
+            int(shadow_width),
+            int(border_widths["left"]),
+            int(border_widths["right"]),
+            int(border_widths["top"]),
+            int(border_widths["bottom"]),
+            tuple(int(radius) for radius in corner_radius)
+            if corner_radius is not None
+            else None,
+            self._colour_values(border_colour),
+            self._colour_values(bg_colour),
+        )
+        self._hash = hash(self.values)
+
+    @classmethod
+    def from_values(cls, values: Tuple[Any, ...]) -> "ShapeCacheKey":
+        """
+        Rebuild a key from the flat tuple of values held by another key, for example after
+        loading them from disk.
+
+        :param values: The values from a key's values attribute.
+
+        :return: The key.
+        """
+        shape_key = cls.__new__(cls)
+        shape_key.values = tuple(values)
+        shape_key._hash = hash(shape_key.values)
+        return shape_key
+
+    @staticmethod
+    def _colour_values(
+        colour: Union[pygame.Color, ColourGradient],
+    ) -> Tuple[int, ...]:
+        """
+        Flatten a colour, or the direction and colours of a gradient, to a tuple of ints.
+        """
+        if isinstance(colour, ColourGradient):
+            values = (
+                colour.angle_direction,
+                *colour.colour_1,
+                *colour.colour_2,
+            )
+            if colour.colour_3 is not None:
+                values += tuple(colour.colour_3)
+            return values
+        return tuple(colour)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ShapeCacheKey):
+            return False
+        return self._hash == other._hash and self.values == other.values
+
+    def __str__(self) -> str:
+        """
+        The key as a string, in the same form as SurfaceCache.build_cache_id().
+        """
+        values = [str(value) for value in self.values[:8]]
+        if self.values[8] is not None:
+            values.extend(str(radius) for radius in self.values[8])
+        for colour_values in self.values[9:]:
+            values.extend(str(value) for value in colour_values)
+        return "_".join(values)
+
+    def __repr__(self) -> str:
+        return f"ShapeCacheKey({str(self)})"
+
+
+SurfaceCacheID = Union[str, ShapeCacheKey]
+
+
+class SurfaceCacheEvictionPolicy:
+    """
+    Decides which unused surfaces the SurfaceCache throws away first when it needs room.
+
+    Each long term cached item carries a priority that the policy updates whenever the item is
+    added or looked up; the unused item with the lowest priority is evicted first, with ties
+    going to the least recently used.
+    """
+
+    name = "base"
+
+    def on_access(self, cached_item: LongTermCacheUsageData):
+        """
+        Called whenever an item is added to the long term cache, or found in it.
+
+        :param cached_item: The cached item, with its use counts and last_access already updated.
+        """
+        cached_item["priority"] = 0.0
+
+    def on_evict(self, cached_item: LongTermCacheUsageData):
+        """
+        Called whenever an item is evicted to make room.
+
+        :param cached_item: The evicted item.
+        """
+
+
+class LRUEvictionPolicy(SurfaceCacheEvictionPolicy):
+    """
+    Evict the least recently used surfaces first.
+    """
+
+    name = "lru"
+
+    def on_access(self, cached_item: LongTermCacheUsageData):
+        cached_item["priority"] = float(cached_item["last_access"])
+
+
+class LFUEvictionPolicy(SurfaceCacheEvictionPolicy):
+    """
+    Evict the least frequently used surfaces first.
+    """
+
+    name = "lfu"
+
+    def on_access(self, cached_item: LongTermCacheUsageData):
+        cached_item["priority"] = float(cached_item["total_uses"])
+
+
+class GDSFEvictionPolicy(SurfaceCacheEvictionPolicy):
+    """
+    Greedy Dual Size Frequency. Evicts surfaces that are used rarely for the amount of cache
+    they take up first, so one big, rarely used surface goes before several small popular ones.
+
+    Priorities are aged by raising a baseline to the priority of each evicted surface, so
+    surfaces that were popular a long time ago don't hang around forever.
+    """
+
+    name = "gdsf"
+
+    def __init__(self):
+        self.inflation = 0.0
+
+    def on_access(self, cached_item: LongTermCacheUsageData):
+        width, height = cached_item["surface"].get_size()
+        cached_item["priority"] = self.inflation + (
+            cached_item["total_uses"] / max(1, width * height * 4)
+        )
+
+    def on_evict(self, cached_item: LongTermCacheUsageData):
+        self.inflation = max(self.inflation, cached_item["priority"])
 
 
 class SurfaceCache:
@@ -40,30 +230,160 @@ class SurfaceCache:
     A cache for surfaces that we estimate the UI may want to reuse to save constantly remaking
     almost identical drawable shapes.
 
+    Long term cached surfaces are packed into large atlas surfaces, as many as fit in the
+    cache's memory budget. When a surface won't fit, unused surfaces are evicted according to
+    the eviction policy until it does. When a surface won't fit in an atlas that has enough
+    free space, just not in one piece, the atlas is repacked into a fresh one a few surfaces
+    per update.
+
+    New surfaces wait in the short term cache until update() has time to pack them into the
+    atlases, tallest first, within a per update time budget. Call flush() to pack everything
+    waiting straight away, for example behind a loading screen.
+
+    :param memory_budget: The most memory, in bytes, to use for long term cache atlases. The
+                          default allows three 1024x1024 atlases.
+    :param eviction_policy: Which unused surfaces to evict first when we need room. One of
+                            'lru', 'lfu' or 'gdsf', or a SurfaceCacheEvictionPolicy.
+    :param promotion_time_budget: The time, in seconds, update() may spend moving surfaces
+                                  from the short term cache into the long term one. None moves
+                                  a single surface per update.
     """
 
-    def __init__(self):
-        self.cache_surface_size = (1024, 1024)
+    persistent_format_version = 1
+    persistent_index_file_name = "shape_cache_index.json"
+
+    eviction_policies = {
+        policy.name: policy
+        for policy in (LRUEvictionPolicy, LFUEvictionPolicy, GDSFEvictionPolicy)
+    }
+
+    def __init__(
+        self,
+        memory_budget: int = 3 * 1024 * 1024 * 4,
+        eviction_policy: Union[str, SurfaceCacheEvictionPolicy] = "lru",
+        promotion_time_budget: Optional[float] = 0.002,
+    ):
+        self.max_cache_surface_size = (1024, 1024)
+        self.cache_surface_size = self.max_cache_surface_size
+        self.max_cache_surfaces = 3
+        self.memory_budget = memory_budget
+        self.promotion_time_budget = promotion_time_budget
+        self._access_clock = 0
+
         self.cache_surfaces: List[CacheSurfaceDate] = []
-        starting_surface = pygame.surface.Surface(
-            self.cache_surface_size, flags=pygame.SRCALPHA, depth=32
-        )
-        starting_surface.fill(pygame.Color("#00000000"))
-        self.cache_surfaces.append(
-            {
-                "surface": starting_surface,
-                "free_space_rectangles": [pygame.Rect((0, 0), self.cache_surface_size)],
-            }
-        )
 
-        self.cache_long_term_lookup: Dict[str, LongTermCacheUsageData] = {}
-        self.cache_short_term_lookup: Dict[str, ShortTermCacheUsageData] = {}
+        # how broken up an atlas's free space can get before we repack it, and how many
+        # surfaces to move per update while repacking.
+        self.defragment_threshold = 0.5
+        self.defragment_moves_per_update = 8
+        self._defragment_check_needed = False
+        self._defragment_source: Optional[CacheSurfaceDate] = None
+        self._defragment_destination: Optional[CacheSurfaceDate] = None
+        self._defragment_queue: List[SurfaceCacheID] = []
+        self._defragment_original_rects: Dict[SurfaceCacheID, pygame.Rect] = {}
+
+        self.cache_long_term_lookup: Dict[SurfaceCacheID, LongTermCacheUsageData] = {}
+        self.cache_short_term_lookup: Dict[
+            SurfaceCacheID, ShortTermCacheUsageData
+        ] = {}
+        # users that have already finished with a surface still in the short term cache
+        self._short_term_released_uses: Dict[SurfaceCacheID, int] = {}
+        # stand alone copies handed out to share, kept only while someone is using them
+        self._shared_surfaces: weakref.WeakValueDictionary[
+            SurfaceCacheID, pygame.Surface
+        ] = weakref.WeakValueDictionary()
+
+        self.consider_purging_list: List[SurfaceCacheID] = []
+
+        self.low_on_space = False
 
-        self.consider_purging_list: List[str] = []
+        self._short_term_hits = 0
+        self._long_term_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._purges = 0
+        self._defragmentations = 0
 
+        self.eviction_policy: SurfaceCacheEvictionPolicy = LRUEvictionPolicy()
+        self.set_eviction_policy(eviction_policy)
+        self.set_memory_budget(memory_budget)
+
+    def set_memory_budget(self, memory_budget: int):
+        """
+        Set the most memory, in bytes, the long term cache may use for its atlas surfaces. The
+        number of atlases grows or shrinks to fit; lowering the budget below what is in use
+        throws away the emptiest atlases along with everything cached in them.
+
+        Budgets smaller than one full size atlas use a single, smaller, square atlas.
+
+        :param memory_budget: The budget in bytes.
+        """
+        if memory_budget <= 0:
+            raise ValueError("Surface cache memory budget must be greater than zero")
+        self.memory_budget = memory_budget
+
+        max_width, max_height = self.max_cache_surface_size
+        atlas_bytes = max_width * max_height * 4
+        if memory_budget >= atlas_bytes:
+            new_surface_size = self.max_cache_surface_size
+            self.max_cache_surfaces = memory_budget // atlas_bytes
+        else:
+            side = 1
+            while (side * 2) * (side * 2) * 4 <= memory_budget:
+                side *= 2
+            new_surface_size = (side, side)
+            self.max_cache_surfaces = 1
+
+        self._abandon_defragmenting()
+        if new_surface_size != self.cache_surface_size:
+            # atlases change size, so start again from scratch
+            self.cache_surface_size = new_surface_size
+            self._clear_long_term_cache()
+        else:
+            while len(self.cache_surfaces) > self.max_cache_surfaces:
+                emptiest_surface = min(
+                    self.cache_surfaces,
+                    key=lambda cache_surface: cache_surface["packer"].used_area,
+                )
+                self._remove_cache_surface(emptiest_surface)
+        if not self.cache_surfaces:
+            self.cache_surfaces.append(self._create_cache_surface())
         self.low_on_space = False
 
-    def add_surface_to_cache(self, surface: pygame.surface.Surface, string_id: str):
+    def get_memory_usage(self) -> int:
+        """
+        Get the memory, in bytes, used by the long term cache's atlas surfaces.
+
+        :return: The memory used in bytes.
+        """
+        return sum(
+            cache_surface["surface"].get_width()
+            * cache_surface["surface"].get_height()
+            * 4
+            for cache_surface in self.cache_surfaces
+        )
+
+    def set_eviction_policy(
+        self, eviction_policy: Union[str, SurfaceCacheEvictionPolicy]
+    ):
+        """
+        Set the policy deciding which unused surfaces to evict first when the cache needs room.
+
+        :param eviction_policy: One of 'lru', 'lfu' or 'gdsf', or a SurfaceCacheEvictionPolicy.
+        """
+        if isinstance(eviction_policy, str):
+            if eviction_policy not in self.eviction_policies:
+                raise ValueError(
+                    f"Unknown surface cache eviction policy: {eviction_policy}, "
+                    f"expected one of {list(self.eviction_policies)}"
+                )
+            eviction_policy = self.eviction_policies[eviction_policy]()
+        self.eviction_policy = eviction_policy
+        for cached_item in self.cache_long_term_lookup.values():
+            self.eviction_policy.on_access(cached_item)
+
+    def add_surface_to_cache(self, surface: pygame.surface.Surface, string_id: SurfaceCacheID):
         """
         Adds a surface to the cache. There are two levels to the cache, the short term level
         just keeps hold of the surface until we have time to add it to the long term level.
@@ -73,31 +393,101 @@ class SurfaceCache:
         """
         self.cache_short_term_lookup[string_id] = {"surface": surface.copy(), "uses": 1}
 
+    def set_promotion_time_budget(self, budget: Optional[float]):
+        """
+        Set the amount of time update() may spend moving surfaces from the short term cache into
+        the long term one. At least one surface is always moved per update, so a slow surface
+        may take us somewhat over budget.
+
+        :param budget: A time budget in seconds, or None to move a single surface per update.
+        """
+        self.promotion_time_budget = budget
+
     def update(self):
         """
         Takes care of steadily moving surfaces from the short term cache into the long term.
-        Long term caching takes a while, so we limit it to adding one surface a frame.
+        Long term caching takes a while, so we limit it to the promotion time budget each frame.
 
-        We also purge some lesser used surfaces from the long term cache when we run out of space.
+        We also purge some lesser used surfaces from the long term cache when we run out of space,
+        and repack any fragmented cache surface a few surfaces at a time.
         """
+        if self._defragment_source is not None:
+            self._continue_defragmenting()
+
         if any(self.cache_short_term_lookup):
-            string_id, st_cached_item = self.cache_short_term_lookup.popitem()
-            self.add_surface_to_long_term_cache(st_cached_item, string_id)
+            if self.promotion_time_budget is None:
+                string_id, st_cached_item = self.cache_short_term_lookup.popitem()
+                self.add_surface_to_long_term_cache(st_cached_item, string_id)
+            else:
+                self._promote_short_term_surfaces(self.promotion_time_budget)
+        elif self._defragment_check_needed and self._defragment_source is None:
+            self._defragment_check_needed = False
+            self._start_defragmenting()
 
         if self.low_on_space:
-            self.low_on_space = False
-            for cache_id in self.consider_purging_list:
-                lt_cached_item = self.cache_long_term_lookup[cache_id]
-                if (
-                    lt_cached_item["current_uses"] == 0
-                    and lt_cached_item["total_uses"] == 1
-                ):
-                    self._free_cached_surface(cache_id)
+            self._purge_single_use_surfaces()
+
+    def flush(self):
+        """
+        Move everything waiting in the short term cache into the long term one and finish any
+        repacking now, rather than spreading the work over the next few updates. Worth calling
+        behind a loading screen once a large UI has been built.
+        """
+        while self.cache_short_term_lookup:
+            self._promote_short_term_surfaces(None)
+            if self.low_on_space:
+                self._purge_single_use_surfaces()
+        if self._defragment_check_needed and self._defragment_source is None:
+            self._defragment_check_needed = False
+            self._start_defragmenting()
+        while self._defragment_source is not None:
+            self._continue_defragmenting()
+
+    def _promote_short_term_surfaces(self, time_budget: Optional[float]):
+        """
+        Move short term cached surfaces into the long term cache, tallest first as that packs
+        the atlases more tightly, until we run out of time or space.
 
-            self.consider_purging_list.clear()
+        :param time_budget: The time to spend in seconds, or None to keep going until the short
+                            term cache is empty or the long term cache is full.
+        """
+        start_time = time.perf_counter()
+        promotion_order = sorted(
+            self.cache_short_term_lookup,
+            key=lambda string_id: self.cache_short_term_lookup[string_id][
+                "surface"
+            ].get_height(),
+            reverse=True,
+        )
+        for string_id in promotion_order:
+            st_cached_item = self.cache_short_term_lookup.pop(string_id)
+            self.add_surface_to_long_term_cache(st_cached_item, string_id)
+            if self.low_on_space or (
+                time_budget is not None
+                and time.perf_counter() - start_time >= time_budget
+            ):
+                break
+
+    def _purge_single_use_surfaces(self):
+        """
+        Free long term cached surfaces that were only ever used once and now have no users, to
+        make room when we run out of space.
+        """
+        self.low_on_space = False
+        for cache_id in list(self.consider_purging_list):
+            lt_cached_item = self.cache_long_term_lookup.get(cache_id)
+            if (
+                lt_cached_item is not None
+                and lt_cached_item["current_uses"] == 0
+                and lt_cached_item["total_uses"] == 1
+            ):
+                self._free_cached_surface(cache_id)
+                self._purges += 1
+
+        self.consider_purging_list.clear()
 
     def add_surface_to_long_term_cache(
-        self, cached_item: ShortTermCacheUsageData, string_id: str
+        self, cached_item: ShortTermCacheUsageData, string_id: SurfaceCacheID
     ):
         """
         Move a surface from the short term cache into the long term one.
@@ -105,10 +495,13 @@ class SurfaceCache:
         :param cached_item: The surface to move into the long term cache.
         :param string_id: The ID of the surface in the cache.
         """
-
+        released_uses = self._short_term_released_uses.pop(string_id, 0)
         if (
             isinstance(cached_item["surface"], pygame.Surface)
-            and cached_item["surface"].get_size() > self.cache_surface_size
+            and (
+                cached_item["surface"].get_width() > self.cache_surface_size[0]
+                or cached_item["surface"].get_height() > self.cache_surface_size[1]
+            )
         ):
             warnings.warn(
                 f"Unable to cache surfaces larger than {self.cache_surface_size}"
@@ -118,197 +511,316 @@ class SurfaceCache:
             found_rectangle_cache = None
 
             while found_rectangle_cache is None and not self.low_on_space:
-                for cache_surface in self.cache_surfaces:
-                    if found_rectangle_cache is None:
-                        result = self._find_spot_in_lt_cache(
-                            cache_surface, cached_item, string_id
-                        )
-                        found_rectangle_cache = result[0]
-                        found_rectangle_to_split = result[1]
-                        self._divide_lt_cache(
-                            cache_surface,
-                            found_rectangle_cache,
-                            found_rectangle_to_split,
-                        )
+                for cache_surface in self._get_insertable_cache_surfaces():
+                    found_rectangle_cache = self._find_spot_in_lt_cache(
+                        cache_surface, cached_item, string_id
+                    )
+                    if found_rectangle_cache is not None:
+                        break
+                    packer = cache_surface["packer"]
+                    width, height = cached_item["surface"].get_size()
+                    if (
+                        packer.size[0] * packer.size[1] - packer.used_area
+                        >= width * height
+                    ):
+                        # there was room, just not in one piece
+                        self._defragment_check_needed = True
 
                 if found_rectangle_cache is None:
-                    self._expand_lt_cache()
+                    if len(self.cache_surfaces) < self.max_cache_surfaces:
+                        self._expand_lt_cache()
+                    else:
+                        found_rectangle_cache = self._evict_to_fit(
+                            cached_item, string_id
+                        )
+                        if found_rectangle_cache is None:
+                            self.low_on_space = True
 
+            if found_rectangle_cache is not None and released_uses > 0:
+                lt_cached_item = self.cache_long_term_lookup[string_id]
+                lt_cached_item["current_uses"] = max(
+                    0, lt_cached_item["current_uses"] - released_uses
+                )
+                if (
+                    lt_cached_item["current_uses"] == 0
+                    and lt_cached_item["total_uses"] == 1
+                ):
+                    self.consider_purging_list.append(string_id)
             return True
 
-    def _divide_lt_cache(
+    def _find_spot_in_lt_cache(
         self,
         cache_surface: CacheSurfaceDate,
-        found_rectangle_cache: pygame.Rect | None,
-        found_rectangle_to_split: pygame.Rect | None,
-    ):
+        new_item: ShortTermCacheUsageData,
+        string_id: SurfaceCacheID,
+    ) -> pygame.Rect | None:
         """
-        Having reserved a spot in one of our long term cache surfaces, divide up the rest of
-        the cache surface to correctly ascertain the new set of free spaces.
+        Find a place in a long term cache surface for our new item from the short term cache,
+        and copy it in there if we find one.
 
-        :param cache_surface: The long term cache surface we are dividing.
-        :param found_rectangle_cache: The newly reserved space.
-        :param found_rectangle_to_split: The old rectangle the newly reserved space is in.
+        :param cache_surface: the surface to search.
+        :param new_item: the item to cache.
+        :param string_id: the look-up id.
+        :return: The rect we have reserved, or None if there was no room.
         """
-        if found_rectangle_to_split is not None and found_rectangle_cache is not None:
-            free_space_rectangles = cache_surface["free_space_rectangles"]
-            self.split_rect(
-                found_rectangle_to_split,
-                found_rectangle_cache,
-                cache_surface["free_space_rectangles"],
+        found_rectangle_cache = cache_surface["packer"].insert(
+            new_item["surface"].get_size()
+        )
+        if found_rectangle_cache is not None:
+            current_surface = cache_surface["surface"]
+            current_surface.blit(
+                new_item["surface"],
+                found_rectangle_cache.topleft,
+                special_flags=pygame.BLEND_PREMULTIPLIED,
             )
-            rects_to_split = [
-                rect
-                for rect in free_space_rectangles
-                if rect.colliderect(found_rectangle_cache)
-            ]
-            for split_rect in rects_to_split:
-                self.split_rect(
-                    split_rect,
-                    found_rectangle_cache,
-                    cache_surface["free_space_rectangles"],
-                )
-
-            self._clean_up_lt_cache(cache_surface, free_space_rectangles)
+            lt_cached_item: LongTermCacheUsageData = {
+                "surface": current_surface.subsurface(found_rectangle_cache),
+                "current_uses": new_item["uses"],
+                "total_uses": new_item["uses"],
+                "last_access": 0,
+                "priority": 0.0,
+            }
+            self.cache_long_term_lookup[string_id] = lt_cached_item
+            self._record_access(lt_cached_item)
+        return found_rectangle_cache
 
-    @staticmethod
-    def _clean_up_lt_cache(
-        cache_surface: CacheSurfaceDate, free_space_rectangles: List[pygame.Rect]
-    ):
+    def _record_access(self, cached_item: LongTermCacheUsageData):
         """
-        Clean up rectangles entirely inside other rectangles.
-
-        :param cache_surface:
-        :param free_space_rectangles:
+        Stamp a long term cached item with the time it was last used, and let the eviction
+        policy update its priority.
 
+        :param cached_item: The item being used.
         """
-        rects_to_remove: List[pygame.Rect] = []
-        rectangles_to_check = free_space_rectangles[:]
-        for free_rectangle in free_space_rectangles:
-            rects_to_remove.extend(
-                free_rectangle
-                for check_rect in rectangles_to_check
-                if (
-                    free_rectangle != check_rect and check_rect.contains(free_rectangle)
-                )
-            )
-        cache_surface["free_space_rectangles"] = [
-            rect for rect in free_space_rectangles if rect not in rects_to_remove
-        ]
+        self._access_clock += 1
+        cached_item["last_access"] = self._access_clock
+        self.eviction_policy.on_access(cached_item)
 
-    def _find_spot_in_lt_cache(
-        self,
-        cache_surface: CacheSurfaceDate,
-        new_item: ShortTermCacheUsageData,
-        string_id: str,
-    ) -> Tuple[pygame.Rect | None, pygame.Rect | None]:
+    def _evict_to_fit(
+        self, new_item: ShortTermCacheUsageData, string_id: SurfaceCacheID
+    ) -> pygame.Rect | None:
         """
-        Find a place in a long term cache surface for our new item from the short term cache.
+        Evict unused long term cached surfaces, lowest priority first, until our new item fits.
 
-        :param cache_surface: the surface to search.
         :param new_item: the item to cache.
         :param string_id: the look-up id.
-        :return: A tuple of the new rect we are reserving, and the rectangle it's inside.
+        :return: The rect we have reserved, or None if we ran out of surfaces to evict.
         """
-        found_rectangle_cache = None
-        found_rectangle_to_split = None
-        current_surface = cache_surface["surface"]
-        surface_size = new_item["surface"].get_size()
-        for free_rectangle in cache_surface["free_space_rectangles"]:
-            if (
-                free_rectangle.width >= surface_size[0]
-                and free_rectangle.height >= surface_size[1]
-            ):
-                # we fits, so we sits
-                found_rectangle_to_split = free_rectangle
-                found_rectangle_cache = pygame.Rect(
-                    free_rectangle.topleft, surface_size
-                )
-                current_surface.blit(
-                    new_item["surface"],
-                    free_rectangle.topleft,
-                    special_flags=pygame.BLEND_PREMULTIPLIED,
-                )
-                self.cache_long_term_lookup[string_id] = {
-                    "surface": current_surface.subsurface(found_rectangle_cache),
-                    "current_uses": new_item["uses"],
-                    "total_uses": new_item["uses"],
-                }
-                break
-        return found_rectangle_cache, found_rectangle_to_split
+        unused_ids = sorted(
+            (
+                cache_id
+                for cache_id, cached_item in self.cache_long_term_lookup.items()
+                if cached_item["current_uses"] == 0
+            ),
+            key=lambda cache_id: (
+                self.cache_long_term_lookup[cache_id]["priority"],
+                self.cache_long_term_lookup[cache_id]["last_access"],
+            ),
+        )
+        for cache_id in unused_ids:
+            evicted_item = self.cache_long_term_lookup[cache_id]
+            parent_surface = evicted_item["surface"].get_parent()
+            self.eviction_policy.on_evict(evicted_item)
+            self._free_cached_surface(cache_id)
+            self._evictions += 1
+            for cache_surface in self._get_insertable_cache_surfaces():
+                if cache_surface["surface"] is parent_surface:
+                    found_rectangle_cache = self._find_spot_in_lt_cache(
+                        cache_surface, new_item, string_id
+                    )
+                    if found_rectangle_cache is not None:
+                        return found_rectangle_cache
+        return None
+
+    def _get_insertable_cache_surfaces(self) -> List[CacheSurfaceDate]:
+        """
+        Get the long term cache surfaces new surfaces can go in. While a cache surface is being
+        repacked new surfaces go in its replacement instead, but only once the other cache
+        surfaces are full, to leave room for the surfaces still to move.
+
+        :return: The cache surfaces.
+        """
+        if self._defragment_source is None or self._defragment_destination is None:
+            return self.cache_surfaces
+        return [
+            cache_surface
+            for cache_surface in self.cache_surfaces
+            if cache_surface is not self._defragment_source
+        ] + [self._defragment_destination]
+
+    def _create_cache_surface(self) -> CacheSurfaceDate:
+        """
+        Create a new, empty, long term cache surface.
+
+        :return: The cache surface data.
+        """
+        new_surface = pygame.surface.Surface(
+            self.cache_surface_size, flags=pygame.SRCALPHA, depth=32
+        )
+        new_surface.fill(pygame.Color("#00000000"))
+        return {"surface": new_surface, "packer": MaxRectsPacker(self.cache_surface_size)}
 
     def _expand_lt_cache(self):
         """
         Try to expand the long term cache by adding more surfaces, until we hit the limit.
         """
-        if len(self.cache_surfaces) < 3:
-            # create a new cache surface
-            new_surface = pygame.surface.Surface(
-                self.cache_surface_size, flags=pygame.SRCALPHA, depth=32
-            )
-            new_surface.fill(pygame.Color("#00000000"))
-            self.cache_surfaces.append(
-                {
-                    "surface": new_surface,
-                    "free_space_rectangles": [
-                        pygame.Rect((0, 0), self.cache_surface_size)
-                    ],
-                }
-            )
+        if len(self.cache_surfaces) < self.max_cache_surfaces:
+            self.cache_surfaces.append(self._create_cache_surface())
         else:
             self.low_on_space = True
 
-    @staticmethod
-    def split_rect(
-        found_rectangle_to_split: pygame.Rect,
-        dividing_rect: pygame.Rect,
-        free_space_rectangles: List[pygame.Rect],
-    ):
+    def _drop_cached_surface(self, string_id: SurfaceCacheID):
         """
-        Takes an existing free space rectangle that we are placing a new surface inside and
-        then divides up the remaining space into new, smaller free space rectangles.
+        Forget about a long term cached surface, without freeing its space. Used when the space
+        is about to go away anyway.
 
-        :param found_rectangle_to_split: The rectangle we are splitting.
-        :param dividing_rect: The rectangle dividing up the split rectangle.
-        :param free_space_rectangles: A list of all free space rectangles for a particular surface.
+        :param string_id: the ID of the cached surface to forget.
         """
-        free_space_rectangles.remove(found_rectangle_to_split)
+        del self.cache_long_term_lookup[string_id]
+        if string_id in self.consider_purging_list:
+            self.consider_purging_list.remove(string_id)
 
-        # create new rectangles
-        if (found_rectangle_to_split.right - dividing_rect.right) > 0:
-            rect_1 = pygame.Rect(
-                dividing_rect.right,
-                found_rectangle_to_split.top,
-                found_rectangle_to_split.right - dividing_rect.right,
-                found_rectangle_to_split.height,
-            )
-            free_space_rectangles.append(rect_1)
-        if (found_rectangle_to_split.bottom - dividing_rect.bottom) > 0:
-            rect_2 = pygame.Rect(
-                found_rectangle_to_split.left,
-                dividing_rect.bottom,
-                found_rectangle_to_split.width,
-                found_rectangle_to_split.bottom - dividing_rect.bottom,
-            )
-            free_space_rectangles.append(rect_2)
-        if (dividing_rect.top - found_rectangle_to_split.top) > 0:
-            rect_3 = pygame.Rect(
-                found_rectangle_to_split.left,
-                found_rectangle_to_split.top,
-                found_rectangle_to_split.width,
-                dividing_rect.top - found_rectangle_to_split.top,
+    def _remove_cache_surface(self, cache_surface: CacheSurfaceDate):
+        """
+        Throw away a long term cache surface and everything cached on it.
+
+        :param cache_surface: The cache surface to remove.
+        """
+        parent_surface = cache_surface["surface"]
+        for cache_id in [
+            cache_id
+            for cache_id, cached_item in self.cache_long_term_lookup.items()
+            if cached_item["surface"].get_parent() is parent_surface
+        ]:
+            self._drop_cached_surface(cache_id)
+        self.cache_surfaces.remove(cache_surface)
+
+    def _clear_long_term_cache(self):
+        """
+        Throw away all the long term cache surfaces and everything cached on them.
+        """
+        self.cache_surfaces = []
+        self.cache_long_term_lookup.clear()
+        self.consider_purging_list.clear()
+
+    def _start_defragmenting(self):
+        """
+        Look for a long term cache surface whose free space has become too broken up to be
+        useful and, if we find one, start repacking it into a fresh surface.
+        """
+        for cache_surface in self.cache_surfaces:
+            packer = cache_surface["packer"]
+            if (
+                packer.used_count > 0
+                and packer.get_fragmentation() > self.defragment_threshold
+            ):
+                parent_surface = cache_surface["surface"]
+                queue = [
+                    string_id
+                    for string_id, cached_item in self.cache_long_term_lookup.items()
+                    if cached_item["surface"].get_parent() is parent_surface
+                ]
+                # big surfaces first packs them more tightly
+                queue.sort(
+                    key=lambda string_id: self.cache_long_term_lookup[string_id][
+                        "surface"
+                    ].get_height(),
+                    reverse=True,
+                )
+                # pop() takes from the end
+                queue.reverse()
+                self._defragment_queue = queue
+                self._defragment_source = cache_surface
+                self._defragmentations += 1
+                self._defragment_destination = self._create_cache_surface()
+                return
+
+    def _continue_defragmenting(self):
+        """
+        Move a few more surfaces from the surface we are repacking into its replacement, and
+        swap the replacement in once they have all moved.
+        """
+        source = self._defragment_source
+        destination = self._defragment_destination
+        if source is None or destination is None:
+            return
+        moves = 0
+        while self._defragment_queue and moves < self.defragment_moves_per_update:
+            string_id = self._defragment_queue.pop()
+            cached_item = self.cache_long_term_lookup.get(string_id)
+            if (
+                cached_item is None
+                or cached_item["surface"].get_parent() is not source["surface"]
+            ):
+                # freed since we started
+                continue
+            old_surface = cached_item["surface"]
+            new_rect = None
+            new_home = destination
+            for new_home in [destination] + self._get_insertable_cache_surfaces()[:-1]:
+                new_rect = new_home["packer"].insert(old_surface.get_size())
+                if new_rect is not None:
+                    break
+            if new_rect is None:
+                # newer surfaces took the room, anyone using this one has their own copy
+                self._drop_cached_surface(string_id)
+                continue
+            new_home["surface"].blit(
+                old_surface, new_rect, special_flags=pygame.BLEND_PREMULTIPLIED
             )
-            free_space_rectangles.append(rect_3)
-        if (dividing_rect.left - found_rectangle_to_split.left) > 0:
-            rect_4 = pygame.Rect(
-                found_rectangle_to_split.left,
-                found_rectangle_to_split.top,
-                dividing_rect.left - found_rectangle_to_split.left,
-                found_rectangle_to_split.height,
+            self._defragment_original_rects[string_id] = pygame.Rect(
+                old_surface.get_offset(), old_surface.get_size()
             )
-            free_space_rectangles.append(rect_4)
+            cached_item["surface"] = new_home["surface"].subsurface(new_rect)
+            moves += 1
+
+        if not self._defragment_queue:
+            source["surface"] = destination["surface"]
+            source["packer"] = destination["packer"]
+            self._defragment_source = None
+            self._defragment_destination = None
+            self._defragment_original_rects = {}
 
-    def find_surface_in_cache(self, lookup_id: str) -> pygame.surface.Surface | None:
+    def _abandon_defragmenting(self):
+        """
+        Give up repacking a cache surface, pointing everything we have already moved back at its
+        original spot. The original surface is left untouched while we repack, so that is just
+        a matter of making new subsurfaces. Anything added to the replacement since we started is
+        dropped from the cache.
+        """
+        source = self._defragment_source
+        destination = self._defragment_destination
+        if source is not None and destination is not None:
+            for string_id, original_rect in self._defragment_original_rects.items():
+                cached_item = self.cache_long_term_lookup.get(string_id)
+                if cached_item is None:
+                    continue
+                moved_surface = cached_item["surface"]
+                for cache_surface in self.cache_surfaces:
+                    if cache_surface["surface"] is moved_surface.get_parent():
+                        # moved to another cache surface rather than the replacement
+                        moved_rect = pygame.Rect(
+                            moved_surface.get_offset(), moved_surface.get_size()
+                        )
+                        cache_surface["surface"].fill(
+                            pygame.Color("#00000000"), moved_rect
+                        )
+                        cache_surface["packer"].free(moved_rect)
+                        break
+                cached_item["surface"] = source["surface"].subsurface(original_rect)
+            for string_id in [
+                string_id
+                for string_id, cached_item in self.cache_long_term_lookup.items()
+                if cached_item["surface"].get_parent() is destination["surface"]
+            ]:
+                self._drop_cached_surface(string_id)
+        self._defragment_source = None
+        self._defragment_destination = None
+        self._defragment_queue = []
+        self._defragment_original_rects = {}
+
+    def find_surface_in_cache(
+        self, lookup_id: SurfaceCacheID
+    ) -> pygame.surface.Surface | None:
         """
         Looks for a surface in the cache by an ID and returns it if found.
 
@@ -321,16 +833,127 @@ class SurfaceCache:
         if lookup_id in self.cache_short_term_lookup:
             cached_item = self.cache_short_term_lookup[lookup_id]
             cached_item["uses"] += 1
+            self._short_term_hits += 1
             return cached_item["surface"]
         # check long term
         if lookup_id in self.cache_long_term_lookup:
-            self.cache_long_term_lookup[lookup_id]["current_uses"] += 1
-            self.cache_long_term_lookup[lookup_id]["total_uses"] += 1
-            return self.cache_long_term_lookup[lookup_id]["surface"]
+            lt_cached_item = self.cache_long_term_lookup[lookup_id]
+            lt_cached_item["current_uses"] += 1
+            lt_cached_item["total_uses"] += 1
+            self._record_access(lt_cached_item)
+            self._long_term_hits += 1
+            return lt_cached_item["surface"]
         else:
+            self._misses += 1
+            return None
+
+    def find_shared_surface_in_cache(
+        self, lookup_id: SurfaceCacheID
+    ) -> pygame.surface.Surface | None:
+        """
+        Looks for a surface in the cache, like find_surface_in_cache(), but returns a stand alone
+        surface shared with everyone else who asks for the same ID, rather than one to copy.
+        Lots of identical elements can then all use a single surface.
+
+        The shared surface must never be drawn on; copy it first if it needs changing. It stays
+        shared for as long as anyone holds on to it, even if the cache throws its own copy away.
+
+        :param lookup_id: The ID of the surface to find.
+
+        :return: The shared surface, or None if the cache doesn't have it.
+        """
+        shared_surface = self._shared_surfaces.get(lookup_id)
+        if shared_surface is not None:
+            self._shared_hits += 1
+            lt_cached_item = self.cache_long_term_lookup.get(lookup_id)
+            if lt_cached_item is not None:
+                self._record_access(lt_cached_item)
+            return shared_surface
+
+        found_surface = self.find_surface_in_cache(lookup_id)
+        if found_surface is None:
             return None
+        shared_surface = found_surface.copy()
+        self._shared_surfaces[lookup_id] = shared_surface
+        return shared_surface
+
+    def share_surface(self, shared_id: Any, surface: pygame.surface.Surface):
+        """
+        Offer a surface for sharing, so anyone asking find_shared_surface_in_cache() for the same
+        ID gets it for as long as someone is using it. Useful for sharing surfaces built on
+        top of shared surfaces, which aren't worth keeping in the cache itself.
 
-    def remove_user_from_cache_item(self, string_id: str):
+        :param shared_id: Any hashable ID that only ever identifies identical surfaces.
+        :param surface: The surface to share, which must not be drawn on from now on.
+        """
+        self._shared_surfaces[shared_id] = surface
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get statistics on how well the cache is working, to help tune its memory budget and
+        themes against real use.
+
+        The counts of hits, misses, evictions, purges and defragmentations are totals since the
+        cache was created or reset_stats() was last called. Everything else is a snapshot.
+
+        :return: A dictionary of statistics -
+
+                 - 'hits', 'short_term_hits', 'long_term_hits', 'shared_hits', 'misses':
+                   lookup counts, shared hits are surfaces found already shared.
+                 - 'hit_rate': the fraction of lookups that were hits.
+                 - 'short_term_count', 'long_term_count': the surfaces held at each level.
+                 - 'shared_count': the shared surfaces in use.
+                 - 'cache_surfaces': the number of long term cache surfaces.
+                 - 'occupancy': the fraction of the cache surfaces' area in use.
+                 - 'fragmentation': the fragmentation of the most fragmented cache surface.
+                 - 'bytes_used', 'memory_budget': the cache surfaces' memory and its limit.
+                 - 'evictions': surfaces evicted to make room.
+                 - 'purges': single use surfaces purged when low on space.
+                 - 'defragmentations': cache surfaces repacked.
+        """
+        hits = self._short_term_hits + self._long_term_hits + self._shared_hits
+        lookups = hits + self._misses
+        total_area = 0
+        used_area = 0
+        fragmentation = 0.0
+        for cache_surface in self.cache_surfaces:
+            packer = cache_surface["packer"]
+            total_area += packer.size[0] * packer.size[1]
+            used_area += packer.used_area
+            fragmentation = max(fragmentation, packer.get_fragmentation())
+        return {
+            "hits": hits,
+            "short_term_hits": self._short_term_hits,
+            "long_term_hits": self._long_term_hits,
+            "shared_hits": self._shared_hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups > 0 else 0.0,
+            "short_term_count": len(self.cache_short_term_lookup),
+            "long_term_count": len(self.cache_long_term_lookup),
+            "shared_count": len(self._shared_surfaces),
+            "cache_surfaces": len(self.cache_surfaces),
+            "occupancy": used_area / total_area if total_area > 0 else 0.0,
+            "fragmentation": fragmentation,
+            "bytes_used": self.get_memory_usage(),
+            "memory_budget": self.memory_budget,
+            "evictions": self._evictions,
+            "purges": self._purges,
+            "defragmentations": self._defragmentations,
+        }
+
+    def reset_stats(self):
+        """
+        Reset the running totals reported by get_stats() to zero.
+        """
+        self._short_term_hits = 0
+        self._long_term_hits = 0
+        self._shared_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._purges = 0
+        self._defragmentations = 0
+
+    def remove_user_from_cache_item(self, string_id: SurfaceCacheID):
         """
         Deduct a 'user' from a particular cache surface. The number of users of a cache surface
         over the lifetime of a program would be a decent measure of how 'valuable' it is to
@@ -338,7 +961,11 @@ class SurfaceCache:
 
         :param string_id: The ID of the cached surface to deduct a user from.
         """
-        if string_id in self.cache_long_term_lookup:
+        if string_id in self.cache_short_term_lookup:
+            self._short_term_released_uses[string_id] = (
+                self._short_term_released_uses.get(string_id, 0) + 1
+            )
+        elif string_id in self.cache_long_term_lookup:
             self.cache_long_term_lookup[string_id]["current_uses"] -= 1
 
             if (
@@ -347,7 +974,7 @@ class SurfaceCache:
             ):
                 self.consider_purging_list.append(string_id)
 
-    def remove_user_and_request_clean_up_of_cached_item(self, string_id: str):
+    def remove_user_and_request_clean_up_of_cached_item(self, string_id: SurfaceCacheID):
         """
         If we are certain that a cached surface won't be used again anytime soon we can request
         it is removed from the cache directly.
@@ -357,7 +984,7 @@ class SurfaceCache:
         self.remove_user_from_cache_item(string_id)
         self._free_cached_surface(string_id)
 
-    def _free_cached_surface(self, string_id: str):
+    def _free_cached_surface(self, string_id: SurfaceCacheID):
         """
         Directly remove an unused surface from the long term cache.
 
@@ -373,18 +1000,277 @@ class SurfaceCache:
         cache_to_clear = self.cache_long_term_lookup.pop(string_id)
         cache_surface_to_clear = cache_to_clear["surface"]
 
-        for cache_surface in self.cache_surfaces:
-            if cache_surface["surface"] == cache_surface_to_clear.get_parent():
+        parent_surface = cache_surface_to_clear.get_parent()
+        original_rect = self._defragment_original_rects.pop(string_id, None)
+        if original_rect is not None and self._defragment_source is not None:
+            # already repacked, so its original spot is still reserved too
+            self._defragment_source["surface"].fill(
+                pygame.Color("#00000000"), original_rect
+            )
+            self._defragment_source["packer"].free(original_rect)
+        cache_surfaces = self.cache_surfaces
+        if self._defragment_destination is not None:
+            cache_surfaces = cache_surfaces + [self._defragment_destination]
+        for cache_surface in cache_surfaces:
+            if cache_surface["surface"] is parent_surface:
                 freed_space = pygame.Rect(
                     cache_surface_to_clear.get_offset(),
                     cache_surface_to_clear.get_size(),
                 )
-                cache_surface["free_space_rectangles"].append(freed_space)
+                # clear it out, so it blends properly with whatever goes in next
+                parent_surface.fill(pygame.Color("#00000000"), freed_space)
+                cache_surface["packer"].free(freed_space)
                 break
 
         if string_id in self.consider_purging_list:
             self.consider_purging_list.remove(string_id)
 
+    def save_to_directory(
+        self, directory: Union[str, os.PathLike], cache_key: str = ""
+    ) -> bool:
+        """
+        Save the long term cache to a directory, so it can be loaded again the next time the
+        program starts instead of drawing all the shapes again. The cache surfaces are saved as
+        PNG images alongside a small JSON index of what is where.
+
+        Anything still in the short term cache is moved to the long term cache first, and any
+        repacking is finished off.
+
+        :param directory: The directory to save to, created if it doesn't exist.
+        :param cache_key: A string identifying what the saved surfaces were drawn with, e.g. the
+                          versions and theme used. Loading with a different key ignores them.
+
+        :return: True if the cache was saved.
+        """
+        while self.cache_short_term_lookup:
+            string_id, st_cached_item = self.cache_short_term_lookup.popitem()
+            self.add_surface_to_long_term_cache(st_cached_item, string_id)
+        while self._defragment_source is not None:
+            self._continue_defragmenting()
+
+        surface_indices = {
+            id(cache_surface["surface"]): index
+            for index, cache_surface in enumerate(self.cache_surfaces)
+        }
+
+        entries = []
+        for string_id, cached_item in self.cache_long_term_lookup.items():
+            surface = cached_item["surface"]
+            surface_index = surface_indices.get(id(surface.get_parent()))
+            if surface_index is None:
+                continue
+            entries.append(
+                {
+                    "key": self._cache_id_to_json(string_id),
+                    "surface": surface_index,
+                    "rect": [*surface.get_offset(), *surface.get_size()],
+                }
+            )
+
+        index_data = {
+            "format_version": self.persistent_format_version,
+            "cache_key": cache_key,
+            "surface_size": list(self.cache_surface_size),
+            "surfaces": [],
+            "entries": entries,
+        }
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for index, cache_surface in enumerate(self.cache_surfaces):
+                file_name = f"shape_cache_surface_{index}.png"
+                pygame.image.save(
+                    cache_surface["surface"], os.path.join(directory, file_name)
+                )
+                # saving the free space saves working it out again when we load
+                index_data["surfaces"].append(
+                    {
+                        "file_name": file_name,
+                        "free_rects": [
+                            list(free_rect)
+                            for free_rect in cache_surface["packer"].free_rects
+                        ],
+                    }
+                )
+            # the index goes last, so a half finished save never looks valid
+            with open(
+                os.path.join(directory, self.persistent_index_file_name),
+                "w",
+                encoding="utf-8",
+            ) as index_file:
+                json.dump(index_data, index_file)
+        except (OSError, pygame.error) as save_error:
+            warnings.warn(f"Unable to save shape cache to {directory}: {save_error}")
+            return False
+        return True
+
+    def load_from_directory(
+        self, directory: Union[str, os.PathLike], cache_key: str = ""
+    ) -> bool:
+        """
+        Load a long term cache previously saved with save_to_directory(). Loaded surfaces are
+        added to whatever is already cached, with no users.
+
+        :param directory: The directory to load from.
+        :param cache_key: Must match the key the cache was saved with, otherwise nothing is
+                          loaded.
+
+        :return: True if a saved cache was found and loaded.
+        """
+        index_path = os.path.join(directory, self.persistent_index_file_name)
+        if not os.path.isfile(index_path):
+            return False
+        try:
+            with open(index_path, "r", encoding="utf-8") as index_file:
+                index_data = json.load(index_file)
+            if (
+                index_data.get("format_version") != self.persistent_format_version
+                or index_data.get("cache_key") != cache_key
+            ):
+                return False
+            loaded_surfaces = [
+                pygame.image.load(os.path.join(directory, surface_data["file_name"]))
+                for surface_data in index_data["surfaces"]
+            ]
+            if (
+                not self.cache_long_term_lookup
+                and tuple(index_data["surface_size"]) == self.cache_surface_size
+                and len(loaded_surfaces) <= self.max_cache_surfaces
+            ):
+                self._restore_cache_surfaces(index_data, loaded_surfaces)
+                return True
+
+            # tallest first packs quicker, and more tightly
+            entries = sorted(
+                index_data["entries"],
+                key=lambda entry: (entry["rect"][3], entry["rect"][2]),
+                reverse=True,
+            )
+            for entry in entries:
+                string_id = self._cache_id_from_json(entry["key"])
+                rect = pygame.Rect(entry["rect"])
+                if (
+                    string_id in self.cache_long_term_lookup
+                    or rect.width > self.cache_surface_size[0]
+                    or rect.height > self.cache_surface_size[1]
+                ):
+                    continue
+                self.add_surface_to_long_term_cache(
+                    {
+                        "surface": loaded_surfaces[entry["surface"]].subsurface(rect),
+                        "uses": 0,
+                    },
+                    string_id,
+                )
+        except (
+            OSError, pygame.error, ValueError, KeyError, IndexError, TypeError
+        ) as error:
+            warnings.warn(f"Unable to load shape cache from {directory}: {error}")
+            return False
+        return True
+
+    def _restore_cache_surfaces(
+        self, index_data: Dict[str, Any], loaded_surfaces: List[pygame.Surface]
+    ):
+        """
+        Replace our empty long term cache with saved cache surfaces, exactly as they were.
+
+        :param index_data: The loaded index.
+        :param loaded_surfaces: The loaded cache surface images.
+        """
+        self._abandon_defragmenting()
+        self.cache_surfaces = []
+        for surface_data, loaded_surface in zip(
+            index_data["surfaces"], loaded_surfaces
+        ):
+            cache_surface = self._create_cache_surface()
+            cache_surface["surface"].blit(
+                loaded_surface, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED
+            )
+            cache_surface["packer"].free_rects = [
+                pygame.Rect(free_rect) for free_rect in surface_data["free_rects"]
+            ]
+            self.cache_surfaces.append(cache_surface)
+
+        for entry in index_data["entries"]:
+            cache_surface = self.cache_surfaces[entry["surface"]]
+            rect = pygame.Rect(entry["rect"])
+            cache_surface["packer"].used_area += rect.width * rect.height
+            cache_surface["packer"].used_count += 1
+            lt_cached_item: LongTermCacheUsageData = {
+                "surface": cache_surface["surface"].subsurface(rect),
+                "current_uses": 0,
+                "total_uses": 0,
+                "last_access": 0,
+                "priority": 0.0,
+            }
+            self.cache_long_term_lookup[self._cache_id_from_json(entry["key"])] = (
+                lt_cached_item
+            )
+            self._record_access(lt_cached_item)
+
+        if not self.cache_surfaces:
+            self.cache_surfaces.append(self._create_cache_surface())
+
+    @staticmethod
+    def _cache_id_to_json(string_id: SurfaceCacheID) -> Dict[str, Any]:
+        """
+        Convert a cache ID to something we can save as JSON.
+        """
+        if isinstance(string_id, ShapeCacheKey):
+            return {"shape_key": string_id.values}
+        return {"string_id": string_id}
+
+    @staticmethod
+    def _cache_id_from_json(json_id: Dict[str, Any]) -> SurfaceCacheID:
+        """
+        Convert a cache ID loaded from JSON back into a cache ID. JSON turns all the tuples
+        in a shape key into lists, so they need turning back.
+        """
+        if "shape_key" in json_id:
+            return ShapeCacheKey.from_values(
+                tuple(
+                    tuple(value) if isinstance(value, list) else value
+                    for value in json_id["shape_key"]
+                )
+            )
+        return json_id["string_id"]
+
+    @staticmethod
+    def build_cache_key(
+        shape: str,
+        size: Tuple[int, int],
+        shadow_width: int,
+        border_widths: Dict[str, int],
+        border_colour: Union[pygame.Color, ColourGradient],
+        bg_colour: Union[pygame.Color, ColourGradient],
+        corner_radius: Optional[List[int]] = None,
+    ) -> ShapeCacheKey:
+        """
+        Create a hashable key for a surface based on its dimensions and parameters. Quicker to
+        build and to look up than the strings made by build_cache_id().
+
+        :param shape: A string for the overall shape of the surface (rounded rectangle,
+         rectangle, etc.).
+        :param size: The dimensions of the surface.
+        :param shadow_width: The thickness of the shadow around the shape.
+        :param border_widths: The thickness of the borders around the shape, a dictionary
+         with per-side widths.
+        :param border_colour: The colour of the border.
+        :param bg_colour: The background, or main colour of the surface.
+        :param corner_radius: Optional corner radius parameter, only used for rounded rectangles.
+
+        :return: The key.
+        """
+        return ShapeCacheKey(
+            shape,
+            size,
+            shadow_width,
+            border_widths,
+            border_colour,
+            bg_colour,
+            corner_radius,
+        )
+
     @staticmethod
     def build_cache_id(
         shape: str,
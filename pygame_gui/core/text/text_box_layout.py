@@ -92,7 +92,8 @@ class TextBoxLayout:
             None  # only need this if we apply non-255 alpha
         )
 
-        self.plain_text = ""
+        # built from the layout rows when first asked for after they change
+        self._plain_text: Optional[str] = ""
 
         self.layout_rect_queue = self.input_data_rect_queue.copy()
         current_row = TextBoxLayoutRow(
@@ -137,15 +138,24 @@ class TextBoxLayout:
             "#FFFFFFFF"
         )
 
-    def _update_plain_text(self):
-        plain_text = ""
-        for row in self.layout_rows:
-            for item in row.items:
-                if isinstance(item, (TextLineChunkFTFont, HyperlinkTextChunk)):
-                    plain_text += item.text
-                if isinstance(item, LineBreakLayoutRect):
-                    plain_text += "\n"
-        self.plain_text = plain_text
+    @property
+    def plain_text(self) -> str:
+        """
+        The text of the layout without any styling, with line breaks as new lines.
+
+        This is only worked out when asked for, so laying out many rows, like appending to a
+        long log, doesn't have to gather up all the text again each time.
+        """
+        if self._plain_text is None:
+            text_parts = []
+            for row in self.layout_rows:
+                for item in row.items:
+                    if isinstance(item, (TextLineChunkFTFont, HyperlinkTextChunk)):
+                        text_parts.append(item.text)
+                    if isinstance(item, LineBreakLayoutRect):
+                        text_parts.append("\n")
+            self._plain_text = "".join(text_parts)
+        return self._plain_text
 
     def _reprocess_layout_rows(self, from_index, row_to_process_from):
         if len(self.layout_rows) <= 1:
@@ -223,7 +233,7 @@ class TextBoxLayout:
         if self.dynamic_height:
             self.view_rect.height = self.layout_rect.height
 
-        self._update_plain_text()
+        self._plain_text = None
 
     def _add_row_to_layout(self, current_row: TextBoxLayoutRow, last_row=False):
         # handle an empty row being added to layout
@@ -236,12 +246,14 @@ class TextBoxLayout:
                     font=current_row.fall_back_font,
                 )
             )
-        if current_row not in self.layout_rows:
+        # rows are indexed by their position in the layout
+        if current_row.row_index >= len(self.layout_rows):
             self.layout_rows.append(current_row)
         self.layout_rect.height = max(
             self.layout_rect.height, current_row.bottom - self.layout_rect.y
         )
-        self._refresh_row_letter_counts()
+        # rows before this one are left as they were when it was started
+        self._refresh_row_letter_counts(current_row.row_index)
         if len(current_row.items) != 0:
             self.last_row_height = current_row.items[-1].height
         else:
@@ -1577,10 +1589,11 @@ class TextBoxLayout:
 
         return None, 0
 
-    def _refresh_row_letter_counts(self):
-        self.row_lengths = []
-        cumulative_length = 0
-        for row in self.layout_rows:
+    def _refresh_row_letter_counts(self, from_row_index: int = 0):
+        from_row_index = min(from_row_index, len(self.row_lengths))
+        del self.row_lengths[from_row_index:]
+        cumulative_length = self.row_lengths[-1] if self.row_lengths else 0
+        for row in self.layout_rows[from_row_index:]:
             cumulative_length += row.letter_count
             self.row_lengths.append(cumulative_length)
         self.letter_count = cumulative_length
@@ -1600,14 +1613,47 @@ class TextBoxLayout:
         self._process_layout_queue(new_queue, last_row)
         if self.finalised_surface is not None:
             if (
-                self.layout_rect.width + self.edit_buffer,
-                self.layout_rect.height,
-            ) != self.finalised_surface.get_size():
+                self.layout_rect.width + self.edit_buffer
+                != self.finalised_surface.get_width()
+            ):
                 self.finalise_to_new()
             else:
+                if self.layout_rect.height > self.finalised_surface.get_height():
+                    self._grow_finalised_surface()
                 for row in self.layout_rows[last_row.row_index :]:
                     row.finalise(self.finalised_surface)
 
+    def _grow_finalised_surface(self):
+        """
+        Move what we have already finalised onto a new, taller, surface so that rows appended
+        to the bottom of the layout can be finalised on their own rather than finalising the
+        whole layout again.
+
+        The new surface is at least double the height of the old one, so a layout that grows a
+        row at a time, like a log, only has to be copied every so often.
+        """
+        old_surface = self.finalised_surface
+        self.finalised_surface = pygame.surface.Surface(
+            (
+                old_surface.get_width(),
+                max(self.layout_rect.height, old_surface.get_height() * 2),
+            ),
+            depth=32,
+            flags=pygame.SRCALPHA,
+        )
+        self.finalised_surface.fill("#00000000")
+        basic_blit(self.finalised_surface, old_surface, (0, 0))
+
+        # anything already finalised keeps hold of its surface so it can redraw itself
+        for layout_rect in self.floating_rects + [
+            item for row in self.layout_rows for item in row.items
+        ]:
+            if getattr(layout_rect, "target_surface", None) is old_surface:
+                layout_rect.target_surface = self.finalised_surface
+        for row in self.layout_rows:
+            if row.target_surface is old_surface:
+                row.target_surface = self.finalised_surface
+
     def redraw_other_chunks(self, not_these_chunks):
         """
         Useful for text effects.
@@ -12,7 +12,8 @@ chunk onto it's final destination.
 
 """
 
-from typing import Optional, Union, Tuple, List
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Union, Tuple, List
 
 import pygame
 from pygame import Color, Surface, Rect, BLEND_PREMULTIPLIED, BLEND_RGBA_MULT, SRCALPHA
@@ -28,6 +29,11 @@ class TextLineChunkFTFont(TextLayoutRect):
     A Text line chunk (text on the same horizontal line in the same style)
     """
 
+    prefix_width_block_size = 64
+    max_cached_shadow_masks = 64
+    # composed text shadows, shared by all chunks, least recently used first
+    _shadow_masks: Dict[tuple, Surface] = {}
+
     def __init__(
         self,
         text: str,
@@ -71,6 +77,10 @@ class TextLineChunkFTFont(TextLayoutRect):
         ]
         self.letter_count = len(self.text)
 
+        # approximate widths of each prefix of the text, built when first needed
+        self._prefix_widths: Optional[List[float]] = None
+        self._prefix_widths_text: Optional[str] = None
+
         self.target_surface: Optional[Surface] = None
         self.target_surface_area: Optional[Rect] = None
         self.row_chunk_origin = 0
@@ -424,61 +434,92 @@ class TextLineChunkFTFont(TextLayoutRect):
         if self.text_shadow_data is not None and self.text_shadow_data[0] != 0:
             shadow_size = self.text_shadow_data[0]
             shadow_offset = (self.text_shadow_data[1], self.text_shadow_data[2])
-            shadow_colour = self.shadow_colour
             # we have a shadow
+            shadow_mask = self._get_shadow_mask(
+                text_str, text_surface.get_size(), origin, shadow_size
+            )
+            surface.blit(
+                shadow_mask,
+                (
+                    text_rect.x + shadow_offset[0] - shadow_size,
+                    text_rect.y + shadow_offset[1] - shadow_size,
+                ),
+                special_flags=BLEND_PREMULTIPLIED,
+            )
 
+    def _get_shadow_mask(
+        self,
+        text_str: str,
+        text_size: Tuple[int, int],
+        origin: Tuple[int, int],
+        shadow_size: int,
+    ) -> Surface:
+        """
+        Get the shadow for some text, spread out by the shadow size, on a surface shadow_size
+        pixels larger than the text on each side.
+
+        The shadow is made by stacking copies of the text offset vertically, horizontally and
+        along both diagonals. As premultiplied blending is associative we can stack them once
+        onto a clear surface, cache that, and then draw the whole shadow with a single blit
+        every time the chunk is redrawn.
+
+        :param text_str: The text to make the shadow of.
+        :param text_size: The size of the surface the text is rendered to.
+        :param origin: The position of the text on that surface.
+        :param shadow_size: How far the shadow spreads out from the text.
+
+        :return: The shadow surface.
+        """
+        shadow_colour = self.shadow_colour
+        mask_key = (
+            text_str,
+            self.font,
+            shadow_size,
+            tuple(shadow_colour) if isinstance(shadow_colour, Color) else shadow_colour,
+            text_size,
+            origin,
+        )
+        shadow_mask = TextLineChunkFTFont._shadow_masks.pop(mask_key, None)
+        if shadow_mask is None:
             shadow_surface = self.font.render_premul_to(
                 text_str,
                 shadow_colour,
-                surf_size=text_surface.get_size(),
+                surf_size=text_size,
                 surf_position=origin,
             )
-
-            for y_pos in range(-shadow_size, shadow_size + 1):
-                shadow_text_rect = Rect(
-                    (
-                        text_rect.x + shadow_offset[0],
-                        text_rect.y + shadow_offset[1] + y_pos,
-                    ),
-                    text_rect.size,
-                )
-
-                surface.blit(
-                    shadow_surface, shadow_text_rect, special_flags=BLEND_PREMULTIPLIED
-                )
-            for x_pos in range(-shadow_size, shadow_size + 1):
-                shadow_text_rect = Rect(
-                    (
-                        text_rect.x + shadow_offset[0] + x_pos,
-                        text_rect.y + shadow_offset[1],
-                    ),
-                    text_rect.size,
-                )
-                surface.blit(
-                    shadow_surface, shadow_text_rect, special_flags=BLEND_PREMULTIPLIED
-                )
-            for x_and_y in range(-shadow_size, shadow_size + 1):
-                shadow_text_rect = Rect(
-                    (
-                        text_rect.x + shadow_offset[0] + x_and_y,
-                        text_rect.y + shadow_offset[1] + x_and_y,
-                    ),
-                    text_rect.size,
-                )
-                surface.blit(
-                    shadow_surface, shadow_text_rect, special_flags=BLEND_PREMULTIPLIED
-                )
-            for x_and_y in range(-shadow_size, shadow_size + 1):
-                shadow_text_rect = Rect(
+            shadow_mask = Surface(
+                (text_size[0] + (2 * shadow_size), text_size[1] + (2 * shadow_size)),
+                flags=SRCALPHA,
+                depth=32,
+            )
+            shadow_mask.fill(Color("#00000000"))
+            spread = range(-shadow_size, shadow_size + 1)
+            offsets = (
+                [(0, y_pos) for y_pos in spread]
+                + [(x_pos, 0) for x_pos in spread]
+                + [(x_and_y, x_and_y) for x_and_y in spread]
+                + [(-x_and_y, x_and_y) for x_and_y in spread]
+            )
+            shadow_mask.blits(
+                [
                     (
-                        text_rect.x + shadow_offset[0] - x_and_y,
-                        text_rect.y + shadow_offset[1] + x_and_y,
-                    ),
-                    text_rect.size,
-                )
-                surface.blit(
-                    shadow_surface, shadow_text_rect, special_flags=BLEND_PREMULTIPLIED
-                )
+                        shadow_surface,
+                        (shadow_size + x_offset, shadow_size + y_offset),
+                        None,
+                        BLEND_PREMULTIPLIED,
+                    )
+                    for x_offset, y_offset in offsets
+                ],
+                doreturn=False,
+            )
+            while len(TextLineChunkFTFont._shadow_masks) >= max(
+                1, TextLineChunkFTFont.max_cached_shadow_masks
+            ):
+                del TextLineChunkFTFont._shadow_masks[
+                    next(iter(TextLineChunkFTFont._shadow_masks))
+                ]
+        TextLineChunkFTFont._shadow_masks[mask_key] = shadow_mask
+        return shadow_mask
 
     def split(
         self,
@@ -500,14 +541,7 @@ class TextLineChunkFTFont(TextLayoutRect):
         :param allow_split_dashes: whether we allow text to be split with dashes either side.
                                    allowing this makes direct text editing more annoying.
         """
-        # starting heuristic: find the percentage through the chunk width of this split request
-        percentage_split = 0.0
-        if self.width != 0:
-            percentage_split = float(requested_x) / float(self.width)
-
-        optimum_split_point = self._find_optimum_split_point(
-            percentage_split, requested_x
-        )
+        optimum_split_point = self._find_optimum_split_point(requested_x)
 
         split_text_ok = False
         left_side = ""
@@ -557,52 +591,85 @@ class TextLineChunkFTFont(TextLayoutRect):
         else:
             return None
 
-    def _find_optimum_split_point(self, percentage_split, requested_x):
-        # Now we need to search for the perfect split point
-        # perfect split point is a) less than or equal requested x, b) as close to it as possible
-        # because split points will be in order we can test and decided to move left or right until
-        # we find the optimum point.
-        optimum_split_point = 0
-        current_split_point_index = int(
-            percentage_split * len(self.split_points)
-        )  # start with approximate position
-        tested_points: List[int] = []
-        valid_points: List[int] = []
-        found_optimum = False
-        max_split_point_index = len(self.split_points) - 1
-        while not found_optimum and len(self.split_points) > 0:
-            optimum_split_point = self.split_points[current_split_point_index]
-
-            if optimum_split_point in tested_points:
-                # already tested this one, so we must have changed direction after crossing the
-                # requested_x line. the last valid point must be the optimum split point.
-                if not valid_points:
-                    raise RuntimeError(
-                        "Unable to find valid split point for text layout"
-                    )
-                found_optimum = True
-                optimum_split_point = valid_points[-1]
-            else:
-                width, _ = self.font.get_rect(self.text[:optimum_split_point]).size
-                if (
-                    width < requested_x
-                    and current_split_point_index <= max_split_point_index
-                ):
-                    # we are below the required width so we move right
-                    valid_points.append(optimum_split_point)
-                    if current_split_point_index < max_split_point_index:
-                        current_split_point_index += 1
-                elif width > requested_x and current_split_point_index > 0:
-                    current_split_point_index -= 1
-                elif width == requested_x:
-                    # the split point is right on the requested width
-                    found_optimum = True
-                else:
-                    # no valid point
-                    found_optimum = True
-                    optimum_split_point = 0
-                tested_points.append(optimum_split_point)
-        return optimum_split_point
+    def _find_optimum_split_point(self, requested_x):
+        # the perfect split point is a) less than or equal requested x, b) as close to it as
+        # possible. We binary search the prefix width table for it, then check the guess, and
+        # its neighbours if need be, against the real rendered widths.
+        if not self.split_points:
+            return 0
+        prefix_widths = self._get_prefix_widths(requested_x)
+        # the table may stop short once past requested_x, as may our estimates
+        estimated_widths = [
+            prefix_widths[point]
+            for point in self.split_points
+            if point < len(prefix_widths)
+        ]
+        estimated_index = bisect_right(estimated_widths, requested_x) - 1
+        split_point_index = estimated_index
+        while (
+            split_point_index >= 0
+            and self._get_prefix_render_width(self.split_points[split_point_index])
+            > requested_x
+        ):
+            split_point_index -= 1
+        if split_point_index == estimated_index:
+            while (
+                split_point_index + 1 < len(self.split_points)
+                and self._get_prefix_render_width(
+                    self.split_points[split_point_index + 1]
+                )
+                <= requested_x
+            ):
+                split_point_index += 1
+        if split_point_index < 0:
+            return 0
+        return self.split_points[split_point_index]
+
+    def _get_prefix_widths(self, up_to_width: Optional[float] = None) -> List[float]:
+        """
+        Get the approximate widths of the prefixes of this chunk's text, so that
+        self._get_prefix_widths()[n] is roughly the width of self.text[:n].
+
+        The table is built a block of characters at a time from the font's per glyph
+        advances, with the difference kerning makes to the width of each block spread evenly
+        across it. It is kept, and only extended as far as it is needed, until the text
+        changes. That keeps splitting long chunks down into lines from measuring all of the
+        text after every split.
+
+        :param up_to_width: Only make sure the table covers prefixes up to this width,
+                            rather than the whole text.
+        """
+        if self._prefix_widths is None or self._prefix_widths_text is not self.text:
+            self._prefix_widths = [0.0]
+            self._prefix_widths_text = self.text
+        prefix_widths = self._prefix_widths
+        while len(prefix_widths) <= len(self.text) and (
+            up_to_width is None or prefix_widths[-1] <= up_to_width
+        ):
+            block_start = len(prefix_widths) - 1
+            block_end = min(len(self.text), block_start + self.prefix_width_block_size)
+            glyph_metrics = self.font.get_metrics(self.text[block_start:block_end])
+            advance_total = prefix_widths[-1]
+            block_widths = []
+            for index in range(block_end - block_start):
+                if index < len(glyph_metrics) and glyph_metrics[index] is not None:
+                    advance_total += glyph_metrics[index][4]
+                block_widths.append(advance_total)
+            kerning_correction = (
+                self._get_prefix_render_width(block_end) - advance_total
+            ) / len(block_widths)
+            prefix_widths.extend(
+                width + (kerning_correction * (index + 1))
+                for index, width in enumerate(block_widths)
+            )
+        return prefix_widths
+
+    def _get_prefix_render_width(self, letter_index: int) -> int:
+        return self.font.get_rect(self.text[:letter_index]).width
+
+    def _get_prefix_distance_to_x(self, letter_index: int, x_pos: float) -> float:
+        text_rect = self.font.get_rect(self.text[:letter_index])
+        return abs((text_rect.x + text_rect.width) - x_pos)
 
     def split_index(self, index):
         """
@@ -738,6 +805,7 @@ class TextLineChunkFTFont(TextLayoutRect):
 
     def _update_chunk_count_splits_and_size(self):
         self.letter_count = len(self.text)
+        self._prefix_widths = None
         # we split text strings based on spaces
         self.split_points = [
             pos + 1 for pos, char in enumerate(self.text) if char == " "
@@ -752,31 +820,27 @@ class TextLineChunkFTFont(TextLayoutRect):
         """
 
         chunk_space_x = x_pos - self.x
-        percentage = chunk_space_x / self.width
-        estimated_index = int(round(len(self.text) * percentage))
-        best_index = estimated_index
-        text_rect = self.font.get_rect(self.text[:best_index])
-        width_to_index = text_rect.x + text_rect.width
-        lowest_diff = abs(width_to_index - chunk_space_x)
-
-        check_dir = -1
-        changed_dir = 0
-        step = 1
-        new_index = best_index
-        # algorithm picks a good guess for the best letter
-        # index and then checks either side for better indexes
-        while changed_dir < 2 and new_index != 0:
-            new_index = max(estimated_index + (step * check_dir), 0)
-            curr_text_rect = self.font.get_rect(self.text[:new_index])
-            new_diff = abs((curr_text_rect.x + curr_text_rect.width) - chunk_space_x)
-            if new_diff < lowest_diff:
+        prefix_widths = self._get_prefix_widths(chunk_space_x)
+        # binary search the prefix width table for a good guess at the best letter
+        # index and then check either side of it for better indexes
+        best_index = min(
+            bisect_left(prefix_widths, chunk_space_x), len(prefix_widths) - 1
+        )
+        if best_index > 0 and (
+            chunk_space_x - prefix_widths[best_index - 1]
+            < prefix_widths[best_index] - chunk_space_x
+        ):
+            best_index -= 1
+        lowest_diff = self._get_prefix_distance_to_x(best_index, chunk_space_x)
+        for check_dir in (-1, 1):
+            new_index = best_index + check_dir
+            while 0 <= new_index <= len(self.text):
+                new_diff = self._get_prefix_distance_to_x(new_index, chunk_space_x)
+                if new_diff >= lowest_diff:
+                    break
                 lowest_diff = new_diff
                 best_index = new_index
-                step += 1
-            else:
-                check_dir *= -1
-                changed_dir += 1
-                step = 1
+                new_index += check_dir
         return best_index
 
     def redraw(self):
@@ -0,0 +1,78 @@
+from typing import Any, Dict, Hashable, Optional, Union
+
+
+class TextMeasurementCache:
+    """
+    A bounded store of text measurements for a single font, dropping the least recently used
+    measurement when it is full.
+
+    Measuring a string is a pure function of the font, its size & style and the string, so the
+    layout code's many repeated measurements of the same words and labels can be answered from
+    here rather than by the font library.
+
+    :param max_measurements: The most measurements to keep before dropping old ones.
+    """
+
+    def __init__(self, max_measurements: int = 4096):
+        self.max_measurements = max_measurements
+        self._measurements: Dict[Hashable, Any] = {}
+
+        self._hits = 0
+        self._misses = 0
+
+    def find_measurement(self, key: Hashable) -> Optional[Any]:
+        """
+        Look for a measurement in the cache, marking it as recently used if it is found.
+
+        :param key: The key the measurement was stored under.
+
+        :return: The measurement, or None if it isn't in the cache.
+        """
+        measurement = self._measurements.pop(key, None)
+        if measurement is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._measurements[key] = measurement
+        return measurement
+
+    def add_measurement(self, key: Hashable, measurement: Any):
+        """
+        Add a measurement to the cache, dropping the least recently used one if we are full.
+
+        :param key: The key to store the measurement under.
+        :param measurement: The measurement.
+        """
+        if key not in self._measurements:
+            while len(self._measurements) >= max(1, self.max_measurements):
+                del self._measurements[next(iter(self._measurements))]
+        self._measurements[key] = measurement
+
+    def clear(self):
+        """
+        Empty the cache of all measurements.
+        """
+        self._measurements.clear()
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get statistics on how well the cache is working.
+
+        :return: A dictionary with the 'hits', 'misses', 'hit_rate', 'count' of stored
+                 measurements and 'max_measurements'.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / lookups) if lookups > 0 else 0.0,
+            "count": len(self._measurements),
+            "max_measurements": self.max_measurements,
+        }
+
+    def reset_stats(self):
+        """
+        Reset the hit and miss counters.
+        """
+        self._hits = 0
+        self._misses = 0
@@ -1,3 +1,4 @@
+import hashlib
 import json
 import io
 import os
@@ -894,6 +895,25 @@ class UIThemeValidator:
         return errors
 
 
+def _merge_theme_data(current_data: Dict[str, Any], new_data: Dict[str, Any]):
+    """
+    Merge theme data over the top of existing theme data, the way loading it overrides the
+    theming blocks and values it mentions and leaves the rest alone.
+
+    :param current_data: The existing data, changed in place.
+    :param new_data: The data to merge over it.
+    """
+    for key, value in new_data.items():
+        current_value = current_data.get(key)
+        if isinstance(value, dict) and isinstance(current_value, dict):
+            _merge_theme_data(current_value, value)
+        elif isinstance(value, dict):
+            current_data[key] = {}
+            _merge_theme_data(current_data[key], value)
+        else:
+            current_data[key] = value
+
+
 class UIAppearanceTheme(IUIAppearanceThemeInterface):
     """
     The Appearance Theme class handles all the data that styles and generally dictates the
@@ -941,6 +961,9 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         self._theme_file_last_modified: float = 0.0
         self._theme_file_path: Optional[str | PackageResource] = None
+        # all the theme data loaded so far, later data merged over the top of earlier data
+        self._theme_data: Dict[str, Any] = {}
+        self._theme_data_hash = ""
 
         self._load_default_theme_file()
 
@@ -987,6 +1010,7 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
     ):
         # parse new_theming data
         theme_dict = self._json_to_dict(new_theming_data)
+        self._record_theme_data(theme_dict)
         self._parse_theme_data_from_json_dict(theme_dict)
         if rebuild_all:
             self.need_to_rebuild_data_manually_changed = True
@@ -995,6 +1019,7 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         self, element_name: str, new_theming_data: Union[str, dict]
     ):
         element_theming_dict = self._json_to_dict(new_theming_data)
+        self._record_theme_data({element_name: element_theming_dict})
 
         self._parse_single_element_data(element_name, element_theming_dict)
         self._load_fonts_images_and_shadow_edges()
@@ -1992,8 +2017,31 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
             theme_dict = loaded_theme_dict
 
+        self._record_theme_data(theme_dict)
         self._parse_theme_data_from_json_dict(theme_dict)
 
+    def _record_theme_data(self, theme_dict: Dict[str, Any]):
+        """
+        Merge newly loaded theme data over the data we already have, and update the hash of it.
+        Loading the same data again, for example when reloading a theme file that hasn't
+        changed, leaves the hash as it was.
+
+        :param theme_dict: The theme data being loaded.
+        """
+        _merge_theme_data(self._theme_data, theme_dict)
+        self._theme_data_hash = hashlib.sha256(
+            json.dumps(self._theme_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def get_theme_data_hash(self) -> str:
+        """
+        Get a hash of the theme data currently in this theme. Useful for telling if anything
+        drawn with the theme could have changed.
+
+        :return: The hash, as a hex string.
+        """
+        return self._theme_data_hash
+
     def _load_theme_by_path(
         self, file_path: Union[str, os.PathLike, io.StringIO, PackageResource]
     ) -> Optional[dict]:
@@ -1,6 +1,6 @@
 import warnings
 
-from typing import List, Union, Tuple, Dict, Any, Callable, Set, Optional
+from typing import List, Union, Tuple, Dict, Any, Callable, Set, Optional, FrozenSet
 from typing import TYPE_CHECKING
 
 import pygame
@@ -24,6 +24,18 @@ if TYPE_CHECKING:
     from pygame_gui.core.drawable_shapes.drawable_shape import DrawableShape
 
 
+def _first_class_defining(cls: type, name: str) -> type:
+    """
+    Find the class in a class's method resolution order that an attribute or method comes from.
+
+    :param cls: The class to search.
+    :param name: The attribute or method name.
+
+    :return: The class that defines it.
+    """
+    return next(klass for klass in cls.__mro__ if name in klass.__dict__)
+
+
 class UIElement(GUISprite, IUIElementInterface):
     """
     The base class for all UI elements in pygame_gui. UIElement provides core functionality for
@@ -101,6 +113,10 @@ class UIElement(GUISprite, IUIElementInterface):
     :param ignore_shadow_for_initial_size_and_pos: Whether to ignore the shadow when calculating initial size and position.
     """
 
+    # The event types process_event() reacts to. Subclasses that override process_event() should
+    # set this as well, or they will be passed every event to be on the safe side.
+    handled_event_types: FrozenSet[int] = frozenset()
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -164,7 +180,7 @@ class UIElement(GUISprite, IUIElementInterface):
 
         self.layer_thickness = layer_thickness
         self.starting_height = starting_height
-        self.drawable_shape: Optional[DrawableShape] = None
+        self._drawable_shape: Optional[DrawableShape] = None
 
         self.is_enabled = True
 
@@ -238,7 +254,6 @@ class UIElement(GUISprite, IUIElementInterface):
         self.hover_time = 0.0
 
         self.pre_debug_image: Optional[pygame.Surface] = None
-        self._pre_clipped_image: Optional[pygame.Surface] = None
 
         self._image_clip: Optional[pygame.Rect] = None
 
@@ -891,6 +906,7 @@ class UIElement(GUISprite, IUIElementInterface):
 
         self.rect.left = new_left
         self.rect.top = new_top
+        self._on_rect_changed()
 
         if change_dimensions and self._recent_anchor_driven_dimension_changes <= 3:
             new_width, new_height = self._get_clamped_to_minimum_dimensions(
@@ -900,6 +916,7 @@ class UIElement(GUISprite, IUIElementInterface):
                 new_width != self.relative_rect.width
             ):
                 self._recent_anchor_driven_dimension_changes += 1
+                self.wake_up()  # our update() resets the count
                 self.set_dimensions((new_width, new_height))
 
     def _update_relative_rect_position_from_anchors(self, recalculate_margins=False):
@@ -1079,6 +1096,7 @@ class UIElement(GUISprite, IUIElementInterface):
         """
         self.rect.x = int(position[0])
         self.rect.y = int(position[1])
+        self._on_rect_changed()
         self._update_relative_rect_position_from_anchors(recalculate_margins=True)
 
         if self.drawable_shape is not None:
@@ -1173,6 +1191,7 @@ class UIElement(GUISprite, IUIElementInterface):
         self.relative_rect.width = int(dimensions[0])
         self.relative_rect.height = int(dimensions[1])
         self.rect.size = self.relative_rect.size
+        self._on_rect_changed()
 
         if self.relative_rect.width >= 0 and self.relative_rect.height >= 0:
             self._update_absolute_rect_position_from_anchors(recalculate_margins=True)
@@ -1180,7 +1199,7 @@ class UIElement(GUISprite, IUIElementInterface):
             if self.drawable_shape is not None and self.drawable_shape.set_dimensions(
                 self.relative_rect.size
             ):
-                self._set_image(self.drawable_shape.get_fresh_surface())
+                self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
             self._update_container_clip()
             if self.ui_container is not None:
@@ -1200,6 +1219,66 @@ class UIElement(GUISprite, IUIElementInterface):
             if self.drawable_shape.has_fresh_surface():
                 self.on_fresh_drawable_shape_ready()
 
+    def can_sleep(self) -> bool:
+        """
+        Check if this element has nothing left to do in update() until something wakes it up.
+        Elements with a drawable shape wake up when it has rebuilding or transitions to do.
+
+        Subclasses that override update() should also override can_sleep(), otherwise they are
+        updated every loop to be on the safe side.
+
+        :return: True if this element can be skipped by the UI manager's update.
+        """
+        return self._has_sleep_aware_update() and (
+            self._drawable_shape is None or self._drawable_shape.is_idle()
+        )
+
+    @classmethod
+    def _has_sleep_aware_update(cls) -> bool:
+        if "_resolved_has_sleep_aware_update" not in cls.__dict__:
+            cls._resolved_has_sleep_aware_update = issubclass(
+                _first_class_defining(cls, "can_sleep"),
+                _first_class_defining(cls, "update"),
+            )
+        return cls._resolved_has_sleep_aware_update
+
+    @property
+    def drawable_shape(self) -> Optional["DrawableShape"]:
+        """
+        The shape that draws this element, if it has one.
+        """
+        return self._drawable_shape
+
+    @drawable_shape.setter
+    def drawable_shape(self, shape: Optional["DrawableShape"]):
+        if self._drawable_shape is not None and self._drawable_shape is not shape:
+            # don't spend redraw time on a shape we no longer use
+            self.ui_manager.get_shape_redraw_scheduler().unschedule(
+                self._drawable_shape
+            )
+        self._drawable_shape = shape
+        if shape is not None:
+            shape.wake_up_callback = self.wake_up
+            shape.visibility_callback = self._is_on_screen
+        self.wake_up()
+
+    def _is_on_screen(self) -> bool:
+        """
+        Check if this element may currently be seen, that is it is alive, visible, not
+        completely clipped away by its container and overlaps the window.
+
+        :return: True if the element may be seen.
+        """
+        if not self.alive() or not self.visible:
+            return False
+        if self._image_clip is not None and (
+            self._image_clip.width == 0 or self._image_clip.height == 0
+        ):
+            return False
+        return self.rect.colliderect(
+            pygame.Rect((0, 0), self.ui_manager.window_resolution)
+        )
+
     def change_layer(self, new_layer: int):
         """
         Changes the layer this element is on.
@@ -1221,6 +1300,8 @@ class UIElement(GUISprite, IUIElementInterface):
         if self.ui_container is not None:
             self.ui_container.get_container().remove_element(self)
         self.remove_element_from_focus_set(self)
+        if self._drawable_shape is not None:
+            self.ui_manager.get_shape_redraw_scheduler().unschedule(self._drawable_shape)
         super().kill()
 
     def check_hover(self, time_delta: float, hovered_higher_element: bool) -> bool:
@@ -1266,7 +1347,7 @@ class UIElement(GUISprite, IUIElementInterface):
         because sometimes we defer rebuilding until a more advantageous (read quieter) moment.
         """
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
     def on_hovered(self):
         """
@@ -1401,6 +1482,25 @@ class UIElement(GUISprite, IUIElementInterface):
         """
         return False
 
+    @classmethod
+    def get_handled_event_types(cls) -> Optional[FrozenSet[int]]:
+        """
+        The pygame event types that this class of element does anything with in
+        process_event(). Comes from handled_event_types, as long as that was set on the same
+        class that process_event() was last overridden on, or a class derived from it.
+
+        :return: A set of event types, or None if this element should be passed every event.
+        """
+        if "_resolved_handled_event_types" not in cls.__dict__:
+            declaring_class = _first_class_defining(cls, "handled_event_types")
+            processing_class = _first_class_defining(cls, "process_event")
+            cls._resolved_handled_event_types = (
+                declaring_class.__dict__["handled_event_types"]
+                if issubclass(declaring_class, processing_class)
+                else None
+            )
+        return cls._resolved_handled_event_types
+
     def focus(self):
         """
         Set this element as the focused element in the UI.
@@ -1648,7 +1748,7 @@ class UIElement(GUISprite, IUIElementInterface):
             self._visual_debug_mode = False
 
     def _put_visual_debug_text_onto_element(self, layer_text_render):
-        self.pre_debug_image = self.image.copy()
+        self.pre_debug_image = self.image
         # check if our surface is big enough to hold the debug info,
         # if not make a new, bigger copy
         make_new_larger_surface = False
@@ -1667,7 +1767,11 @@ class UIElement(GUISprite, IUIElementInterface):
             )
             basic_blit(new_surface, self.image, (0, 0))
             self._set_image(new_surface)
+        else:
+            # our image may be a shared drawable shape surface, so draw on our own copy
+            self._set_image(self.image)
         basic_blit(self.image, layer_text_render, (0, 0))
+        self.dirty = 1
 
     def _clip_images_for_container(self, clip_rect: Union[pygame.Rect, None]):
         """
@@ -1690,6 +1794,9 @@ class UIElement(GUISprite, IUIElementInterface):
         Sets a clipping rectangle on this element's image determining what portion of it will
         actually be displayed when this element is blitted to the screen.
 
+        The image itself is left untouched, the clip is applied as the area of the blit when the
+        sprite group draws us.
+
         :param rect: A clipping rectangle, or None to clear the clip.
 
         """
@@ -1697,36 +1804,11 @@ class UIElement(GUISprite, IUIElementInterface):
             rect.width = max(rect.width, 0)
             rect.height = max(rect.height, 0)
 
-            if self._pre_clipped_image is None and self.image is not None:
-                self._pre_clipped_image = self.image.copy()
-
             self._image_clip = rect
-            if self.image is not None and self._pre_clipped_image is not None:
-                if self.image.get_size() != self._pre_clipped_image.get_size():
-                    self.image = pygame.Surface(
-                        self._pre_clipped_image.get_size(),
-                        flags=pygame.SRCALPHA,
-                        depth=32,
-                    )
-                self.image.fill(pygame.Color("#00000000"))
-                basic_blit(
-                    self.image,
-                    self._pre_clipped_image,
-                    self._image_clip,
-                    self._image_clip,
-                )
-
+            self._set_blit_area(self._image_clip)
         elif self._image_clip is not None:
             self._image_clip = None
-            self._set_image(self._pre_clipped_image)
-        else:
-            self._image_clip = None
-
-    def _get_pre_clipped_image_size(self) -> Coordinate:
-        if self._pre_clipped_image is not None:
-            return self._pre_clipped_image.get_size()
-        else:
-            return 0, 0
+            self._set_blit_area(None)
 
     def get_image_clipping_rect(self) -> Union[pygame.Rect, None]:
         """
@@ -1755,31 +1837,29 @@ class UIElement(GUISprite, IUIElementInterface):
 
     def _set_image(self, new_image: Union[pygame.surface.Surface, None]):
         """
-        Wraps setting the image variable of this element so that we also set the current image
-        clip on the image at the same time.
+        Wraps setting the image variable of this element. Any current image clip stays in place
+        as it is applied when the image is drawn.
+
+        The image is copied, so the element is free to draw on it.
 
         :param new_image: The new image to set.
 
         """
-        image_clipping_rect = self.get_image_clipping_rect()
-        if image_clipping_rect is not None and new_image is not None:
-            self._pre_clipped_image = new_image
-            if image_clipping_rect.width == 0 and image_clipping_rect.height == 0:
-                self.image = self.ui_manager.get_universal_empty_surface()
-            else:
-                self.image = pygame.surface.Surface(
-                    self._pre_clipped_image.get_size(), flags=pygame.SRCALPHA, depth=32
-                )
-                self.image.fill(pygame.Color("#00000000"))
-                basic_blit(
-                    self.image,
-                    self._pre_clipped_image,
-                    image_clipping_rect,
-                    image_clipping_rect,
-                )
-        else:
-            self.image = new_image.copy() if new_image is not None else None
-            self._pre_clipped_image = None
+        self.image = new_image.copy() if new_image is not None else None
+
+    def _set_image_without_copy(self, new_image: Union[pygame.surface.Surface, None]):
+        """
+        Set the image of this element without copying it. Used for drawable shape surfaces,
+        which are often shared by every element that looks the same, and for images an element
+        has just put together itself.
+
+        Nothing must draw on an image set this way; use _set_image() for images that will be
+        drawn on.
+
+        :param new_image: The new image to set.
+
+        """
+        self.image = new_image
 
     def get_top_layer(self) -> int:
         """
@@ -14,6 +14,7 @@ from pygame_gui.core.interfaces.appearance_theme_interface import FontThemeInfo
 from pygame_gui.core.resource_loaders import IResourceLoader
 from pygame_gui.core.package_resource import PackageResource
 from pygame_gui.core.utility import FontResource
+from pygame_gui.core.gui_font_pygame import GUIFontPygame
 
 
 class DefaultFontData:
@@ -107,6 +108,7 @@ class UIFontDictionary(IUIFontDictionaryInterface):
         # self.use_threaded_loading = use_threaded_loading
         # self.loading_queue = loading_queue
         self._resource_loader = resource_loader
+        self.use_glyph_atlas = False
 
         # match up two letter locale ids with a font that supports their alphabet
         self._latin_font = DefaultFontData(
@@ -674,6 +676,7 @@ class UIFontDictionary(IUIFontDictionaryInterface):
         resource = FontResource(
             font_id=font_id, size=font_size, style=font_style, location=font_loc
         )
+        resource.use_glyph_atlas = self.use_glyph_atlas
         if self._resource_loader.started() or force_immediate_load:
             error = resource.load()
             if error is not None:
@@ -764,6 +767,22 @@ class UIFontDictionary(IUIFontDictionaryInterface):
         """
         return font_id in self.loaded_fonts
 
+    def set_glyph_atlas_rendering(self, enabled: bool):
+        """
+        Switch drawing simple text from atlases of glyphs, rasterised once each, on or off for
+        all fonts, both those already loaded and those loaded later. This makes redrawing
+        frequently changing text, like counters or text being typed, much cheaper. Text that
+        can't be drawn from an atlas exactly as it would be rendered whole is still rendered
+        whole.
+
+        :param enabled: True to draw text from glyph atlases where possible.
+        """
+        self.use_glyph_atlas = enabled
+        for font_resource in self.loaded_fonts.values():
+            font_resource.use_glyph_atlas = enabled
+            if isinstance(font_resource.loaded_font, GUIFontPygame):
+                font_resource.loaded_font.use_glyph_atlas = enabled
+
     def ensure_debug_font_loaded(self):
         """
         Ensure the font we use for debugging purposes is loaded. Generally called after we start
@@ -23,6 +23,13 @@ class ShadowGenerator:
 
         self.short_term_rect_cache = {}
 
+        self._rect_hits = 0
+        self._rect_misses = 0
+        self._corner_hits = 0
+        self._corner_misses = 0
+        self._ellipse_hits = 0
+        self._ellipse_misses = 0
+
     def clear_short_term_caches(self):
         """
         Empties short term caches, so we aren't hanging on to so many surfaces.
@@ -240,7 +247,9 @@ class ShadowGenerator:
         ]
         shadow_id = "_".join(str(param) for param in params)
         if shadow_id in self.short_term_rect_cache:
+            self._rect_hits += 1
             return self.short_term_rect_cache[shadow_id]
+        self._rect_misses += 1
         final_surface = pygame.surface.Surface(
             (width, height), flags=pygame.SRCALPHA, depth=32
         )
@@ -249,7 +258,9 @@ class ShadowGenerator:
         corner_index_id = f"{shadow_width_param}x{corner_radii}"
         if corner_index_id in self.preloaded_shadow_corners:
             edges_and_corners = self.preloaded_shadow_corners[corner_index_id]
+            self._corner_hits += 1
         else:
+            self._corner_misses += 1
             edges_and_corners = self.create_shadow_corners(
                 shadow_width_param, corner_radii
             )
@@ -383,10 +394,71 @@ class ShadowGenerator:
                         closest_key = key
 
             if closest_key is not None:
+                self._ellipse_hits += 1
                 return pygame.transform.smoothscale(
                     self.created_ellipse_shadows[closest_key], size
                 )
             else:
+                self._ellipse_misses += 1
                 return self.create_new_ellipse_shadow(size[0], size[1], shadow_width)
 
         return None
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Get statistics on how often requested shadows were found already made.
+
+        Hit and miss counts are totals since the generator was created or reset_stats() was last
+        called. The rest is a snapshot of what is held right now.
+
+        :return: A dictionary of statistics -
+
+                 - 'rect_hits', 'rect_misses': finished rectangle shadows reused or made.
+                 - 'corner_hits', 'corner_misses': sets of shadow corners and edges reused or made.
+                 - 'ellipse_hits', 'ellipse_misses': ellipse shadows scaled from another or made.
+                 - 'hits', 'misses', 'hit_rate': the above added together.
+                 - 'short_term_rect_count', 'preloaded_corner_count', 'ellipse_count': the
+                   number of surfaces, or sets of surfaces, held in each cache.
+                 - 'bytes_used': the memory used by all the held surfaces.
+        """
+        hits = self._rect_hits + self._corner_hits + self._ellipse_hits
+        misses = self._rect_misses + self._corner_misses + self._ellipse_misses
+        bytes_used = sum(
+            surface.get_height() * surface.get_pitch()
+            for surface in self.short_term_rect_cache.values()
+        )
+        bytes_used += sum(
+            surface.get_height() * surface.get_pitch()
+            for surface in self.created_ellipse_shadows.values()
+        )
+        for edges_and_corners in self.preloaded_shadow_corners.values():
+            bytes_used += sum(
+                surface.get_height() * surface.get_pitch()
+                for surface in edges_and_corners.values()
+            )
+        return {
+            "rect_hits": self._rect_hits,
+            "rect_misses": self._rect_misses,
+            "corner_hits": self._corner_hits,
+            "corner_misses": self._corner_misses,
+            "ellipse_hits": self._ellipse_hits,
+            "ellipse_misses": self._ellipse_misses,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if (hits + misses) > 0 else 0.0,
+            "short_term_rect_count": len(self.short_term_rect_cache),
+            "preloaded_corner_count": len(self.preloaded_shadow_corners),
+            "ellipse_count": len(self.created_ellipse_shadows),
+            "bytes_used": bytes_used,
+        }
+
+    def reset_stats(self):
+        """
+        Reset the hit and miss totals reported by get_stats() to zero.
+        """
+        self._rect_hits = 0
+        self._rect_misses = 0
+        self._corner_hits = 0
+        self._corner_misses = 0
+        self._ellipse_hits = 0
+        self._ellipse_misses = 0
@@ -433,6 +433,7 @@ class FontResource:
         self.loaded_font: Optional[IGUIFontInterface] = None
 
         self.font_type_to_use = "pygame"
+        self.use_glyph_atlas = False
 
     def load(self):
         """
@@ -467,6 +468,7 @@ class FontResource:
                         self.size,
                         self.force_style,
                         self.style,
+                        use_glyph_atlas=self.use_glyph_atlas,
                     )
             except (pygame.error, OSError):
                 error = FileNotFoundError(
@@ -481,7 +483,11 @@ class FontResource:
                     )
                 elif self.font_type_to_use == "pygame":
                     self.loaded_font = GUIFontPygame(
-                        self.location, self.size, self.force_style, self.style
+                        self.location,
+                        self.size,
+                        self.force_style,
+                        self.style,
+                        use_glyph_atlas=self.use_glyph_atlas,
                     )
             except (pygame.error, OSError):
                 error = FileNotFoundError(
@@ -497,7 +503,11 @@ class FontResource:
                     )
                 elif self.font_type_to_use == "pygame":
                     self.loaded_font = GUIFontPygame(
-                        file_obj, self.size, self.force_style, self.style
+                        file_obj,
+                        self.size,
+                        self.force_style,
+                        self.style,
+                        use_glyph_atlas=self.use_glyph_atlas,
                     )
             except (pygame.error, OSError):
                 error = FileNotFoundError(
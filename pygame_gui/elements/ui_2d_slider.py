@@ -205,7 +205,7 @@ class UI2DSlider(UIElement):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
         if self.button_container is None:
             self.button_container = UIContainer(
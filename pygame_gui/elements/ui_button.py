@@ -59,6 +59,8 @@ class UIButton(UIElement):
                         in the middle.
     """
 
+    handled_event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+
     def __init__(
         self,
         relative_rect: Union[RectLike, Coordinate],
@@ -442,6 +444,23 @@ class UIButton(UIElement):
             ):
                 self.double_click_timer += time_delta
 
+    def can_sleep(self) -> bool:
+        """
+        Buttons stay awake while they have a pressed state to clear or a double click timer
+        running.
+
+        :return: True if this button has nothing to do in update().
+        """
+        return (
+            not self.pressed
+            and not self.pressed_event
+            and (
+                not self.allow_double_clicks
+                or self.double_click_timer >= self.ui_manager.get_double_click_time()
+            )
+            and super().can_sleep()
+        )
+
     def process_event(self, event: pygame.event.Event) -> bool:
         """
         Handles various interactions with the button.
@@ -492,6 +511,7 @@ class UIButton(UIElement):
                 self._set_inactive()
                 consumed_event = True
                 self.pressed_event = True
+                self.wake_up()
                 self.on_self_event(UI_BUTTON_PRESSED, {"mouse_button": event.button})
 
             if self.is_enabled and self.held:
@@ -505,6 +525,7 @@ class UIButton(UIElement):
         self.on_self_event(UI_BUTTON_START_PRESS, {"mouse_button": event.button})
         self.double_click_timer = 0.0
         self.last_click_button = event.button
+        self.wake_up()
         self.held = True
         self.hovered = False
         self.on_unhovered()
@@ -1007,10 +1028,7 @@ class UIButton(UIElement):
     def _calc_dynamic_size(self):
         if not self.dynamic_width and not self.dynamic_height:
             return
-        if self.image.get_size() == (0, 0):
-            self._set_dimensions(self._get_pre_clipped_image_size())
-        else:
-            self._set_dimensions(self.image.get_size())
+        self._set_dimensions(self.image.get_size())
 
         # if we have anchored the left side of our button to the right of its container then
         # changing the width is going to mess up the horiz position as well.
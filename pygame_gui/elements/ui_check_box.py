@@ -50,6 +50,8 @@ class UICheckBox(UIElement):
     :param tool_tip_text_kwargs: Optional keyword arguments for tooltip text formatting.
     """
 
+    handled_event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN})
+
     def __init__(
         self,
         relative_rect: Union[RectLike, Coordinate],
@@ -816,7 +818,7 @@ class UICheckBox(UIElement):
         Called when our drawable shape has finished rebuilding the active surface.
         """
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
     def get_object_id(self) -> Union[str, None]:
         """
@@ -876,6 +876,10 @@ class UIDropDownMenu(UIContainer):
                                    option is pressed.
     """
 
+    handled_event_types = frozenset(
+        {UI_BUTTON_PRESSED, UI_SELECTION_LIST_NEW_SELECTION}
+    )
+
     def __init__(
         self,
         options_list: List[str | Tuple[str, str]],
@@ -1244,7 +1248,7 @@ class UIDropDownMenu(UIContainer):
         normally after a rebuilding/redrawing of some kind.
         """
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
     def disable(self):
         """
@@ -1310,4 +1314,4 @@ class UIDropDownMenu(UIContainer):
         or closed.
         """
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
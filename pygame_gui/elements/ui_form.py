@@ -68,6 +68,8 @@ class UISection(UIAutoResizingContainer):
                     may override this.
     """
 
+    handled_event_types = frozenset({UI_BUTTON_PRESSED})
+
     def __init__(
         self,
         relative_rect: pygame.Rect,
@@ -478,6 +480,8 @@ class UIForm(UIScrollingContainer):
                     may override this.
     """
 
+    handled_event_types = frozenset({UI_BUTTON_PRESSED})
+
     # TODO: Implement a show password button
     # TODO: Implement colour inputs
     # TODO: Implement required input
@@ -36,6 +36,8 @@ class UIHorizontalScrollBar(UIElement):
                     may override this.
     """
 
+    handled_event_types = frozenset({pygame.MOUSEWHEEL})
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -209,7 +211,7 @@ class UIHorizontalScrollBar(UIElement):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
         if self.button_container is None:
             self.button_container = UIContainer(
@@ -39,6 +39,8 @@ class UIHorizontalSlider(UIElement):
     :param click_increment: the amount to increment by when clicking one of the arrow buttons.
     """
 
+    handled_event_types = frozenset({UI_BUTTON_PRESSED})
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -200,7 +202,7 @@ class UIHorizontalSlider(UIElement):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
         if self.button_container is None:
             self.button_container = UIContainer(
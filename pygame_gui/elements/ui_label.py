@@ -220,10 +220,7 @@ class UILabel(UIElement, IUITextOwnerInterface):
     def _calc_dynamic_size(self):
         if not self.dynamic_width and not self.dynamic_height:
             return
-        if self.image.get_size() == (0, 0):
-            self._set_dimensions(self._get_pre_clipped_image_size())
-        else:
-            self._set_dimensions(self.image.get_size())
+        self._set_dimensions(self.image.get_size())
 
         # if we have anchored the left side of our button to the right of its container then
         # changing the width is going to mess up the horiz position as well.
@@ -390,6 +387,14 @@ class UILabel(UIElement, IUITextOwnerInterface):
         super().update(time_delta)
         self.update_text_effect(time_delta)
 
+    def can_sleep(self) -> bool:
+        """
+        Labels stay awake while they have a text effect running.
+
+        :return: True if this label has nothing to do in update().
+        """
+        return self.active_text_effect is None and super().can_sleep()
+
     # -------------------------------------------------
     # The Text owner interface
     # -------------------------------------------------
@@ -479,6 +484,7 @@ class UILabel(UIElement, IUITextOwnerInterface):
         if self.active_text_effect is not None:
             self.active_text_effect.text_changed = True
             self.update_text_effect(0.0)
+            self.wake_up()
 
     def stop_finished_effect(
         self, sub_chunks: Optional[List[TextLineChunkFTFont]] = None
@@ -47,6 +47,8 @@ class UIPanel(UIElement, IContainerLikeInterface):
                     may override this.
     """
 
+    handled_event_types = frozenset({pygame.MOUSEBUTTONDOWN})
+
     def __init__(
         self,
         relative_rect: RectLike,
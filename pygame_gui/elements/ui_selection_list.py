@@ -1,4 +1,4 @@
-from typing import Union, Dict, Tuple, List, Optional, Any
+from typing import Union, Dict, Tuple, List, Optional, Any, Set
 
 import pygame
 
@@ -51,8 +51,15 @@ class UISelectionList(UIElement):
                     Defaults to the top left.
     :param visible: Whether the element is visible by default. Warning - container visibility
                     may override this.
+    :param virtualized: Set to True for very long lists. Rather than a button for each item
+                        in view, the list keeps a fixed pool of row buttons that are handed new
+                        text and selection state as it scrolls, so scrolling costs the same
+                        however many items there are. Items are stored in compact parallel
+                        lists rather than in item_list, which stays empty.
     """
 
+    handled_event_types = frozenset({UI_BUTTON_PRESSED, UI_BUTTON_DOUBLE_CLICKED})
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -71,6 +78,7 @@ class UISelectionList(UIElement):
         | Tuple[str, str]
         | List[str | Tuple[str, str]]
         | None = None,
+        virtualized: bool = False,
     ):
         super().__init__(
             relative_rect,
@@ -102,6 +110,17 @@ class UISelectionList(UIElement):
         """
         self.item_list: List[Dict[str, Any]] = []
         self.allow_multi_select = allow_multi_select
+        self.virtualized = virtualized
+
+        # virtualized list storage, each item's data is at the same index in every list
+        self._item_texts: List[str] = []
+        self._item_object_ids: List[str] = []
+        self._selected_item_indices: Set[int] = set()
+        # the recycled row buttons, and which item each one is currently showing
+        self._row_buttons: List[UIButton] = []
+        self._row_item_indices: List[int] = []
+        self._row_object_ids: List[str] = []
+        self._button_rows: Dict[UIButton, int] = {}
         self.allow_double_clicks = allow_double_clicks
 
         self.background_colour: pygame.Color | IColourGradientInterface = pygame.Color(
@@ -171,15 +190,7 @@ class UISelectionList(UIElement):
         """
         if self.allow_multi_select:
             raise RuntimeError("Requesting single selection, from multi-selection list")
-        selected_list = (
-            [
-                (item["text"], item["object_id"])
-                for item in self.item_list
-                if item["selected"]
-            ]
-            if include_object_id
-            else [item["text"] for item in self.item_list if item["selected"]]
-        )
+        selected_list = self._get_selected_items(include_object_id)
         if len(selected_list) == 1:
             return selected_list[0]
         elif not selected_list:
@@ -204,16 +215,35 @@ class UISelectionList(UIElement):
 
         """
         if self.allow_multi_select:
+            return self._get_selected_items(include_object_id)
+        else:
+            raise RuntimeError("Requesting multi selection, from single-selection list")
+
+    def _get_selected_items(
+        self, include_object_id: bool
+    ) -> Union[List[str], List[Tuple[str, str]]]:
+        """
+        Get the selected items, in list order.
+
+        :param include_object_id: if True get (text, object_id) tuples rather than just the text.
+
+        :return: A list of the selected items, may be empty.
+        """
+        if self.virtualized:
+            selected_indices = sorted(self._selected_item_indices)
             if include_object_id:
                 return [
-                    (item["text"], item["object_id"])
-                    for item in self.item_list
-                    if item["selected"]
+                    (self._item_texts[index], self._item_object_ids[index])
+                    for index in selected_indices
                 ]
-            else:
-                return [item["text"] for item in self.item_list if item["selected"]]
-        else:
-            raise RuntimeError("Requesting multi selection, from single-selection list")
+            return [self._item_texts[index] for index in selected_indices]
+        if include_object_id:
+            return [
+                (item["text"], item["object_id"])
+                for item in self.item_list
+                if item["selected"]
+            ]
+        return [item["text"] for item in self.item_list if item["selected"]]
 
     def update(self, time_delta: float) -> None:
         """
@@ -228,6 +258,9 @@ class UISelectionList(UIElement):
             and self.scroll_bar is not None
             and self.scroll_bar.check_has_moved_recently()
         ):
+            if self.virtualized:
+                self._bind_visible_rows()
+                return
             list_height_adjustment = min(
                 self.scroll_bar.start_percentage * self.total_height_of_list,
                 self.lowest_list_pos,
@@ -283,6 +316,14 @@ class UISelectionList(UIElement):
 
         :return: percentage between 0.0 and 1.0
         """
+        if self.virtualized:
+            if self._selected_item_indices and self.total_height_of_list > 0:
+                return float(
+                    min(self._selected_item_indices)
+                    * self.list_item_height
+                    / self.total_height_of_list
+                )
+            return 0.0
         if selected_item_heights := [
             item["height"] for item in self.item_list if item["selected"]
         ]:
@@ -297,29 +338,33 @@ class UISelectionList(UIElement):
         """
         self._raw_item_list = new_item_list
         self.item_list[:] = []
-        for index, new_item in enumerate(new_item_list):
-            if isinstance(new_item, str):
-                new_item_list_item = {
-                    "text": new_item,
-                    "button_element": None,
-                    "selected": False,
-                    "object_id": "#item_list_item",
-                    "height": index * self.list_item_height,
-                }
-            elif isinstance(new_item, tuple):
-                new_item_list_item = {
-                    "text": new_item[0],
-                    "button_element": None,
-                    "selected": False,
-                    "object_id": new_item[1],
-                    "height": index * self.list_item_height,
-                }
-            else:
-                raise ValueError("Invalid item list")
+        if self.virtualized:
+            self._set_virtual_item_data(new_item_list)
+        else:
+            for index, new_item in enumerate(new_item_list):
+                if isinstance(new_item, str):
+                    new_item_list_item = {
+                        "text": new_item,
+                        "button_element": None,
+                        "selected": False,
+                        "object_id": "#item_list_item",
+                        "height": index * self.list_item_height,
+                    }
+                elif isinstance(new_item, tuple):
+                    new_item_list_item = {
+                        "text": new_item[0],
+                        "button_element": None,
+                        "selected": False,
+                        "object_id": new_item[1],
+                        "height": index * self.list_item_height,
+                    }
+                else:
+                    raise ValueError("Invalid item list")
 
-            self.item_list.append(new_item_list_item)
+                self.item_list.append(new_item_list_item)
 
-        self.total_height_of_list = self.list_item_height * len(self.item_list)
+        item_count = len(self._item_texts) if self.virtualized else len(self.item_list)
+        self.total_height_of_list = self.list_item_height * item_count
         inner_visible_area_height = 0
         if self.list_and_scroll_bar_container is not None:
             self.lowest_list_pos = self.total_height_of_list - int(
@@ -402,6 +447,15 @@ class UISelectionList(UIElement):
                     },
                 )
                 self.join_focus_sets(self.item_list_container)
+        if self.virtualized:
+            self._row_buttons = []
+            self._row_item_indices = []
+            self._row_object_ids = []
+            self._button_rows = {}
+            self._resize_row_pool()
+            self._bind_visible_rows()
+            return
+
         item_y_height = 0
         if self.item_list_container is not None:
             for item in self.item_list:
@@ -434,6 +488,148 @@ class UISelectionList(UIElement):
                 else:
                     break
 
+    def _set_virtual_item_data(self, new_item_list: List[str | Tuple[str, str]]):
+        """
+        Store a new item list in the compact parallel lists used by virtualized selection lists.
+
+        :param new_item_list: The new list of items, in the same format as set_item_list().
+        """
+        item_texts = []
+        item_object_ids = []
+        for new_item in new_item_list:
+            if isinstance(new_item, str):
+                item_texts.append(new_item)
+                item_object_ids.append("#item_list_item")
+            elif isinstance(new_item, tuple):
+                item_texts.append(new_item[0])
+                item_object_ids.append(new_item[1])
+            else:
+                raise ValueError("Invalid item list")
+        self._item_texts = item_texts
+        self._item_object_ids = item_object_ids
+        self._selected_item_indices = set()
+
+    def _resize_row_pool(self):
+        """
+        Make sure a virtualized list has enough row buttons to cover its visible area, with a
+        spare for rows part-scrolled into view at either end - and no more.
+        """
+        if self.item_list_container is None:
+            return
+        row_count = min(
+            len(self._item_texts),
+            int(self.item_list_container.relative_rect.height)
+            // max(self.list_item_height, 1)
+            + 2,
+        )
+        while len(self._row_buttons) > row_count:
+            button = self._row_buttons.pop()
+            self._row_item_indices.pop()
+            self._row_object_ids.pop()
+            del self._button_rows[button]
+            button.kill()
+        while len(self._row_buttons) < row_count:
+            object_id = "#item_list_item"
+            button = UIButton(
+                relative_rect=pygame.Rect(
+                    0,
+                    len(self._row_buttons) * self.list_item_height,
+                    self.item_list_container.relative_rect.width,
+                    self.list_item_height,
+                ),
+                text="",
+                manager=self.ui_manager,
+                parent_element=self,
+                container=self.item_list_container,
+                object_id=ObjectID(
+                    object_id=object_id, class_id="@selection_list_item"
+                ),
+                allow_double_clicks=self.allow_double_clicks,
+                anchors={
+                    "left": "left",
+                    "right": "right",
+                    "top": "top",
+                    "bottom": "top",
+                },
+            )
+            self.join_focus_sets(button)
+            self._button_rows[button] = len(self._row_buttons)
+            self._row_buttons.append(button)
+            self._row_item_indices.append(-1)
+            self._row_object_ids.append(object_id)
+        # the item each row shows depends on how many rows there are
+        self._row_item_indices = [-1] * len(self._row_buttons)
+
+    def _bind_visible_rows(self):
+        """
+        Hand the items in view of a virtualized list to the row buttons and move the rows into
+        place. Item n is always shown by row n modulo the number of rows, so scrolling by one
+        item only rebinds a single row.
+        """
+        row_count = len(self._row_buttons)
+        if row_count == 0:
+            return
+        list_height_adjustment = 0.0
+        if self.scroll_bar is not None:
+            list_height_adjustment = max(
+                0.0,
+                min(
+                    self.scroll_bar.start_percentage * self.total_height_of_list,
+                    self.lowest_list_pos,
+                ),
+            )
+        first_index = int(list_height_adjustment // max(self.list_item_height, 1))
+        item_count = len(self._item_texts)
+        for index in range(first_index, first_index + row_count):
+            row = index % row_count
+            button = self._row_buttons[row]
+            if index < item_count:
+                if self._row_item_indices[row] != index:
+                    self._bind_row(row, index)
+            else:
+                # past the end of the list, so below the visible area
+                self._row_item_indices[row] = -1
+            button.set_relative_position(
+                (0, int((index * self.list_item_height) - list_height_adjustment))
+            )
+
+    def _bind_row(self, row: int, index: int):
+        """
+        Set up a row button of a virtualized list to show an item.
+
+        :param row: The row to set up.
+        :param index: The index of the item to show.
+        """
+        button = self._row_buttons[row]
+        object_id = self._item_object_ids[index]
+        if object_id != self._row_object_ids[row]:
+            self._row_object_ids[row] = object_id
+            button.change_object_id(
+                ObjectID(object_id=object_id, class_id="@selection_list_item")
+            )
+        button.set_text(self._item_texts[index])
+        if index in self._selected_item_indices:
+            if not button.is_selected:
+                button.select()
+        elif button.is_selected:
+            button.unselect()
+        self._row_item_indices[row] = index
+
+    def _get_row_button_for_item(self, index: int) -> Optional[UIButton]:
+        """
+        Find the row button currently showing an item of a virtualized list, if any.
+
+        :param index: The index of the item.
+
+        :return: The row button, or None if the item is not in view.
+        """
+        if not self._row_buttons:
+            return None
+        row = index % len(self._row_buttons)
+        if self._row_item_indices[row] == index:
+            return self._row_buttons[row]
+        return None
+
     def _set_default_selection(self) -> None:
         """
         Set the default selection for the list.
@@ -450,22 +646,32 @@ class UISelectionList(UIElement):
             default = [default]
 
         # Sanity check: return if any values - even not requested defaults - are already selected.
-        for item in self.item_list:
-            if item["selected"]:
+        if self.virtualized:
+            if self._selected_item_indices:
                 return
+            item_texts = self._item_texts
+            item_object_ids = self._item_object_ids
+        else:
+            for item in self.item_list:
+                if item["selected"]:
+                    return
+            item_texts = [item["text"] for item in self.item_list]
+            item_object_ids = [item["object_id"] for item in self.item_list]
 
         for d in default:
             if isinstance(d, str):
                 idx = next(
-                    (i for i, item in enumerate(self.item_list) if item["text"] == d),
+                    (i for i, text in enumerate(item_texts) if text == d),
                     None,
                 )
             elif isinstance(d, tuple):
                 idx = next(
                     (
                         i
-                        for i, item in enumerate(self.item_list)
-                        if item["text"] == d[0] and item["object_id"] == d[1]
+                        for i, (text, object_id) in enumerate(
+                            zip(item_texts, item_object_ids)
+                        )
+                        if text == d[0] and object_id == d[1]
                     ),
                     None,
                 )
@@ -476,11 +682,16 @@ class UISelectionList(UIElement):
 
             if idx is None:
                 raise ValueError(
-                    f"Requested default {d} not found in selection list {self.item_list}."
+                    f"Requested default {d} not found in selection list {self._raw_item_list}."
                 )
-            self.item_list[idx]["selected"] = True
-            if self.item_list[idx]["button_element"] is not None:
-                self.item_list[idx]["button_element"].select()
+            if self.virtualized:
+                self._selected_item_indices.add(idx)
+                if (button := self._get_row_button_for_item(idx)) is not None:
+                    button.select()
+            else:
+                self.item_list[idx]["selected"] = True
+                if self.item_list[idx]["button_element"] is not None:
+                    self.item_list[idx]["button_element"].select()
 
     def process_event(self, event: pygame.event.Event) -> bool:
         """
@@ -493,6 +704,13 @@ class UISelectionList(UIElement):
 
         """
         if (
+            self.virtualized
+            and self.is_enabled
+            and event.type in [UI_BUTTON_PRESSED, UI_BUTTON_DOUBLE_CLICKED]
+            and event.ui_element in self._button_rows
+        ):
+            self._process_row_button_event(event)
+        elif (
             self.is_enabled
             and self.item_list_container is not None
             and (
@@ -614,6 +832,61 @@ class UISelectionList(UIElement):
 
         return False  # Don't consume any events
 
+    def _process_row_button_event(self, event: pygame.event.Event):
+        """
+        Handle a press or double click on one of a virtualized list's row buttons.
+
+        :param event: The button event.
+        """
+        index = self._row_item_indices[self._button_rows[event.ui_element]]
+        if index < 0:
+            return
+        text = self._item_texts[index]
+        if event.type == UI_BUTTON_DOUBLE_CLICKED:
+            self._post_selection_event(UI_SELECTION_LIST_DOUBLE_CLICKED_SELECTION, text)
+        elif index in self._selected_item_indices:
+            self._selected_item_indices.discard(index)
+            event.ui_element.unselect()
+            self._post_selection_event(UI_SELECTION_LIST_DROPPED_SELECTION, text)
+        else:
+            if not self.allow_multi_select:
+                for selected_index in sorted(self._selected_item_indices):
+                    self._selected_item_indices.discard(selected_index)
+                    button = self._get_row_button_for_item(selected_index)
+                    if button is not None:
+                        button.unselect()
+                    self._post_selection_event(
+                        UI_SELECTION_LIST_DROPPED_SELECTION,
+                        self._item_texts[selected_index],
+                    )
+            self._selected_item_indices.add(index)
+            event.ui_element.select()
+            self._post_selection_event(UI_SELECTION_LIST_NEW_SELECTION, text)
+
+    def _post_selection_event(self, event_type: int, text: str):
+        """
+        Post one of the selection list's events, in both the old and new styles.
+
+        :param event_type: The type of selection list event.
+        :param text: The text of the item the event is about.
+        """
+        # old event - to be removed in 0.8.0
+        event_data = {
+            "user_type": OldType(event_type),
+            "text": text,
+            "ui_element": self,
+            "ui_object_id": self.most_specific_combined_id,
+        }
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, event_data))
+
+        # new event
+        event_data = {
+            "text": text,
+            "ui_element": self,
+            "ui_object_id": self.most_specific_combined_id,
+        }
+        pygame.event.post(pygame.event.Event(event_type, event_data))
+
     def set_dimensions(
         self, dimensions: Coordinate, clamp_to_container: bool = False
     ) -> None:
@@ -682,7 +955,10 @@ class UISelectionList(UIElement):
                 self.scroll_bar = None
             self.current_scroll_bar_width = 0
 
-        if self.scroll_bar is not None:
+        if self.virtualized:
+            self._resize_row_pool()
+            self._bind_visible_rows()
+        elif self.scroll_bar is not None:
             self.scroll_bar.has_moved_recently = True
             self.update(0.0)
 
@@ -873,6 +1149,7 @@ class UISelectionList(UIElement):
             if self.item_list is not None:
                 for item in self.item_list:
                     item["selected"] = False
+            self._selected_item_indices.clear()
 
     def enable(self) -> None:
         """
@@ -13,6 +13,7 @@ from pygame_gui.core.interfaces import (
 from pygame_gui.core import UIElement
 from pygame_gui.core.drawable_shapes import RectDrawableShape, RoundedRectangleShape
 from pygame_gui.core.gui_type_hints import RectLike, SpriteWithHealth
+from pygame_gui.core.utility import basic_blit
 
 
 class UIStatusBar(UIElement):
@@ -114,6 +115,15 @@ class UIStatusBar(UIElement):
         self.text_horiz_alignment_padding = 1
         self.text_vert_alignment_padding = 1
 
+        # pre-rendered empty and full bars, so a change in status only needs the filled
+        # part of the bar, and any text, pasting on top rather than a whole new shape.
+        self._unfilled_bar_surface: Optional[pygame.Surface] = None
+        self._filled_bar_surface: Optional[pygame.Surface] = None
+        self._bar_shape_has_text = False
+        self._drawn_fill_width: Optional[int] = None
+        self._drawn_status_text: Optional[str] = None
+        self._status_text_surface: Optional[pygame.Surface] = None
+
         self._set_image(None)
 
         self.rebuild_from_changed_theme_data()
@@ -131,6 +141,7 @@ class UIStatusBar(UIElement):
         if value != self._percent_full:
             self._percent_full = value
             self.status_changed = True
+            self.wake_up()
 
     @property
     def position(self):
@@ -202,16 +213,98 @@ class UIStatusBar(UIElement):
 
             if self.status_changed:
                 self.status_changed = False
-                self.redraw()
+                self._update_bar_image()
+
+    def can_sleep(self) -> bool:
+        """
+        Status bars that follow a sprite, or poll a method for their status, need updating every
+        loop. Those set directly through percent_full are woken up when it changes.
+
+        :return: True if this status bar can be skipped by the UI manager's update.
+        """
+        return (
+            not self.status_changed
+            and self.percent_method is None
+            and (self.sprite is None or not self.follow_sprite)
+            and super().can_sleep()
+        )
 
-    def status_text(self):
-        """To display text in the bar, subclass UIStatusBar and override this method."""
-        return None
+    def status_text(self) -> str:
+        """
+        To display text in the bar, subclass UIStatusBar and override this method.
+
+        :return: The text to display, an empty string for no text.
+        """
+        return ""
 
     def redraw(self):
         """
         Redraw the status bar when something, other than it's position has changed.
 
+        """
+        text = self.status_text()
+        if self._can_composite_bar():
+            # Render the bar empty and full once, later changes in status are pasted
+            # together from these two surfaces.
+            self.drawable_shape = self._create_bar_shape(0.0, text)
+            filled_bar_shape = self._create_bar_shape(1.0, None)
+            if self.drawable_shape is not None and filled_bar_shape is not None:
+                base_state = self.drawable_shape.states["normal"]
+                if self.drawable_shape.text_box_layout is not None:
+                    self._unfilled_bar_surface = base_state.pre_text_surface
+                else:
+                    self._unfilled_bar_surface = base_state.surface
+                self._filled_bar_surface = filled_bar_shape.get_fresh_surface()
+                self._bar_shape_has_text = bool(text)
+                self._drawn_fill_width = None
+                self._status_text_surface = None
+                # we compose the image ourselves
+                self.drawable_shape.get_fresh_surface()
+                self._update_bar_image()
+                return
+
+        self._unfilled_bar_surface = None
+        self._filled_bar_surface = None
+        self.drawable_shape = self._create_bar_shape(self.percent_full, text)
+
+        if self.drawable_shape is not None:
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
+
+    def on_fresh_drawable_shape_ready(self):
+        """
+        Called when our drawable shape has finished rebuilding the active surface, for example
+        after a resize. When we are composing the bar ourselves the pre-rendered bars need
+        rebuilding too.
+        """
+        if self._unfilled_bar_surface is not None:
+            self.rebuild()
+        else:
+            super().on_fresh_drawable_shape_ready()
+
+    def _can_composite_bar(self) -> bool:
+        """
+        Check if the bar can be put together from pre-rendered empty and full bars. Gradients
+        are stretched across just the filled, or unfilled, part of the bar so those shapes are
+        rendered in full every time the status changes.
+
+        :return: True if we can take the fast route.
+        """
+        if not isinstance(self.bar_filled_colour, pygame.Color):
+            return False
+        if self.shape == "rounded_rectangle" and not isinstance(
+            self.bar_unfilled_colour, pygame.Color
+        ):
+            return False
+        return self.shape in ("rectangle", "rounded_rectangle")
+
+    def _create_bar_shape(self, percent_full: float, text: Optional[str]):
+        """
+        Create a drawable shape for the bar filled to the given percentage.
+
+        :param percent_full: How much of the bar to fill, from 0.0 to 1.0.
+        :param text: Any text to put on the bar, or None for none.
+
+        :return: The new shape, or None if our shape theming is not recognised.
         """
         theming_parameters = {
             "normal_bg": self.bar_unfilled_colour,
@@ -220,12 +313,12 @@ class UIStatusBar(UIElement):
             "shadow_width": self.shadow_width,
             "shape_corner_radius": self.shape_corner_radius,
             "filled_bar": self.bar_filled_colour,
-            "filled_bar_width_percentage": self.percent_full,
+            "filled_bar_width_percentage": percent_full,
             "follow_sprite_offset": self.follow_sprite_offset,
             "border_overlap": self.border_overlap,
         }
 
-        if text := self.status_text():
+        if text:
             text_parameters = {
                 "font": self.font,
                 "text": text,
@@ -240,16 +333,84 @@ class UIStatusBar(UIElement):
             theming_parameters |= text_parameters
 
         if self.shape == "rectangle":
-            self.drawable_shape = RectDrawableShape(
+            shape = RectDrawableShape(
                 self.rect, theming_parameters, ["normal"], self.ui_manager
             )
         elif self.shape == "rounded_rectangle":
-            self.drawable_shape = RoundedRectangleShape(
+            shape = RoundedRectangleShape(
                 self.rect, theming_parameters, ["normal"], self.ui_manager
             )
+        else:
+            return None
+        # the bar is redrawn, or pasted together, from this shape's surfaces straight away
+        shape.ensure_state_drawn("normal")
+        return shape
 
-        if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+    def _update_bar_image(self):
+        """
+        Bring the image up to date with the current status. When possible this pastes the
+        filled part of a pre-rendered full bar over a pre-rendered empty one, and skips the work
+        entirely if the filled part hasn't changed by a whole pixel and the text is the same.
+        """
+        if self._unfilled_bar_surface is None or self._filled_bar_surface is None:
+            self.redraw()
+            return
+
+        text = self.status_text()
+        if bool(text) != self._bar_shape_has_text:
+            # text has come or gone, the base shape needs to lay it out
+            self.redraw()
+            return
+
+        fill_width = min(
+            max(int(self.percent_full * self.capacity_rect.width), 0),
+            self.capacity_rect.width,
+        )
+        if fill_width == self._drawn_fill_width and text == self._drawn_status_text:
+            return
+
+        image = self._unfilled_bar_surface.copy()
+        if fill_width > 0:
+            filled_rect = pygame.Rect(
+                self.capacity_rect.topleft, (fill_width, self.capacity_rect.height)
+            )
+            image.fill(pygame.Color("#00000000"), filled_rect)
+            basic_blit(image, self._filled_bar_surface, filled_rect, filled_rect)
+
+        if text:
+            if text != self._drawn_status_text or self._status_text_surface is None:
+                self._status_text_surface = self._render_status_text(text)
+            if self._status_text_surface is not None:
+                basic_blit(image, self._status_text_surface, (0, 0))
+
+        self._drawn_fill_width = fill_width
+        self._drawn_status_text = text
+        self._set_image_without_copy(image)
+
+    def _render_status_text(self, text: str) -> Optional[pygame.Surface]:
+        """
+        Lay out and render the status text with the base shape's text layout, onto an otherwise
+        transparent surface the size of the bar.
+
+        :param text: The text to render.
+
+        :return: The text surface, or None if there is no text layout to render with.
+        """
+        if self.drawable_shape is None:
+            return None
+        if self.drawable_shape.theming.get("text") != text:
+            self.drawable_shape.theming["text"] = text
+            self.drawable_shape.build_text_layout()
+        text_layout = self.drawable_shape.text_box_layout
+        if text_layout is None:
+            return None
+
+        text_surface = pygame.Surface(self.rect.size, flags=pygame.SRCALPHA, depth=32)
+        text_surface.fill(pygame.Color("#00000000"))
+        text_layout.set_default_text_colour(self.text_colour)
+        text_layout.set_default_text_shadow_colour(self.text_shadow_colour)
+        text_layout.finalise_to_surf(text_surface)
+        return text_surface
 
     def rebuild_from_changed_theme_data(self):
         """
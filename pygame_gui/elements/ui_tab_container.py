@@ -35,6 +35,8 @@ class UITabContainer(UIElement):
                     override this.
     """
 
+    handled_event_types = frozenset({UI_BUTTON_PRESSED})
+
     def __init__(
         self,
         relative_rect: RectLike,
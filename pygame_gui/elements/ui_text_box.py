@@ -116,6 +116,8 @@ class UITextBox(UIElement, IUITextOwnerInterface):
 
     """
 
+    handled_event_types = frozenset({MOUSEBUTTONDOWN, MOUSEBUTTONUP, KEYDOWN})
+
     def __init__(
         self,
         html_text: str,
@@ -844,6 +846,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         self.relative_rect.width = int(dimensions[0])
         self.relative_rect.height = int(dimensions[1])
         self.rect.size = self.relative_rect.size
+        self._on_rect_changed()
 
         if dimensions[0] >= 0 and dimensions[1] >= 0 and self.ui_container is not None:
             if self.relative_right_margin is not None:
@@ -38,6 +38,8 @@ class UITextEntryBox(UITextBox):
                               shown instead.
     """
 
+    handled_event_types = UITextBox.handled_event_types | frozenset({TEXTINPUT})
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -54,6 +54,16 @@ class UITextEntryLine(UIElement):
                               shown instead.
     """
 
+    handled_event_types = frozenset(
+        {
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.TEXTINPUT,
+        }
+    )
+
     _number_character_set = {"en": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]}
 
     # excluding these characters won't ensure that user entered text is a valid filename, but they
@@ -386,7 +396,7 @@ class UITextEntryLine(UIElement):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
             if self.rect.width == -1 or self.rect.height == -1:
                 self.set_dimensions(self.drawable_shape.containing_rect.size)
 
@@ -104,6 +104,7 @@ class UITooltip(UIElement, IUITooltipInterface):
             self.relative_rect.width = self.text_block.rect.width
             self.rect.width = self.text_block.rect.width
             self.rect.height = self.text_block.rect.height
+            self._on_rect_changed()
 
     def kill(self):
         """
@@ -164,12 +165,14 @@ class UITooltip(UIElement, IUITooltipInterface):
 
     def _copy_rect_to_rel_and_set_text_pos(self):
         self.relative_rect = self.rect.copy()
+        self._on_rect_changed()
         if self.text_block is not None:
             self.text_block.set_position(self.rect.topleft)
         return True
 
     def _copy_rect_to_rel_and_warn(self, arg0):
         self.relative_rect = self.rect.copy()
+        self._on_rect_changed()
         warnings.warn(arg0)
         return False
 
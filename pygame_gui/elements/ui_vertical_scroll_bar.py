@@ -35,6 +35,8 @@ class UIVerticalScrollBar(UIElement):
                     may override this.
     """
 
+    handled_event_types = frozenset({pygame.MOUSEWHEEL})
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -210,7 +212,7 @@ class UIVerticalScrollBar(UIElement):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
         if self.button_container is None:
             self.button_container = UIContainer(
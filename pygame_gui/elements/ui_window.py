@@ -47,6 +47,13 @@ class UIWindow(UIElement, IContainerLikeInterface, IWindowInterface):
     :param draggable: Whether this window is draggable or not, defaults to True.
     """
 
+    handled_event_types = frozenset(
+        {pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, UI_BUTTON_PRESSED}
+    )
+
+    # resize edges reach outside the window's rect, and blocking windows grab every click
+    _always_hit_test = True
+
     def __init__(
         self,
         rect: RectLike,
@@ -642,7 +649,7 @@ class UIWindow(UIElement, IContainerLikeInterface, IWindowInterface):
             )
 
         if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+            self._set_image_without_copy(self.drawable_shape.get_fresh_surface())
 
         self.set_dimensions(self.relative_rect.size)
 
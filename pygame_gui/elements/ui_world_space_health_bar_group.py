@@ -0,0 +1,383 @@
+from typing import Union, Dict, Optional, Sequence, List, Tuple
+
+import pygame
+
+from pygame_gui.core import ObjectID
+from pygame_gui.core.interfaces import (
+    IContainerLikeInterface,
+    IUIManagerInterface,
+    IUIElementInterface,
+    IColourGradientInterface,
+)
+from pygame_gui.core import UIElement
+from pygame_gui.core.drawable_shapes import RectDrawableShape, RoundedRectangleShape
+from pygame_gui.core.gui_type_hints import Coordinate, RectLike
+from pygame_gui.core.utility import basic_blit
+
+
+class UIWorldSpaceHealthBarGroup(UIElement):
+    """
+    Draws lots of simple health bars in 'world space' in one go, for scenes with far too many
+    units to give each one a UIWorldSpaceHealthBar of its own.
+
+    Rather than monitoring sprites, you hand the group the positions and health fractions of all
+    the bars each time they change, as any sequences - including NumPy arrays. Bars are stamped
+    onto the group's image from a small cache of pre-rendered bars, one per whole pixel of fill,
+    with a single blits call. Bars outside the camera's view are skipped, and the group never
+    takes part in hover or click testing.
+
+    The group covers the area of the screen that the camera's view of the world is drawn to;
+    the camera position is the world position drawn at the top left of that area.
+
+    Themed with the same 'world_space_health_bar' block as UIWorldSpaceHealthBar.
+
+    :param relative_rect: The rectangle of the screen that the world is drawn to.
+    :param bar_size: The width and height of each health bar, including any border and shadow.
+    :param manager: The UIManager that manages this element. If not provided or set to None,
+                    it will try to use the first UIManager that was created by your application.
+    :param container: The container that this element is within. If not provided or set to None
+                      will be the root window's container.
+    :param parent_element: The element this element 'belongs to' in the theming hierarchy.
+    :param object_id: A custom defined ID for fine-tuning of theming.
+    :param anchors: A dictionary describing what this element's relative_rect is relative to.
+    :param visible: Whether the element is visible by default. Warning - container visibility
+                    may override this.
+    """
+
+    element_id = "world_space_health_bar"
+    _hit_testable = False
+
+    def __init__(
+        self,
+        relative_rect: RectLike,
+        bar_size: Coordinate = (50, 12),
+        manager: Optional[IUIManagerInterface] = None,
+        container: Optional[IContainerLikeInterface] = None,
+        parent_element: Optional[UIElement] = None,
+        object_id: Optional[Union[ObjectID, str]] = None,
+        anchors: Optional[Dict[str, Union[str, IUIElementInterface]]] = None,
+        visible: int = 1,
+    ):
+        super().__init__(
+            relative_rect,
+            manager,
+            container,
+            starting_height=1,
+            layer_thickness=1,
+            anchors=anchors,
+            visible=visible,
+            parent_element=parent_element,
+            object_id=object_id,
+            element_id=[self.element_id],
+        )
+
+        self.bar_size = (int(bar_size[0]), int(bar_size[1]))
+        self.camera_position = pygame.Vector2(0.0, 0.0)
+
+        self.border_colour: pygame.Color | IColourGradientInterface = pygame.Color(
+            0, 0, 0
+        )
+        self.bar_filled_colour: pygame.Color | IColourGradientInterface = pygame.Color(
+            0, 0, 0
+        )
+        self.bar_unfilled_colour: pygame.Color | IColourGradientInterface = (
+            pygame.Color(0, 0, 0)
+        )
+        self.shape = "rectangle"
+        self.capacity_rect = pygame.Rect(0, 0, 0, 0)
+
+        self._positions: List[Tuple[float, float]] = []
+        self._health_fractions: List[float] = []
+        self._bars_changed = False
+        self._drawn_bar_count = 0
+
+        self._unfilled_bar_surface: Optional[pygame.Surface] = None
+        self._filled_bar_surface: Optional[pygame.Surface] = None
+        self._bar_surface_cache: Dict[int, pygame.Surface] = {}
+
+        self._set_image(None)
+
+        self.rebuild_from_changed_theme_data()
+
+    def set_bars(
+        self,
+        positions: Sequence[Coordinate],
+        health_fractions: Sequence[float],
+    ):
+        """
+        Set the bars to draw. The bars are redrawn at the next update.
+
+        :param positions: The world positions of the centre of each bar, as a sequence of (x, y)
+                          pairs or an N x 2 array.
+        :param health_fractions: How full each bar is, from 0.0 to 1.0, in the same order as the
+                                 positions.
+        """
+        # plain lists are much quicker to step through than arrays a scalar at a time
+        if hasattr(positions, "tolist"):
+            positions = positions.tolist()
+        if hasattr(health_fractions, "tolist"):
+            health_fractions = health_fractions.tolist()
+        if len(positions) != len(health_fractions):
+            raise ValueError(
+                "UIWorldSpaceHealthBarGroup needs one health fraction per position"
+            )
+        self._positions = positions
+        self._health_fractions = health_fractions
+        self._bars_changed = True
+        self.wake_up()
+
+    def set_camera_position(self, position: Coordinate):
+        """
+        Set the world position that is drawn at the top left of this element. The bars are redrawn
+        at the next update.
+
+        :param position: The world position of the camera.
+        """
+        if self.camera_position != position:
+            self.camera_position = pygame.Vector2(position)
+            self._bars_changed = True
+            self.wake_up()
+
+    def get_drawn_bar_count(self) -> int:
+        """
+        The number of bars that were in view the last time the bars were drawn.
+
+        :return: The number of bars.
+        """
+        return self._drawn_bar_count
+
+    def update(self, time_delta: float):
+        """
+        Redraws the bars if they, or the camera, have changed since the last update.
+
+        :param time_delta: time passed in seconds between one call to this method and the next.
+        """
+        super().update(time_delta)
+        if self.alive() and self._bars_changed:
+            self._bars_changed = False
+            self.redraw_bars()
+
+    def can_sleep(self) -> bool:
+        """
+        The group only needs updating after the bars or the camera have changed.
+
+        :return: True if this element can be skipped by the UI manager's update.
+        """
+        return not self._bars_changed and super().can_sleep()
+
+    def can_hover(self) -> bool:
+        """
+        Health bar groups are purely decorative and never hovered.
+
+        :return: False
+        """
+        return False
+
+    def hover_point(self, hover_x: float, hover_y: float) -> bool:
+        """
+        Health bar groups are purely decorative and never hovered.
+
+        :param hover_x: The x (horizontal) position of the point.
+        :param hover_y: The y (vertical) position of the point.
+
+        :return: False
+        """
+        return False
+
+    def redraw_bars(self):
+        """
+        Draw all the bars in view of the camera onto this element's image.
+        """
+        image = self.image
+        if image is None or image.get_size() != self.rect.size:
+            image = pygame.Surface(self.rect.size, flags=pygame.SRCALPHA, depth=32)
+        image.fill(pygame.Color("#00000000"))
+
+        bar_width, bar_height = self.bar_size
+        half_width = bar_width / 2
+        half_height = bar_height / 2
+        # cull against the camera's view, grown by half a bar so edge bars are still drawn
+        view_left = self.camera_position.x - half_width
+        view_top = self.camera_position.y - half_height
+        view_right = self.camera_position.x + self.rect.width + half_width
+        view_bottom = self.camera_position.y + self.rect.height + half_height
+        offset_x = half_width + self.camera_position.x
+        offset_y = half_height + self.camera_position.y
+
+        capacity_width = self.capacity_rect.width
+        bar_surface_cache = self._bar_surface_cache
+        get_bar_surface = self._get_bar_surface
+        blit_sequence = []
+        for (x, y), fraction in zip(self._positions, self._health_fractions):
+            if not (view_left < x < view_right and view_top < y < view_bottom):
+                continue
+            fill_width = int(fraction * capacity_width)
+            if fill_width < 0:
+                fill_width = 0
+            elif fill_width > capacity_width:
+                fill_width = capacity_width
+            bar_surface = bar_surface_cache.get(fill_width)
+            if bar_surface is None:
+                bar_surface = get_bar_surface(fill_width)
+            blit_sequence.append(
+                (
+                    bar_surface,
+                    (int(x - offset_x), int(y - offset_y)),
+                    None,
+                    pygame.BLEND_PREMULTIPLIED,
+                )
+            )
+
+        if blit_sequence:
+            image.blits(blit_sequence, doreturn=False)
+        self._drawn_bar_count = len(blit_sequence)
+        self._set_image_without_copy(image)
+
+    def _get_bar_surface(self, fill_width: int) -> pygame.Surface:
+        """
+        Get a pre-rendered bar filled to a given width, pasting one together from the empty and
+        full bars if we haven't needed this one before.
+
+        :param fill_width: The width of the filled part of the bar, in pixels.
+
+        :return: The bar's surface.
+        """
+        bar_surface = self._bar_surface_cache.get(fill_width)
+        if bar_surface is None:
+            if self._unfilled_bar_surface is None or self._filled_bar_surface is None:
+                self._unfilled_bar_surface = self._create_bar_shape(
+                    0.0
+                ).get_fresh_surface()
+                self._filled_bar_surface = self._create_bar_shape(
+                    1.0
+                ).get_fresh_surface()
+            bar_surface = self._unfilled_bar_surface.copy()
+            if fill_width > 0:
+                filled_rect = pygame.Rect(
+                    self.capacity_rect.topleft, (fill_width, self.capacity_rect.height)
+                )
+                bar_surface.fill(pygame.Color("#00000000"), filled_rect)
+                basic_blit(bar_surface, self._filled_bar_surface, filled_rect, filled_rect)
+            self._bar_surface_cache[fill_width] = bar_surface
+        return bar_surface
+
+    def _create_bar_shape(self, percent_full: float):
+        """
+        Create a drawable shape for a single bar filled to the given percentage.
+
+        :param percent_full: How much of the bar to fill, from 0.0 to 1.0.
+
+        :return: The new shape.
+        """
+        theming_parameters = {
+            "normal_bg": self.bar_unfilled_colour,
+            "normal_border": self.border_colour,
+            "border_width": self.border_width,
+            "shadow_width": self.shadow_width,
+            "shape_corner_radius": self.shape_corner_radius,
+            "filled_bar": self.bar_filled_colour,
+            "filled_bar_width_percentage": percent_full,
+            "border_overlap": self.border_overlap,
+        }
+        bar_rect = pygame.Rect((0, 0), self.bar_size)
+        if self.shape == "rounded_rectangle":
+            shape = RoundedRectangleShape(
+                bar_rect, theming_parameters, ["normal"], self.ui_manager
+            )
+        else:
+            shape = RectDrawableShape(
+                bar_rect, theming_parameters, ["normal"], self.ui_manager
+            )
+        # we paste bars together from this shape's surface straight away
+        shape.ensure_state_drawn("normal")
+        return shape
+
+    def rebuild(self):
+        """
+        Clear out the pre-rendered bars because the theming data has changed, and redraw.
+        """
+        self.capacity_rect = pygame.Rect(
+            (
+                self.border_width["left"] + self.shadow_width,
+                self.border_width["top"] + self.shadow_width,
+            ),
+            (
+                max(
+                    0,
+                    self.bar_size[0]
+                    - (self.shadow_width * 2)
+                    - (self.border_width["left"] + self.border_width["right"]),
+                ),
+                max(
+                    0,
+                    self.bar_size[1]
+                    - (self.shadow_width * 2)
+                    - (self.border_width["top"] + self.border_width["bottom"]),
+                ),
+            ),
+        )
+        self._unfilled_bar_surface = None
+        self._filled_bar_surface = None
+        self._bar_surface_cache.clear()
+        self.redraw_bars()
+
+    def set_dimensions(self, dimensions: Coordinate, clamp_to_container: bool = False):
+        """
+        Set the size of the area the world is drawn to.
+
+        :param dimensions: The new dimensions to set.
+        :param clamp_to_container: Whether we should clamp the dimensions to the
+                                   dimensions of the container or not.
+        """
+        super().set_dimensions(dimensions, clamp_to_container)
+        self.redraw_bars()
+
+    def rebuild_from_changed_theme_data(self):
+        """
+        Called by the UIManager to check the theming data and rebuild whatever needs rebuilding
+        for this element when the theme data has changed.
+
+        """
+        has_any_changed = False
+
+        if self._check_misc_theme_data_changed(
+            attribute_name="shape",
+            default_value="rectangle",
+            casting_func=str,
+            allowed_values=["rectangle", "rounded_rectangle"],
+        ):
+            has_any_changed = True
+
+        if self._check_shape_theming_changed(
+            defaults={
+                "border_width": {"left": 1, "right": 1, "top": 1, "bottom": 1},
+                "shadow_width": 0,
+                "border_overlap": 1,
+                "shape_corner_radius": [2, 2, 2, 2],
+            }
+        ):
+            has_any_changed = True
+
+        border_colour = self.ui_theme.get_colour_or_gradient(
+            "normal_border", self.combined_element_ids
+        )
+        if border_colour != self.border_colour:
+            self.border_colour = border_colour
+            has_any_changed = True
+
+        bar_unfilled_colour = self.ui_theme.get_colour_or_gradient(
+            "unfilled_bar", self.combined_element_ids
+        )
+        if bar_unfilled_colour != self.bar_unfilled_colour:
+            self.bar_unfilled_colour = bar_unfilled_colour
+            has_any_changed = True
+
+        bar_filled_colour = self.ui_theme.get_colour_or_gradient(
+            "filled_bar", self.combined_element_ids
+        )
+        if bar_filled_colour != self.bar_filled_colour:
+            self.bar_filled_colour = bar_filled_colour
+            has_any_changed = True
+
+        if has_any_changed:
+            self.rebuild()
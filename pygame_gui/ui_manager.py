@@ -1,6 +1,7 @@
 import contextlib
 import os
 import io
+from importlib.metadata import version, PackageNotFoundError
 from typing import Tuple, List, Dict, Union, Set, Optional
 
 import pygame
@@ -28,9 +29,12 @@ from pygame_gui.core.resource_loaders import (
 from pygame_gui.core.utility import (
     get_default_manager,
     set_default_manager,
+    render_white_text_alpha_black_bg,
+    basic_blit,
 )
 from pygame_gui.core.package_resource import PackageResource
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
+from pygame_gui.core.shape_redraw_scheduler import ShapeRedrawScheduler
 from pygame_gui.core import ObjectID
 
 from pygame_gui.elements import UITooltip
@@ -148,6 +152,9 @@ class UIManager(IUIManagerInterface):
     :param resource_loader: Optional custom resource loader. If None, uses default BlockingThreadedResourceLoader.
     :param starting_language: The initial language code for UI text (default: "en").
     :param translation_directory_paths: Optional list of paths to translation files.
+    :param shape_cache_directory: Optional directory to keep a persistent copy of the shape cache
+                                  in. A cache saved there with save_shape_cache() by a previous
+                                  run, with the same theme and versions, is loaded at start up.
     """
 
     def __init__(
@@ -160,6 +167,7 @@ class UIManager(IUIManagerInterface):
         resource_loader: Optional[IResourceLoader] = None,
         starting_language: str = "en",
         translation_directory_paths: Optional[List[str]] = None,
+        shape_cache_directory: Optional[Union[str, os.PathLike]] = None,
     ):
         super().__init__()
         if get_default_manager() is None:
@@ -189,11 +197,16 @@ class UIManager(IUIManagerInterface):
 
         self.window_resolution: Tuple[int, int] = window_resolution
         self.ui_theme: IUIAppearanceThemeInterface = self.create_new_theme(theme_path)
+        self.shape_cache_directory = shape_cache_directory
+        # the theme data hash the persistent shape cache was last loaded for
+        self._shape_cache_theme_hash: Optional[str] = None
+        self._load_persistent_shape_cache()
 
         self.universal_empty_surface = pygame.surface.Surface(
             (0, 0), flags=pygame.SRCALPHA, depth=32
         )
         self.ui_group = LayeredGUIGroup()
+        self.shape_redraw_scheduler = ShapeRedrawScheduler()
 
         self.focused_set: Optional[set[IUIElementInterface]] = None
         self.root_container: Optional[UIContainer] = (
@@ -224,6 +237,9 @@ class UIManager(IUIManagerInterface):
         self.mouse_pos_scale_factor = [1.0, 1.0]
 
         self.visual_debug_active = False
+        self.cache_stats_overlay_update_interval = 0.5
+        self._cache_stats_overlay: Optional[pygame.Surface] = None
+        self._cache_stats_overlay_acc = 0.0
 
         self.resizing_window_cursors: Dict[str, pygame.Cursor] | None = None
         self._load_default_cursors()
@@ -231,6 +247,11 @@ class UIManager(IUIManagerInterface):
         self._active_cursor = self.active_user_cursor
         self.text_hovered = False
         self.hovering_any_ui_element = False
+        self._elements_to_recheck_hover: Set[IUIElementInterface] = set()
+        self._event_routes: Dict[
+            int, List[Tuple[int, Tuple[IUIElementInterface, ...]]]
+        ] = {}
+        self._event_routes_source: Optional[list] = None
 
         self._copy_text_enabled = True
         self._paste_text_enabled = True
@@ -305,6 +326,121 @@ class UIManager(IUIManagerInterface):
         """
         return self.ui_group
 
+    def get_shape_redraw_scheduler(self) -> ShapeRedrawScheduler:
+        """
+        Gets the scheduler that shares out redrawing of drawable shape states across update loops.
+
+        :return: The UI's shape redraw scheduler.
+        """
+        return self.shape_redraw_scheduler
+
+    def set_shape_redraw_time_budget(self, budget: Optional[float]):
+        """
+        Limit the time spent redrawing queued drawable shape states each update loop, across
+        the whole UI. Without a budget every shape redraws one of its queued states each update,
+        which can cause long frames when a theme reload or resize rebuilds many elements at once.
+
+        With a budget, queued redraws are shared out over as many update loops as needed, with the
+        states elements are currently showing redrawn first.
+
+        :param budget: A time budget in seconds, or None to let every shape redraw one queued state
+                       per update (the default).
+        """
+        self.shape_redraw_scheduler.set_update_time_budget(budget)
+
+    def save_shape_cache(self) -> bool:
+        """
+        Save the shape cache to the shape_cache_directory this manager was created with, so the
+        next run can skip drawing shapes it has seen before. A good time to call this is when
+        the program is shutting down.
+
+        :return: True if the cache was saved, False if it failed or there is no directory set.
+        """
+        if self.shape_cache_directory is None:
+            return False
+        return self.ui_theme.shape_cache.save_to_directory(
+            self.shape_cache_directory, self._get_persistent_shape_cache_key()
+        )
+
+    def _load_persistent_shape_cache(self):
+        """
+        Load shapes saved in the shape_cache_directory for the theme data we have now, if we
+        haven't already. Called again whenever theme data may have changed, so themes loaded
+        after this manager was created still find the shapes saved with them.
+        """
+        if self.shape_cache_directory is None:
+            return
+        theme_hash = self.ui_theme.get_theme_data_hash()
+        if theme_hash == self._shape_cache_theme_hash:
+            return
+        self._shape_cache_theme_hash = theme_hash
+        self.ui_theme.shape_cache.load_from_directory(
+            self.shape_cache_directory, self._get_persistent_shape_cache_key()
+        )
+
+    def _get_persistent_shape_cache_key(self) -> str:
+        """
+        Identify everything that went into drawing the cached shapes, so we never load shapes
+        drawn by a different theme, or by different versions of pygame-ce or this library.
+
+        :return: The key string.
+        """
+        try:
+            library_version = version("pygame_gui")
+        except PackageNotFoundError:
+            library_version = "unknown"
+        return (
+            f"{library_version}_{pygame.version.ver}_"
+            f"{self.ui_theme.get_theme_data_hash()}"
+        )
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Get statistics from the caches that save redrawing shapes and shadows, useful for tuning
+        the shape cache's memory budget and checking how well a theme reuses its surfaces. These
+        are also shown on screen while visual debug mode is active.
+
+        :return: A dictionary with the 'shape_cache' and 'shadow_generator' statistics, as
+                 returned by their get_stats() methods.
+        """
+        return {
+            "shape_cache": self.ui_theme.shape_cache.get_stats(),
+            "shadow_generator": self.ui_theme.get_shadow_generator().get_stats(),
+        }
+
+    def _build_cache_stats_overlay(self):
+        """
+        Draw the cache statistics shown in the corner of the window in visual debug mode.
+        """
+        stats = self.get_cache_stats()
+        shape_stats = stats["shape_cache"]
+        shadow_stats = stats["shadow_generator"]
+        lines = [
+            f"Shape cache hit rate: {shape_stats['hit_rate']:.1%} "
+            f"({shape_stats['hits']}/{shape_stats['hits'] + shape_stats['misses']})",
+            f"Shape cache: {shape_stats['short_term_count']} short term, "
+            f"{shape_stats['long_term_count']} long term, "
+            f"{shape_stats['bytes_used'] // 1024} KiB",
+            f"Shape cache occupancy: {shape_stats['occupancy']:.1%}, "
+            f"evictions: {shape_stats['evictions']}",
+            f"Shadow hit rate: {shadow_stats['hit_rate']:.1%} "
+            f"({shadow_stats['hits']}/{shadow_stats['hits'] + shadow_stats['misses']})",
+        ]
+        font = self.get_theme().get_font_dictionary().get_default_font()
+        text_renders = [render_white_text_alpha_black_bg(font, line) for line in lines]
+        padding = 4
+        width = max(text.get_width() for text in text_renders) + (padding * 2)
+        height = sum(text.get_height() for text in text_renders) + (padding * 2)
+        overlay = pygame.Surface((width, height), flags=pygame.SRCALPHA, depth=32)
+        overlay.fill(pygame.Color(0, 0, 0, 180))
+        overlay = overlay.premul_alpha()
+        text_y = padding
+        for text in text_renders:
+            basic_blit(overlay, text, (padding, text_y))
+            text_y += text.get_height()
+        self._cache_stats_overlay = overlay
+        self._cache_stats_overlay_acc = 0.0
+
     def get_window_stack(self) -> IUIWindowStackInterface:
         """
         The UIWindowStack organises any windows in the UI Manager so that they are correctly sorted
@@ -352,6 +488,7 @@ class UIManager(IUIManagerInterface):
         self.ui_window_stack.window_resolution = window_resolution
         if self.root_container is not None:
             self.root_container.set_dimensions(window_resolution)
+        self.ui_group.repaint_all()
 
     def clear_and_reset(self):
         """
@@ -361,6 +498,7 @@ class UIManager(IUIManagerInterface):
         if self.root_container is not None:
             self.root_container.kill()
             self.root_container = None  # need to reset to None to make construction of Root Container work
+        self.shape_redraw_scheduler.clear()
         self.root_container = UIContainer(
             pygame.Rect((0, 0), self.window_resolution),
             self,
@@ -408,11 +546,23 @@ class UIManager(IUIManagerInterface):
         """
         consumed_event = False
         sorting_consumed_event = False
-        sorted_layers = sorted(self.ui_group.layers(), reverse=True)
-        for layer in sorted_layers:
-            sprites_in_layer = self.ui_group.get_sprites_from_layer(layer)
-            sprites_in_layer.reverse()
-            if not sorting_consumed_event:
+        # only mouse clicks can bring a window to the front
+        check_windows = event.type == pygame.MOUSEBUTTONDOWN
+        clicked_elements = set()
+        mouse_x, mouse_y = 0, 0
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # only the elements near the click need the full hover test to change focus, but
+            # they can take focus whether they handle clicks or not, so visit every element.
+            mouse_x, mouse_y = self.calculate_scaled_mouse_position(event.pos)
+            clicked_elements = set(
+                self.ui_group.get_sprites_near_point(mouse_x, mouse_y)
+            )
+            layers_to_visit = self.ui_group.get_layers_top_down()
+        else:
+            layers_to_visit = self._get_event_route(event.type)
+
+        for _, sprites_in_layer in layers_to_visit:
+            if check_windows and not sorting_consumed_event:
                 windows_in_layer = [
                     window
                     for window in sprites_in_layer
@@ -432,12 +582,13 @@ class UIManager(IUIManagerInterface):
                         ui_element, IUIElementInterface
                     ):
                         # Only process events for visible elements - ignore hidden elements
-                        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                            mouse_x, mouse_y = self.calculate_scaled_mouse_position(
-                                event.pos
-                            )
+                        if ui_element in clicked_elements:
                             if ui_element.hover_point(mouse_x, mouse_y):
                                 self.set_focus_set(ui_element.get_focus_set())
+                            if not self._element_handles_event_type(
+                                ui_element, event.type
+                            ):
+                                continue
 
                         consumed_event = ui_element.process_event(event)
                         if consumed_event:
@@ -447,8 +598,49 @@ class UIManager(IUIManagerInterface):
                             # this is not a mistake.
 
                             break
+            if consumed_event and (sorting_consumed_event or not check_windows):
+                break
         return consumed_event
 
+    def _get_event_route(
+        self, event_type: int
+    ) -> List[Tuple[int, Tuple[IUIElementInterface, ...]]]:
+        """
+        Find the elements that handle a type of event, from the top layer down. Routes are
+        cached until elements are added, removed or change layer, so events that no element
+        handles are very cheap to process.
+
+        :param event_type: The pygame event type.
+
+        :return: A list of (layer, elements) pairs, top layer first.
+        """
+        layers_top_down = self.ui_group.get_layers_top_down()
+        if layers_top_down is not self._event_routes_source:
+            self._event_routes_source = layers_top_down
+            self._event_routes = {}
+
+        route = self._event_routes.get(event_type)
+        if route is None:
+            route = []
+            for layer, sprites_in_layer in layers_top_down:
+                handlers = tuple(
+                    sprite
+                    for sprite in sprites_in_layer
+                    if isinstance(sprite, IUIElementInterface)
+                    and self._element_handles_event_type(sprite, event_type)
+                )
+                if handlers:
+                    route.append((layer, handlers))
+            self._event_routes[event_type] = route
+        return route
+
+    @staticmethod
+    def _element_handles_event_type(
+        ui_element: IUIElementInterface, event_type: int
+    ) -> bool:
+        handled_event_types = ui_element.get_handled_event_types()
+        return handled_event_types is None or event_type in handled_event_types
+
     def set_ui_theme(
         self, theme: IUIAppearanceThemeInterface, update_all_sprites: bool = False
     ):
@@ -474,6 +666,7 @@ class UIManager(IUIManagerInterface):
 
         :param theme: the theme that has changed.
         """
+        self._load_persistent_shape_cache()
         for sprite in self.ui_group.sprites():
             if isinstance(sprite, IUIElementInterface):
                 if theme is not None and sprite.ui_theme is not theme:
@@ -513,6 +706,7 @@ class UIManager(IUIManagerInterface):
 
         :param time_delta: Time in seconds since the last update call. Used for animations and timing.
         """
+        self._load_persistent_shape_cache()
 
         if self.live_theme_updates:
             self.theme_update_acc += time_delta
@@ -532,6 +726,15 @@ class UIManager(IUIManagerInterface):
         self.set_text_hovered(False)  # reset the text hovered status each loop
 
         self.ui_group.update(time_delta)
+        self.shape_redraw_scheduler.update()
+
+        if self.visual_debug_active:
+            self._cache_stats_overlay_acc += time_delta
+            if (
+                self._cache_stats_overlay_acc
+                >= self.cache_stats_overlay_update_interval
+            ):
+                self._build_cache_stats_overlay()
 
         # handle mouse cursors
         if self.text_hovered:
@@ -564,26 +767,32 @@ class UIManager(IUIManagerInterface):
 
     def _handle_hovering(self, time_delta: float):
         hover_handled = False
-        sorted_layers = sorted(self.ui_group.layers(), reverse=True)
-        for layer in sorted_layers:
-            layer_elements = self.ui_group.get_sprites_from_layer(layer)
-            layer_elements.reverse()
-            for ui_element in layer_elements:
-                # Only check hover for visible elements - ignore hidden elements
-                # we need to check hover even after already found what we are hovering,
-                # so, we can unhover previously hovered stuff
-                if (
-                    isinstance(ui_element, IUIElementInterface)
-                    and ui_element.visible
-                    and ui_element.check_hover(time_delta, hover_handled)
-                ):
-                    if ui_element != self.root_container:
-                        hover_handled = True
-                        self.hovering_any_ui_element = True
-                    else:
-                        # if we are just hovering over the root container
-                        # set 'hovering any' to False
-                        self.hovering_any_ui_element = False
+        # Only elements near the mouse can start hovering. Elements that were hovered, or that
+        # blocked hovering, last time are also checked so they can let go when the mouse leaves.
+        mouse_x, mouse_y = self.get_mouse_position()
+        hover_candidates = self.ui_group.get_sprites_near_point(
+            mouse_x, mouse_y, self._elements_to_recheck_hover
+        )
+        self._elements_to_recheck_hover = set()
+        for ui_element in hover_candidates:
+            # Only check hover for visible elements - ignore hidden elements
+            # we need to check hover even after already found what we are hovering,
+            # so, we can unhover previously hovered stuff
+            if not isinstance(ui_element, IUIElementInterface):
+                continue
+            if ui_element.visible and ui_element.check_hover(
+                time_delta, hover_handled
+            ):
+                self._elements_to_recheck_hover.add(ui_element)
+                if ui_element != self.root_container:
+                    hover_handled = True
+                    self.hovering_any_ui_element = True
+                else:
+                    # if we are just hovering over the root container
+                    # set 'hovering any' to False
+                    self.hovering_any_ui_element = False
+            elif ui_element.hovered:
+                self._elements_to_recheck_hover.add(ui_element)
 
     def get_mouse_position(self) -> Tuple[int, int]:
         """
@@ -591,7 +800,11 @@ class UIManager(IUIManagerInterface):
         """
         return self.mouse_position
 
-    def draw_ui(self, window_surface: pygame.surface.Surface):
+    def draw_ui(
+        self,
+        window_surface: pygame.surface.Surface,
+        background: Optional[pygame.surface.Surface] = None,
+    ) -> List[pygame.Rect]:
         """
         Draw all UI elements onto the provided surface. This method should be called after drawing
         the game's background but before updating the display.
@@ -605,6 +818,8 @@ class UIManager(IUIManagerInterface):
         - The surface should normally be the same size as the window resolution
         - For transparent surfaces, use premultiplied alpha blending
         - Drawing order matters for proper layering
+        - In visual debug mode, shape and shadow cache statistics are drawn in the top left
+          corner, on top of the UI
 
         Example:
         ```python
@@ -623,15 +838,62 @@ class UIManager(IUIManagerInterface):
             pygame.display.update()
         ```
 
+        Dirty Rectangle Mode:
+        If set_dirty_rect_mode(True) has been called, only the areas of the surface where an element
+        has changed since the last call are redrawn, and those areas are returned so you can pass
+        them straight to pygame.display.update(). In this mode you should not clear the whole
+        window surface each frame; either supply a background surface to clear the changed areas
+        with, or redraw them yourself and tell the manager about it with repaint_rect().
+
+        ```python
+        ui_manager.set_dirty_rect_mode(True)
+        while True:
+            ui_manager.update(time_delta)
+            changed_rects = ui_manager.draw_ui(screen, background)
+            pygame.display.update(changed_rects)
+        ```
+
         :param window_surface: The surface to draw UI elements on. Should normally be the same size as the
                              window resolution. If using transparency, the surface should use
                              premultiplied alpha blending.
+        :param background: Only used in dirty rectangle mode. An optional surface, the same size as
+                           the window surface, used to clear the changed areas before redrawing them.
+        :return: A list of the areas of the window surface that have changed. Outside of dirty
+                 rectangle mode this is always the whole surface.
 
         See Also:
         - https://pyga.me/docs/tutorials/en/premultiplied-alpha.html for information about
           premultiplied alpha blending
         """
-        self.ui_group.draw(window_surface)
+        if self._cache_stats_overlay is None:
+            return self.ui_group.draw(window_surface, background)
+
+        # the UI may redraw underneath the overlay at any time, so always draw it again
+        overlay_rect = self._cache_stats_overlay.get_rect()
+        if self.ui_group.get_dirty_rect_mode():
+            self.ui_group.repaint_rect(overlay_rect)
+        changed_rects = self.ui_group.draw(window_surface, background)
+        basic_blit(window_surface, self._cache_stats_overlay, overlay_rect)
+        return changed_rects
+
+    def set_dirty_rect_mode(self, is_active: bool):
+        """
+        Switch dirty rectangle drawing on or off. When active, draw_ui() only redraws the areas
+        of the window surface that have changed since the last frame and returns them. Useful for
+        mostly static UIs where redrawing everything every frame is wasteful.
+
+        :param is_active: True to draw only changed areas, False to redraw everything every frame.
+        """
+        self.ui_group.set_dirty_rect_mode(is_active)
+
+    def repaint_rect(self, screen_rect: pygame.Rect):
+        """
+        In dirty rectangle mode, mark an area of the window surface to be redrawn on the next
+        call to draw_ui(). Use this when your game has drawn over part of the UI.
+
+        :param screen_rect: The area of the window surface to redraw.
+        """
+        self.ui_group.repaint_rect(screen_rect)
 
     def add_font_paths(
         self,
@@ -814,12 +1076,16 @@ class UIManager(IUIManagerInterface):
     def set_visual_debug_mode(self, is_active: bool):
         """
         Loops through all our UIElements to turn visual debug mode on or off. Also calls
-        print_layer_debug()
+        print_layer_debug() and shows the shape and shadow cache statistics in the top left
+        corner of the window, updated every cache_stats_overlay_update_interval seconds.
 
         :param is_active: True to activate visual debug and False to turn it off.
         """
         if self.visual_debug_active and not is_active:
             self.visual_debug_active = False
+            if self._cache_stats_overlay is not None:
+                self.ui_group.repaint_rect(self._cache_stats_overlay.get_rect())
+                self._cache_stats_overlay = None
             for layer in self.ui_group.layers():
                 for element in self.ui_group.get_sprites_from_layer(layer):
                     if isinstance(element, IUIElementInterface):
@@ -828,6 +1094,7 @@ class UIManager(IUIManagerInterface):
             self.visual_debug_active = True
             # preload the debug font if it's not already loaded
             self.get_theme().get_font_dictionary().ensure_debug_font_loaded()
+            self._build_cache_stats_overlay()
 
             for layer in self.ui_group.layers():
                 for element in self.ui_group.get_sprites_from_layer(layer):
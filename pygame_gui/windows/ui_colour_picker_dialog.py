@@ -50,6 +50,10 @@ class UIColourChannelEditor(UIElement):
                     may override this.
     """
 
+    handled_event_types = frozenset(
+        {UI_TEXT_ENTRY_FINISHED, UI_HORIZONTAL_SLIDER_MOVED}
+    )
+
     def __init__(
         self,
         relative_rect: RectLike,
@@ -332,6 +336,15 @@ class UIColourPickerDialog(UIWindow):
     :param visible: Whether the element is visible by default.
     """
 
+    handled_event_types = UIWindow.handled_event_types | frozenset(
+        {
+            UI_BUTTON_PRESSED,
+            UI_COLOUR_PICKER_COLOUR_CHANNEL_CHANGED,
+            pygame.MOUSEBUTTONDOWN,
+            UI_2D_SLIDER_MOVED,
+        }
+    )
+
     def __init__(
         self,
         rect: RectLike,
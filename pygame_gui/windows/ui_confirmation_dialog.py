@@ -38,6 +38,8 @@ class UIConfirmationDialog(UIWindow):
                                          in the middle.
     """
 
+    handled_event_types = UIWindow.handled_event_types | frozenset({UI_BUTTON_PRESSED})
+
     def __init__(
         self,
         rect: RectLike,
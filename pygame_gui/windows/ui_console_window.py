@@ -30,6 +30,10 @@ class UIConsoleWindow(UIWindow):
     :param visible: Whether the element is visible by default.
     """
 
+    handled_event_types = UIWindow.handled_event_types | frozenset(
+        {pygame.KEYDOWN, UI_TEXT_ENTRY_FINISHED, UI_TEXT_ENTRY_CHANGED}
+    )
+
     def __init__(
         self,
         rect: RectLike,
@@ -42,6 +42,17 @@ class UIFileDialog(UIWindow):
     :param visible: Whether the element is visible by default.
     """
 
+    handled_event_types = UIWindow.handled_event_types | frozenset(
+        {
+            UI_TEXT_ENTRY_FINISHED,
+            UI_TEXT_ENTRY_CHANGED,
+            UI_SELECTION_LIST_NEW_SELECTION,
+            UI_SELECTION_LIST_DOUBLE_CLICKED_SELECTION,
+            UI_CONFIRMATION_DIALOG_CONFIRMED,
+            UI_BUTTON_PRESSED,
+        }
+    )
+
     def __init__(
         self,
         rect: RectLike,
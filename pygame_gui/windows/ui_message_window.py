@@ -23,6 +23,8 @@ class UIMessageWindow(UIWindow):
     :param visible: Whether the element is visible by default.
     """
 
+    handled_event_types = UIWindow.handled_event_types | frozenset({UI_BUTTON_PRESSED})
+
     def __init__(
         self,
         rect: RectLike,
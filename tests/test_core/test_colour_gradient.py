@@ -1,7 +1,7 @@
 import pytest
 import pygame
 
-from pygame_gui.core.colour_gradient import ColourGradient
+from pygame_gui.core.colour_gradient import ColourGradient, _get_rotated_size
 
 
 class TestColourGradient:
@@ -35,6 +35,64 @@ class TestColourGradient:
         else:
             assert after_application_colour == pygame.Color(0, 11, 243, 255)
 
+    def test_sized_gradient_cache(self, _init_pygame):
+        gradient = ColourGradient(
+            angle_direction=45,
+            colour_1=pygame.Color("#FF0000"),
+            colour_2=pygame.Color("#00FF00"),
+        )
+        gradient.max_cached_sizes = 2
+
+        test_surface = pygame.Surface((50, 30), flags=pygame.SRCALPHA, depth=32)
+        test_surface.fill(pygame.Color(255, 255, 255, 255))
+        gradient.apply_gradient_to_surface(test_surface)
+        first_gradient = gradient._sized_gradients[((50, 30), 45)]
+        inverse_rotated = pygame.transform.rotate(test_surface, -45)
+        expected_size = pygame.transform.rotate(inverse_rotated, 45).get_size()
+        assert first_gradient.get_size() == expected_size
+
+        # a clip rect of the same size uses the same gradient
+        other_surface = pygame.Surface((100, 100), flags=pygame.SRCALPHA, depth=32)
+        gradient.apply_gradient_to_surface(other_surface, pygame.Rect(10, 10, 50, 30))
+        assert gradient._sized_gradients[((50, 30), 45)] is first_gradient
+        assert len(gradient._sized_gradients) == 1
+
+        # least recently used sizes are dropped first
+        gradient.apply_gradient_to_surface(other_surface)
+        gradient.apply_gradient_to_surface(test_surface)
+        gradient.apply_gradient_to_surface(other_surface, pygame.Rect(0, 0, 20, 20))
+        assert list(gradient._sized_gradients) == [((50, 30), 45), ((20, 20), 45)]
+
+    def test_sized_gradient_cache_memory_limit(self, _init_pygame):
+        gradient = ColourGradient(
+            angle_direction=0,
+            colour_1=pygame.Color("#FF0000"),
+            colour_2=pygame.Color("#00FF00"),
+        )
+        gradient.max_cached_bytes = 100 * 100 * 4
+
+        surface = pygame.Surface((200, 200), flags=pygame.SRCALPHA, depth=32)
+        gradient.apply_gradient_to_surface(surface, pygame.Rect(0, 0, 50, 50))
+        gradient.apply_gradient_to_surface(surface, pygame.Rect(0, 0, 80, 50))
+        assert list(gradient._sized_gradients) == [((50, 50), 0), ((80, 50), 0)]
+        assert gradient._sized_gradients_bytes == (50 * 50 + 80 * 50) * 4
+
+        # older sizes make room for new ones within the memory limit
+        gradient.apply_gradient_to_surface(surface, pygame.Rect(0, 0, 60, 60))
+        assert list(gradient._sized_gradients) == [((80, 50), 0), ((60, 60), 0)]
+        assert gradient._sized_gradients_bytes == (80 * 50 + 60 * 60) * 4
+
+        # gradients bigger than the whole limit are used but not kept
+        gradient.apply_gradient_to_surface(surface)
+        assert list(gradient._sized_gradients) == [((80, 50), 0), ((60, 60), 0)]
+
+    @pytest.mark.parametrize("angle", [0, 30, 90, 135, 180, 270, -45, 12.5])
+    def test_get_rotated_size(self, _init_pygame, angle):
+        for size in [(1, 1), (50, 30), (7, 300)]:
+            surface = pygame.Surface(size)
+            rotated_size = pygame.transform.rotate(surface, angle).get_size()
+            assert _get_rotated_size(size, angle) == rotated_size
+
 
 if __name__ == "__main__":
     pytest.console_main()
@@ -7,6 +7,7 @@ from pygame_gui.core.drawable_shapes.drawable_shape import (
     DrawableStateTransition,
 )
 from pygame_gui.ui_manager import UIManager
+from pygame_gui.core.surface_cache import SurfaceCache
 from pygame_gui.core.utility import apply_colour_to_surface
 
 
@@ -50,6 +51,102 @@ class TestDrawableShapeState:
 
         assert normal_state.transition is None
 
+    def test_blended_frames(self, _init_pygame, default_ui_manager: UIManager):
+        shape_cache = SurfaceCache()
+        normal_surface = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        normal_surface.fill(pygame.Color("#FF0000FF"))
+        hovered_surface = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        hovered_surface.fill(pygame.Color("#0000FFFF"))
+
+        def make_transition(frames, keep_frame=None):
+            normal_state = DrawableShapeState("normal")
+            hovered_state = DrawableShapeState("hovered")
+            normal_state.set_shared_surface(normal_surface)
+            hovered_state.set_shared_surface(hovered_surface)
+            states = {"normal": normal_state, "hovered": hovered_state}
+            return DrawableStateTransition(
+                states,
+                "normal",
+                "hovered",
+                1.6,
+                shape_cache=shape_cache,
+                blended_frames=frames,
+                keep_blended_frame=keep_frame,
+            )
+
+        first_frames = {}
+        transition = make_transition(first_frames)
+        assert transition.produce_blended_result() is normal_surface
+
+        # progress is quantised, so frames within the same step are the same frame
+        transition.update(0.8)
+        assert transition.get_blend_step() == DrawableStateTransition.blend_steps // 2
+        half_frame = transition.produce_blended_result()
+        assert half_frame.get_at((0, 0)).r == pytest.approx(128, abs=2)
+        assert half_frame.get_at((0, 0)).b == pytest.approx(128, abs=2)
+        transition.update(0.01)
+        assert transition.produce_blended_result() is half_frame
+        assert len(first_frames) == 1
+
+        # an identical shape shares the frames through the cache
+        second_transition = make_transition({})
+        second_transition.update(0.8)
+        assert second_transition.produce_blended_result() is half_frame
+        assert shape_cache.get_stats()["shared_hits"] == 1
+
+        transition.update(1.0)
+        assert transition.finished
+        assert transition.produce_blended_result() is hovered_surface
+
+        # once there's no room for a frame the transition stops offering them
+        offered_frames = []
+
+        def keep_first_frame(frame_id, frame):
+            offered_frames.append(frame)
+            return False
+
+        limited_transition = make_transition({}, keep_first_frame)
+        for _ in range(3):
+            limited_transition.update(0.1)
+            limited_transition.produce_blended_result()
+        assert len(offered_frames) == 1
+
+    def test_update_on_blend_steps(self, _init_pygame, default_ui_manager: UIManager):
+        normal_state = DrawableShapeState("normal")
+        hovered_state = DrawableShapeState("hovered")
+        states = {"normal": normal_state, "hovered": hovered_state}
+        normal_state.transition = DrawableStateTransition(
+            states=states,
+            start_state_id="normal",
+            target_state_id="hovered",
+            duration=1.6,
+        )
+        normal_state.update(0.01)
+        assert not normal_state.has_fresh_surface
+
+        normal_state.update(0.1)
+        assert normal_state.has_fresh_surface
+
+    def test_shared_surface(self, _init_pygame, default_ui_manager: UIManager):
+        shared_surface = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        shared_surface.fill(pygame.Color("#FF0000FF"))
+        normal_state = DrawableShapeState("normal")
+        normal_state.set_shared_surface(shared_surface)
+        assert normal_state.surface is shared_surface
+        assert normal_state.surface_is_shared
+
+        # copied on first write, leaving the shared surface alone
+        writable_surface = normal_state.get_writable_surface()
+        assert writable_surface is not shared_surface
+        writable_surface.fill(pygame.Color("#00FF00FF"))
+        assert shared_surface.get_at((0, 0)) == pygame.Color("#FF0000FF")
+        assert not normal_state.surface_is_shared
+        assert normal_state.get_writable_surface() is writable_surface
+
+        normal_state.set_shared_surface(shared_surface)
+        normal_state.surface = writable_surface
+        assert not normal_state.surface_is_shared
+
 
 class TestDrawableShape:
     def test_creation(self, _init_pygame, default_ui_manager: UIManager):
@@ -123,6 +220,46 @@ class TestDrawableShape:
         shape.set_active_state("normal")
 
         assert shape.active_state.transition is not None
+        assert shape.active_state.transition.blended_frames is shape.transition_frames
+        assert shape.active_state.transition.shape_cache is shape.shape_cache
+
+        # pruning frames keeps the dictionary a running transition is using
+        frames = shape.transition_frames
+        shape.set_active_state("hovered")
+        assert shape.transition_frames is frames
+        assert shape.active_state.transition.blended_frames is frames
+
+    def test_transition_frame_memory_limit(
+        self, _init_pygame, default_ui_manager: UIManager
+    ):
+        shape = DrawableShape(
+            containing_rect=pygame.Rect(0, 0, 10, 10),
+            theming_parameters={},
+            states=["normal", "hovered"],
+            manager=default_ui_manager,
+        )
+        shape.max_transition_frame_bytes = 10 * 10 * 4
+        normal_surface = shape.states["normal"].surface
+        hovered_surface = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        shape.states["hovered"].surface = hovered_surface
+        first_frame = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        second_frame = first_frame.copy()
+
+        # frames already kept stay put, new ones are turned away once we are full
+        assert shape._keep_transition_frame(
+            (normal_surface, hovered_surface, 1), first_frame
+        )
+        assert not shape._keep_transition_frame(
+            (normal_surface, hovered_surface, 2), second_frame
+        )
+        assert list(shape.transition_frames.values()) == [first_frame]
+        assert shape.transition_frame_bytes == 10 * 10 * 4
+
+        # pruning frames from surfaces we no longer use makes room again
+        shape.states["hovered"].surface = second_frame.copy()
+        shape._prune_transition_frames()
+        assert len(shape.transition_frames) == 0
+        assert shape.transition_frame_bytes == 0
 
     def test_update(self, _init_pygame, default_ui_manager: UIManager):
         shape = DrawableShape(
@@ -164,6 +164,85 @@ class TestRectDrawableShape:
         shape.set_dimensions((50, 50))
         assert shape.containing_rect.width == 50
 
+    def test_shape_cache_keys(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager
+    ):
+        shape = RectDrawableShape(
+            containing_rect=pygame.Rect(0, 0, 100, 100),
+            theming_parameters={
+                "text": "test",
+                "font": default_ui_manager.get_theme().get_font([]),
+                "normal_text": pygame.Color("#FFFFFF"),
+                "normal_text_shadow": pygame.Color("#000000"),
+                "shadow_width": 2,
+                "border_width": 1,
+                "normal_border": pygame.Color("#FFFFFF"),
+                "normal_bg": pygame.Color("#000000"),
+                "text_horiz_alignment": "center",
+                "text_vert_alignment": "center",
+            },
+            states=["normal"],
+            manager=default_ui_manager,
+        )
+        shape.redraw_state("normal")
+        shape_key = shape.shape_cache_keys["normal"]
+        assert str(shape_key) == shape.shape_cache.build_cache_id(
+            "rectangle",
+            (100, 100),
+            2,
+            {"left": 1, "right": 1, "top": 1, "bottom": 1},
+            pygame.Color("#FFFFFF"),
+            pygame.Color("#000000"),
+        )
+
+        # the key is reused until the shape changes size
+        shape.redraw_state("normal")
+        assert shape.shape_cache_keys["normal"] is shape_key
+        assert shape.states["normal"].cached_background_id == shape_key
+
+        shape.set_dimensions((50, 50))
+        shape.redraw_state("normal")
+        assert shape.shape_cache_keys["normal"] is not shape_key
+        assert shape.shape_cache_keys["normal"].values[1:3] == (50, 50)
+
+    def test_shared_image_composites(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager
+    ):
+        icon = pygame.Surface((10, 10), flags=pygame.SRCALPHA, depth=32)
+        icon.fill(pygame.Color("#FF0000FF"))
+        theming_parameters = {
+            "shadow_width": 0,
+            "border_width": 1,
+            "normal_border": pygame.Color("#FFFFFF"),
+            "normal_bg": pygame.Color("#000000"),
+            "normal_images": [icon],
+            "normal_image_positions": [(0.5, 0.5)],
+        }
+        shapes = [
+            RectDrawableShape(
+                containing_rect=pygame.Rect(0, 0, 40, 40),
+                theming_parameters=dict(theming_parameters),
+                states=["normal"],
+                manager=default_ui_manager,
+            )
+            for _ in range(3)
+        ]
+        # the first shape draws its own, the rest share a background and then the icon on it
+        first_state, second_state, third_state = [
+            shape.states["normal"] for shape in shapes
+        ]
+        assert not first_state.surface_is_shared
+        assert second_state.surface_is_shared
+        assert second_state.surface is third_state.surface
+        assert second_state.surface.get_at((20, 20)) == pygame.Color("#FF0000FF")
+        assert first_state.surface.get_at((20, 20)) == pygame.Color("#FF0000FF")
+
+        # the shared background underneath is left as it was
+        background = shapes[1].shape_cache.find_shared_surface_in_cache(
+            shapes[1].shape_cache_keys["normal"]
+        )
+        assert background.get_at((20, 20)) == pygame.Color("#000000FF")
+
 
 if __name__ == "__main__":
     pytest.console_main()
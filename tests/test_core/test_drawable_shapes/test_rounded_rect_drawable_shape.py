@@ -502,6 +502,62 @@ class TestRoundedRectangleShape:
             bab_surface, shape.background_rect, 0, [2, 2, 2, 2], aa_amount=2, clear=True
         )
 
+    def test_nine_sliced_shape(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager
+    ):
+        theming_parameters = {
+            "shadow_width": 2,
+            "border_width": 2,
+            "border_overlap": 1,
+            "normal_border": pygame.Color("#E0E0E0C0"),
+            "normal_bg": pygame.Color("#2050A0"),
+            "shape_corner_radius": [10, 6, 6, 10],
+        }
+        shape = RoundedRectangleShape(
+            containing_rect=pygame.Rect(0, 0, 400, 200),
+            theming_parameters=theming_parameters,
+            states=["normal"],
+            manager=default_ui_manager,
+        )
+        bg_col = theming_parameters["normal_bg"]
+        border_col = theming_parameters["normal_border"]
+        sliced = shape._draw_nine_sliced_shape(bg_col, border_col, 1)
+        supersampled = shape._draw_supersampled_shape(bg_col, border_col, 1)
+        assert sliced.get_size() == supersampled.get_size()
+        # the same apart from smoothing at the inside of the corners
+        for point in [(0, 0), (3, 3), (200, 2), (200, 3), (3, 100), (200, 100), (396, 196)]:
+            assert sliced.get_at(point) == supersampled.get_at(point)
+        assert sliced.get_at((200, 100)) == bg_col
+
+        # the template is kept in the shape cache, unused, for the next shape to slice up
+        template_ids = [
+            cache_id
+            for cache_id in shape.shape_cache.cache_short_term_lookup
+            if str(cache_id).startswith("rounded_rectangle_slices")
+        ]
+        assert len(template_ids) == 1
+        shape.shape_cache.update()
+        assert (
+            shape.shape_cache.cache_long_term_lookup[template_ids[0]]["current_uses"]
+            == 0
+        )
+
+        # too small to slice, or gradients, fall back to drawing the whole shape
+        shape.set_dimensions((24, 24))
+        assert shape._draw_nine_sliced_shape(bg_col, border_col, 1) is None
+        gradient_shape = RoundedRectangleShape(
+            containing_rect=pygame.Rect(0, 0, 400, 200),
+            theming_parameters={
+                **theming_parameters,
+                "normal_bg": ColourGradient(
+                    0, pygame.Color("#000000"), pygame.Color("#FFFFFF")
+                ),
+            },
+            states=["normal"],
+            manager=default_ui_manager,
+        )
+        assert gradient_shape.states["normal"].surface.get_size() == (400, 200)
+
 
 if __name__ == "__main__":
     pytest.console_main()
@@ -0,0 +1,50 @@
+import pytest
+import pygame
+
+from pygame_gui.core.glyph_atlas import GlyphAtlas
+
+
+class TestGlyphAtlas:
+    def test_creation(self, _init_pygame, _display_surface_return_none):
+        font = pygame.font.Font("tests/data/Roboto-Regular.ttf", 20)
+        GlyphAtlas(font, True, pygame.Color("#FFFFFF"))
+
+    def test_get_glyph(self, _init_pygame, _display_surface_return_none):
+        font = pygame.font.Font("tests/data/Roboto-Regular.ttf", 20)
+        atlas = GlyphAtlas(font, True, pygame.Color("#FFFFFF"))
+
+        glyph_area, x_offset, advance = atlas.get_glyph("A")
+        assert glyph_area.height == font.get_height()
+        assert x_offset == 0
+        assert advance == font.metrics("A")[0][4]
+        # rasterised only once
+        assert atlas.get_glyph("A")[0] is glyph_area
+        assert not atlas.get_glyph("B")[0].colliderect(glyph_area)
+
+    def test_draw_text(self, _init_pygame, _display_surface_return_none):
+        font = pygame.font.Font("tests/data/Roboto-Regular.ttf", 20)
+        colour = pygame.Color("#FFAA00")
+        atlas = GlyphAtlas(font, True, colour)
+
+        whole_render = font.render("1234", True, colour).convert_alpha().premul_alpha()
+        atlas_render = pygame.Surface(
+            whole_render.get_size(), flags=pygame.SRCALPHA, depth=32
+        )
+        atlas_render.fill(pygame.Color("#00000000"))
+        assert atlas.draw_text("1234", atlas_render, (0, 0))
+
+        for x in range(whole_render.get_width()):
+            for y in range(whole_render.get_height()):
+                assert atlas_render.get_at((x, y)) == whole_render.get_at((x, y))
+
+    def test_full_atlas(self, _init_pygame, _display_surface_return_none):
+        font = pygame.font.Font("tests/data/Roboto-Regular.ttf", 20)
+        atlas = GlyphAtlas(font, True, pygame.Color("#FFFFFF"), size=(32, 32))
+        surface = pygame.Surface((200, 40), flags=pygame.SRCALPHA, depth=32)
+
+        assert not atlas.draw_text("ABCDEFGH", surface, (0, 0))
+        assert surface.get_bounding_rect().width == 0
+
+
+if __name__ == "__main__":
+    pytest.console_main()
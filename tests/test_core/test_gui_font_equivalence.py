@@ -115,6 +115,99 @@ class TestFontEquivalence:
             )  # horizontal_advance_x
             # pg font does nto have vertical advance in the metrics (do we use it?)
 
+    @pytest.mark.parametrize("font_class", [GUIFontFreetype, GUIFontPygame])
+    def test_measurement_cache(self, _init_pygame, font_class):
+        font = font_class("tests/data/Roboto-Regular.ttf", 20)
+        font.prewarm_measurements(["OK", "Cancel"])
+        assert font.get_measurement_stats()["misses"] == 4
+
+        rect = font.get_rect("Cancel")
+        rect.width = 1000
+        assert font.get_rect("Cancel").width != 1000
+        assert font.size("Cancel") == font.get_rect("Cancel").size
+        assert font.get_metrics("OK")[0][4] > 0
+        stats = font.get_measurement_stats()
+        assert stats["hits"] == 5
+        assert stats["misses"] == 4
+        assert stats["count"] == 4
+
+        # underlined text is measured separately
+        font.underline = True
+        font.get_rect("Cancel")
+        assert font.get_measurement_stats()["misses"] == 5
+        font.underline = False
+
+    def test_glyph_atlas_rendering(self, _init_pygame, _display_surface_return_none):
+        atlas_font = GUIFontPygame(
+            "tests/data/Roboto-Regular.ttf", 20, use_glyph_atlas=True
+        )
+        pygame_font = GUIFontPygame("tests/data/Roboto-Regular.ttf", 20)
+        colour = pygame.Color("#FFFFFF")
+
+        assert atlas_font._can_draw_from_glyph_atlas("FPS: 60")
+        assert atlas_font.get_rect("FPS: 60") == pygame_font.get_rect("FPS: 60")
+        atlas_render = atlas_font.render_premul_to("FPS: 60", colour, (80, 30), (0, 20))
+        pygame_render = pygame_font.render_premul_to(
+            "FPS: 60", colour, (80, 30), (0, 20)
+        )
+        assert pygame.image.tobytes(atlas_render, "RGBA") == (
+            pygame.image.tobytes(pygame_render, "RGBA")
+        )
+        assert len(atlas_font._glyph_atlases) == 1
+        assert atlas_render.get_size() == (80, 30)
+        assert atlas_font.render_premul("60", colour).get_size() == (
+            pygame_font.render_premul("60", colour).get_size()
+        )
+
+        # text the atlas can't draw just the same is rendered whole
+        assert not atlas_font._can_draw_from_glyph_atlas("AVA")
+        assert not atlas_font._can_draw_from_glyph_atlas("שלום")
+        atlas_font.underline = True
+        assert not atlas_font._can_draw_from_glyph_atlas("60")
+        atlas_font.underline = False
+        assert not pygame_font._can_draw_from_glyph_atlas("60")
+
+        # ligatures and contextual alternates that keep their width, and glyphs whose boxes
+        # overlap, still come out exactly as they would rendered whole
+        fonts_and_texts = [
+            ("tests/data/Roboto-Regular.ttf", 20, ["office", "AVA"]),
+            (
+                "pygame_gui/data/FiraCode-Regular.ttf",
+                14,
+                [
+                    "==",
+                    "!=",
+                    "->",
+                    "<=",
+                    "::",
+                    ":=",
+                    "...",
+                    "www",
+                    "a+b",
+                    "1:2",
+                    "x = 60",
+                ],
+            ),
+            ("pygame_gui/data/NotoSans-Regular.ttf", 12, ["yVY", "FPS: 60"]),
+        ]
+        for font_path, size, texts in fonts_and_texts:
+            atlas_font = GUIFontPygame(font_path, size, use_glyph_atlas=True)
+            pygame_font = GUIFontPygame(font_path, size)
+            for text in texts:
+                atlas_render = atlas_font.render_premul(text, colour)
+                pygame_render = pygame_font.render_premul(text, colour)
+                assert pygame.image.tobytes(atlas_render, "RGBA") == (
+                    pygame.image.tobytes(pygame_render, "RGBA")
+                ), text
+        assert atlas_font._can_draw_from_glyph_atlas("FPS: 60")
+        assert not atlas_font._can_draw_from_glyph_atlas("yVY")
+        fira_code_font = GUIFontPygame(
+            "pygame_gui/data/FiraCode-Regular.ttf", 14, use_glyph_atlas=True
+        )
+        assert fira_code_font._can_draw_from_glyph_atlas("x 60")
+        assert not fira_code_font._can_draw_from_glyph_atlas("->")
+        assert not fira_code_font._can_draw_from_glyph_atlas("1:2")
+
 
 if __name__ == "__main__":
     pytest.console_main()
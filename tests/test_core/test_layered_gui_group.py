@@ -131,6 +131,189 @@ class TestUIElement:
 
         print(sprite1)
 
+    def test_dirty_rect_mode(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        group = LayeredGUIGroup()
+        surface = pygame.Surface((200, 200), flags=pygame.SRCALPHA, depth=32)
+
+        sprite1 = MyProperSprite(group)
+        sprite1.image = pygame.Surface((20, 20), flags=pygame.SRCALPHA, depth=32)
+        sprite1.image.fill(pygame.Color("#FF0000FF"))
+        sprite1.rect = pygame.Rect(10, 10, 20, 20)
+
+        sprite2 = MyProperSprite(group)
+        sprite2.image = pygame.Surface((20, 20), flags=pygame.SRCALPHA, depth=32)
+        sprite2.image.fill(pygame.Color("#00FF00FF"))
+        sprite2.rect = pygame.Rect(100, 100, 20, 20)
+        group.update(0.01)
+
+        # not in dirty rect mode, so the whole surface changes
+        assert group.draw(surface) == [surface.get_rect()]
+
+        group.set_dirty_rect_mode(True)
+        assert group.get_dirty_rect_mode()
+        assert group.draw(surface) == [surface.get_rect()]
+
+        # nothing has changed
+        assert group.draw(surface) == []
+
+        # moving a sprite dirties both where it was and where it is now
+        sprite1.rect.topleft = (50, 10)
+        dirty_rects = group.draw(surface)
+        assert pygame.Rect(10, 10, 20, 20) in dirty_rects
+        assert pygame.Rect(50, 10, 20, 20) in dirty_rects
+        assert surface.get_at((55, 15)) == pygame.Color("#FF0000FF")
+
+        # overlapping changes are merged
+        sprite1.rect.topleft = (60, 10)
+        assert group.draw(surface) == [pygame.Rect(50, 10, 30, 20)]
+
+        # changing the image dirties just that sprite
+        new_image = pygame.Surface((20, 20), flags=pygame.SRCALPHA, depth=32)
+        new_image.fill(pygame.Color("#0000FFFF"))
+        sprite2.image = new_image
+        assert group.draw(surface) == [pygame.Rect(100, 100, 20, 20)]
+        assert surface.get_at((105, 105)) == pygame.Color("#0000FFFF")
+
+        # hiding and removing dirty the area the sprite used to be drawn in
+        sprite2.visible = False
+        group.update(0.01)
+        assert group.draw(surface) == [pygame.Rect(100, 100, 20, 20)]
+
+        sprite1.kill()
+        background = pygame.Surface((200, 200), depth=32)
+        background.fill(pygame.Color("#000000FF"))
+        assert group.draw(surface, background) == [pygame.Rect(60, 10, 20, 20)]
+        assert surface.get_at((65, 15)) == pygame.Color("#000000FF")
+
+        group.repaint_rect(pygame.Rect(0, 0, 5, 5))
+        assert group.draw(surface) == [pygame.Rect(0, 0, 5, 5)]
+
+        group.set_dirty_rect_mode(False)
+        assert not group.get_dirty_rect_mode()
+
+    def test_get_sprites_near_point(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        group = LayeredGUIGroup()
+
+        lower_sprite = MyProperSprite()
+        lower_sprite.layer = 1
+        lower_sprite.rect = pygame.Rect(0, 0, 100, 100)
+        lower_sprite.add(group)
+
+        higher_sprite = MyProperSprite()
+        higher_sprite.layer = 2
+        higher_sprite.rect = pygame.Rect(50, 50, 100, 100)
+        higher_sprite.add(group)
+
+        later_lower_sprite = MyProperSprite()
+        later_lower_sprite.layer = 1
+        later_lower_sprite.rect = pygame.Rect(0, 0, 10, 10)
+        later_lower_sprite.add(group)
+
+        far_sprite = MyProperSprite(group)
+        far_sprite.rect = pygame.Rect(600, 600, 10, 10)
+
+        assert group.get_sprites_near_point(75, 75) == [
+            higher_sprite,
+            later_lower_sprite,
+            lower_sprite,
+        ]
+        assert group.get_sprites_near_point(605, 605) == [far_sprite]
+
+        # moving and changing layer both keep the index up to date
+        far_sprite.rect = pygame.Rect(60, 60, 10, 10)
+        group.change_layer(lower_sprite, 3)
+        assert group.get_sprites_near_point(65, 65) == [
+            lower_sprite,
+            higher_sprite,
+            later_lower_sprite,
+            far_sprite,
+        ]
+        assert group.get_sprites_near_point(605, 605) == []
+
+        higher_sprite.kill()
+        assert group.get_sprites_near_point(65, 65) == [
+            lower_sprite,
+            later_lower_sprite,
+            far_sprite,
+        ]
+        assert group.get_sprites_near_point(
+            605, 605, extra_sprites=[higher_sprite, far_sprite]
+        ) == [far_sprite]
+
+    def test_layers_top_down(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        group = LayeredGUIGroup()
+
+        sprite1 = MyProperSprite()
+        sprite1.layer = 1
+        sprite1.add(group)
+        sprite2 = MyProperSprite()
+        sprite2.layer = 3
+        sprite2.add(group)
+        sprite3 = MyProperSprite()
+        sprite3.layer = 1
+        sprite3.add(group)
+
+        top_down = group.get_layers_top_down()
+        assert top_down == [(3, (sprite2,)), (1, (sprite3, sprite1))]
+        # cached until something changes
+        assert group.get_layers_top_down() is top_down
+        assert group.get_top_layer() == 3
+
+        group.change_layer(sprite1, 2)
+        assert group.layers() == [1, 2, 3]
+        assert group.get_sprites_from_layer(1) == [sprite3]
+        assert group.get_layers_top_down() == [
+            (3, (sprite2,)),
+            (2, (sprite1,)),
+            (1, (sprite3,)),
+        ]
+
+        sprite2.kill()
+        assert group.layers() == [1, 2]
+        assert group.get_sprites_from_layer(3) == []
+        assert group.get_top_layer() == 2
+        assert group.get_layers_top_down() == [(2, (sprite1,)), (1, (sprite3,))]
+
+    def test_sleeping_sprites(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        class SleepySprite(MyProperSprite):
+            def __init__(self, groups):
+                super().__init__(groups)
+                self.update_count = 0
+                self.work_left = 2
+
+            def update(self, time_delta: float):
+                self.update_count += 1
+                self.work_left = max(0, self.work_left - 1)
+
+            def can_sleep(self) -> bool:
+                return self.work_left == 0
+
+        group = LayeredGUIGroup()
+        sleepy_sprite = SleepySprite(group)
+        insomniac_sprite = MyProperSprite(group)
+
+        for _ in range(5):
+            group.update(0.01)
+        assert sleepy_sprite.update_count == 2
+        assert group.get_awake_sprite_count() == 1
+
+        sleepy_sprite.work_left = 1
+        sleepy_sprite.wake_up()
+        group.update(0.01)
+        group.update(0.01)
+        assert sleepy_sprite.update_count == 3
+
+        insomniac_sprite.kill()
+        assert group.get_awake_sprite_count() == 0
+
 
 if __name__ == "__main__":
     pytest.console_main()
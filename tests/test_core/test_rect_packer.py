@@ -0,0 +1,73 @@
+import pytest
+import pygame
+
+from pygame_gui.core.rect_packer import MaxRectsPacker
+
+
+class TestMaxRectsPacker:
+    def test_creation(self, _init_pygame):
+        packer = MaxRectsPacker((256, 128))
+        assert packer.free_rects == [pygame.Rect(0, 0, 256, 128)]
+        assert packer.get_occupancy() == 0.0
+        assert packer.get_fragmentation() == 0.0
+
+    def test_insert(self, _init_pygame):
+        packer = MaxRectsPacker((100, 100))
+        rect_1 = packer.insert((50, 100))
+        rect_2 = packer.insert((50, 50))
+        rect_3 = packer.insert((50, 50))
+
+        assert rect_1 == pygame.Rect(0, 0, 50, 100)
+        assert not rect_2.colliderect(rect_1)
+        assert not rect_3.colliderect(rect_1)
+        assert not rect_3.colliderect(rect_2)
+        assert packer.get_occupancy() == 1.0
+        assert packer.insert((1, 1)) is None
+        assert packer.insert((0, 10)) is None
+
+    def test_insert_best_short_side_fit(self, _init_pygame):
+        packer = MaxRectsPacker((100, 100))
+        packer.insert((60, 100))
+        packer.insert((40, 40))
+
+        # the 40 wide gap fits exactly, so this goes there rather than anywhere else
+        assert packer.insert((40, 30)) == pygame.Rect(60, 40, 40, 30)
+
+    def test_free(self, _init_pygame):
+        packer = MaxRectsPacker((100, 100))
+        rect_1 = packer.insert((50, 50))
+        rect_2 = packer.insert((50, 50))
+        packer.insert((100, 50))
+
+        packer.free(rect_1)
+        packer.free(rect_2)
+        # the two freed halves merged back into one piece
+        assert packer.insert((100, 50)) is not None
+        assert packer.get_occupancy() == 1.0
+
+    def test_free_everything(self, _init_pygame):
+        packer = MaxRectsPacker((100, 100))
+        rects = [packer.insert((30, 20)) for _ in range(6)]
+        for rect in rects:
+            packer.free(rect)
+
+        assert packer.used_count == 0
+        assert packer.free_rects == [pygame.Rect(0, 0, 100, 100)]
+
+    def test_get_fragmentation(self, _init_pygame):
+        packer = MaxRectsPacker((100, 100))
+        rects = [packer.insert((25, 100)) for _ in range(4)]
+        packer.free(rects[0])
+        packer.free(rects[2])
+
+        assert packer.get_occupancy() == 0.5
+        assert packer.get_fragmentation() == pytest.approx(0.5)
+        assert packer.insert((50, 100)) is None
+
+        packer.clear()
+        assert packer.get_fragmentation() == 0.0
+        assert packer.insert((50, 100)) is not None
+
+
+if __name__ == "__main__":
+    pytest.console_main()
@@ -63,6 +63,27 @@ class TestShadowGenerator:
                 shadow_width_param=-1, corner_radii=[2, 2, 2, 2]
             )
 
+    def test_get_stats(self, _init_pygame, _display_surface_return_none):
+        generator = ShadowGenerator()
+        generator.find_closest_shadow_scale_to_size((50, 50), 2, "rectangle", [4] * 4)
+        generator.find_closest_shadow_scale_to_size((50, 50), 2, "rectangle", [4] * 4)
+        generator.find_closest_shadow_scale_to_size((60, 50), 2, "rectangle", [4] * 4)
+        generator.find_closest_shadow_scale_to_size((50, 50), 2, "ellipse")
+        generator.find_closest_shadow_scale_to_size((52, 52), 2, "ellipse")
+
+        stats = generator.get_stats()
+        assert stats["rect_hits"] == 1 and stats["rect_misses"] == 2
+        assert stats["corner_hits"] == 1 and stats["corner_misses"] == 1
+        assert stats["ellipse_hits"] == 1 and stats["ellipse_misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(3 / 7)
+        assert stats["short_term_rect_count"] == 2
+        assert stats["preloaded_corner_count"] == 1
+        assert stats["ellipse_count"] == 1
+        assert stats["bytes_used"] > (50 * 50 * 4) * 3
+
+        generator.reset_stats()
+        assert generator.get_stats()["hits"] == 0
+
 
 if __name__ == "__main__":
     pytest.console_main()
@@ -0,0 +1,169 @@
+import pygame
+import pytest
+
+from pygame_gui.core.drawable_shapes import RectDrawableShape
+from pygame_gui.core.shape_redraw_scheduler import ShapeRedrawScheduler
+from pygame_gui.elements import UIButton
+from pygame_gui.ui_manager import UIManager
+
+THEMING = {
+    "normal_bg": pygame.Color("#FF0000"),
+    "hovered_bg": pygame.Color("#00FF00"),
+    "selected_bg": pygame.Color("#0000FF"),
+    "normal_border": pygame.Color("#FFFFFF"),
+    "hovered_border": pygame.Color("#FFFFFF"),
+    "selected_border": pygame.Color("#FFFFFF"),
+    "border_width": 1,
+    "shadow_width": 0,
+}
+
+
+class TestShapeRedrawScheduler:
+    def test_inactive_by_default(self, _init_pygame, default_ui_manager: UIManager):
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+        assert isinstance(scheduler, ShapeRedrawScheduler)
+        assert not scheduler.is_active()
+        assert scheduler.get_update_time_budget() is None
+
+        default_ui_manager.set_shape_redraw_time_budget(0.005)
+        assert scheduler.is_active()
+        assert scheduler.get_update_time_budget() == 0.005
+
+    def test_active_states_first(
+        self, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+    ):
+        default_ui_manager.set_shape_redraw_time_budget(0.0)
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+
+        shape = RectDrawableShape(
+            containing_rect=pygame.Rect(0, 0, 100, 100),
+            theming_parameters=THEMING,
+            states=["normal", "hovered", "selected"],
+            manager=default_ui_manager,
+        )
+        shape.states_to_redraw_queue.clear()
+        shape.states_to_redraw_queue.extend(["hovered", "selected", "normal"])
+
+        # the shape leaves its queue to the scheduler
+        shape.update(0.05)
+        assert len(shape.states_to_redraw_queue) == 3
+        assert scheduler.get_scheduled_shape_count() == 1
+
+        # with no time to spare we still redraw one state a loop, the active one first
+        scheduler.update()
+        assert list(shape.states_to_redraw_queue) == ["hovered", "selected"]
+        scheduler.update()
+        assert list(shape.states_to_redraw_queue) == ["selected"]
+        scheduler.update()
+        assert len(shape.states_to_redraw_queue) == 0
+        assert scheduler.get_scheduled_shape_count() == 0
+
+        shape.update(0.05)
+        assert not shape.need_to_clean_up
+
+    def test_time_budget_spreads_work(
+        self, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+    ):
+        default_ui_manager.set_shape_redraw_time_budget(10.0)
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+        shapes = [
+            RectDrawableShape(
+                containing_rect=pygame.Rect(0, 0, 50, 50),
+                theming_parameters=THEMING,
+                states=["normal", "hovered"],
+                manager=default_ui_manager,
+            )
+            for _ in range(5)
+        ]
+        for shape in shapes:
+            shape.states_to_redraw_queue.clear()
+            shape.states_to_redraw_queue.extend(["normal", "hovered"])
+            scheduler.schedule(shape)
+
+        # a generous budget gets through everything in one go
+        scheduler.update()
+        assert all(len(shape.states_to_redraw_queue) == 0 for shape in shapes)
+
+    def test_first_state_left_to_scheduler(
+        self, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+    ):
+        default_ui_manager.set_shape_redraw_time_budget(0.0)
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+
+        shape = RectDrawableShape(
+            containing_rect=pygame.Rect(0, 0, 100, 100),
+            theming_parameters=THEMING,
+            states=["normal", "hovered", "selected"],
+            manager=default_ui_manager,
+        )
+        # nothing is drawn yet, the active state shows a blank surface of the right size
+        assert list(shape.states_to_redraw_queue) == ["normal", "hovered", "selected"]
+        assert scheduler.get_scheduled_shape_count() == 1
+        placeholder = shape.get_fresh_surface()
+        assert placeholder.get_size() == (100, 100)
+        assert placeholder.get_at((50, 50)) == pygame.Color(0, 0, 0, 0)
+
+        scheduler.update()
+        assert list(shape.states_to_redraw_queue) == ["hovered", "selected"]
+        assert shape.has_fresh_surface()
+        assert shape.get_fresh_surface().get_at((50, 50)) == pygame.Color("#FF0000")
+
+        # rebuilding keeps showing the old surface until the new one is drawn
+        old_surface = shape.get_fresh_surface()
+        shape.redraw_all_states()
+        assert shape.get_fresh_surface() is old_surface
+
+        # asking for a state's surface directly draws it straight away
+        assert shape.get_surface("hovered").get_at((50, 50)) == pygame.Color("#00FF00")
+        assert "hovered" not in shape.states_to_redraw_queue
+
+    def test_visible_elements_first(
+        self, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+    ):
+        hidden_button = UIButton(
+            pygame.Rect(10, 10, 100, 30), "Hidden", default_ui_manager, visible=0
+        )
+        off_screen_button = UIButton(
+            pygame.Rect(-200, 10, 100, 30), "Off", default_ui_manager
+        )
+        visible_button = UIButton(
+            pygame.Rect(10, 50, 100, 30), "Visible", default_ui_manager
+        )
+        default_ui_manager.set_shape_redraw_time_budget(0.0)
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+        for button in (hidden_button, off_screen_button, visible_button):
+            button.drawable_shape.redraw_all_states()
+        assert scheduler.get_scheduled_shape_count() == 3
+
+        # the visible button's states all come before either of the others'
+        for _ in range(len(visible_button.drawable_shape.states_to_redraw_queue)):
+            scheduler.update()
+        assert len(visible_button.drawable_shape.states_to_redraw_queue) == 0
+        assert "normal" in hidden_button.drawable_shape.states_to_redraw_queue
+        assert "normal" in off_screen_button.drawable_shape.states_to_redraw_queue
+
+    def test_dead_shapes_unscheduled(
+        self, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+    ):
+        default_ui_manager.set_shape_redraw_time_budget(0.0)
+        scheduler = default_ui_manager.get_shape_redraw_scheduler()
+        button = UIButton(pygame.Rect(10, 10, 100, 30), "Button", default_ui_manager)
+        assert scheduler.get_scheduled_shape_count() == 1
+
+        # a rebuild replaces the shape, only the new one is redrawn
+        old_shape = button.drawable_shape
+        button.rebuild()
+        assert button.drawable_shape is not old_shape
+        assert scheduler.get_scheduled_shape_count() == 1
+
+        button.kill()
+        assert scheduler.get_scheduled_shape_count() == 0
+
+        UIButton(pygame.Rect(10, 10, 100, 30), "Button", default_ui_manager)
+        assert scheduler.get_scheduled_shape_count() == 1
+        default_ui_manager.clear_and_reset()
+        assert scheduler.get_scheduled_shape_count() == 0
+
+
+if __name__ == "__main__":
+    pytest.console_main()
@@ -0,0 +1,49 @@
+import pytest
+import pygame
+
+from pygame_gui.core.spatial_hash_grid import SpatialHashGrid
+
+
+class TestSpatialHashGrid:
+    def test_update_and_query(self):
+        grid = SpatialHashGrid(cell_size=100)
+        grid.update("a", pygame.Rect(0, 0, 50, 50))
+        grid.update("b", pygame.Rect(50, 50, 100, 100))
+
+        assert grid.query_point(10, 10) == {"a", "b"}
+        assert grid.query_point(120, 120) == {"b"}
+        assert grid.query_point(500, 500) == set()
+        assert len(grid) == 2 and "a" in grid
+
+        grid.update("a", pygame.Rect(400, 400, 50, 50))
+        assert grid.query_point(10, 10) == {"b"}
+        assert grid.query_point(450, 450) == {"a"}
+
+        # empty rects drop out of the grid
+        grid.update("b", pygame.Rect(50, 50, 0, 0))
+        assert "b" not in grid
+        assert grid.query_point(120, 120) == set()
+
+        grid.remove("a")
+        assert len(grid) == 0
+
+    def test_unbounded_items(self):
+        grid = SpatialHashGrid(cell_size=10, max_cells_per_item=4)
+        grid.add_unbounded("window")
+        grid.update("huge", pygame.Rect(0, 0, 1000, 1000))
+        grid.update("small", pygame.Rect(0, 0, 5, 5))
+
+        assert grid.query_point(5000, -5000) == {"window", "huge"}
+        assert grid.query_point(1, 1) == {"window", "huge", "small"}
+
+        # shrinking a huge item puts it back in the cells
+        grid.update("huge", pygame.Rect(20, 20, 5, 5))
+        assert grid.query_point(5000, -5000) == {"window"}
+        assert grid.query_point(21, 21) == {"window", "huge"}
+
+        grid.clear()
+        assert len(grid) == 0 and grid.items() == set()
+
+
+if __name__ == "__main__":
+    pytest.console_main()
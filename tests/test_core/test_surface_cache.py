@@ -1,7 +1,13 @@
 import pytest
 import pygame
 
-from pygame_gui.core.surface_cache import SurfaceCache
+from pygame_gui.core.colour_gradient import ColourGradient
+from pygame_gui.core.surface_cache import (
+    SurfaceCache,
+    ShapeCacheKey,
+    LRUEvictionPolicy,
+    GDSFEvictionPolicy,
+)
 
 
 class TestSurfaceCache:
@@ -148,6 +154,115 @@ class TestSurfaceCache:
             cache_id == "rectangle_64_64_1_1_1_1_1_5_5_5_5_255_0_0_255_100_200_100_180"
         )
 
+    def test_build_cache_key(self, _init_pygame, _display_surface_return_none):
+        border_widths = {"left": 1, "right": 1, "top": 1, "bottom": 1}
+        cache_key = SurfaceCache.build_cache_key(
+            shape="rectangle",
+            size=(64, 64),
+            shadow_width=1,
+            border_widths=border_widths,
+            border_colour=pygame.Color(255, 0, 0, 255),
+            bg_colour=pygame.Color(100, 200, 100, 180),
+            corner_radius=[5, 5, 5, 5],
+        )
+        assert isinstance(cache_key, ShapeCacheKey)
+        assert (
+            str(cache_key)
+            == "rectangle_64_64_1_1_1_1_1_5_5_5_5_255_0_0_255_100_200_100_180"
+        )
+
+        same_key = ShapeCacheKey(
+            "rectangle",
+            (64, 64),
+            1,
+            border_widths,
+            pygame.Color(255, 0, 0, 255),
+            pygame.Color(100, 200, 100, 180),
+            [5, 5, 5, 5],
+        )
+        assert same_key == cache_key
+        assert hash(same_key) == hash(cache_key)
+        assert same_key != str(cache_key)
+
+        gradient_key = ShapeCacheKey(
+            "ellipse",
+            (64, 64),
+            0,
+            border_widths,
+            pygame.Color(255, 0, 0, 255),
+            ColourGradient(90, pygame.Color("#FF0000"), pygame.Color("#0000FF")),
+        )
+        assert gradient_key == ShapeCacheKey(
+            "ellipse",
+            (64, 64),
+            0,
+            border_widths,
+            pygame.Color(255, 0, 0, 255),
+            ColourGradient(90, pygame.Color("#FF0000"), pygame.Color("#0000FF")),
+        )
+        assert gradient_key != ShapeCacheKey(
+            "ellipse",
+            (64, 64),
+            0,
+            border_widths,
+            pygame.Color(255, 0, 0, 255),
+            ColourGradient(180, pygame.Color("#FF0000"), pygame.Color("#0000FF")),
+        )
+
+        cache = SurfaceCache()
+        cache.add_surface_to_cache(pygame.Surface((64, 64)), cache_key)
+        cache.update()
+        assert cache.find_surface_in_cache(same_key) is not None
+
+    def test_save_and_load(self, _init_pygame, _display_surface_return_none, tmp_path):
+        cache = SurfaceCache()
+        shape_key = SurfaceCache.build_cache_key(
+            "rounded_rectangle",
+            (64, 32),
+            2,
+            {"left": 1, "right": 1, "top": 1, "bottom": 1},
+            pygame.Color("#FF0000FF"),
+            ColourGradient(90, pygame.Color("#FF0000"), pygame.Color("#0000FF")),
+            [4, 4, 4, 4],
+        )
+        shape_surface = pygame.Surface((64, 32), flags=pygame.SRCALPHA, depth=32)
+        shape_surface.fill(pygame.Color(100, 50, 25, 128))
+        cache.add_surface_to_cache(shape_surface, shape_key)
+        cache.update()
+        string_surface = pygame.Surface((16, 16), flags=pygame.SRCALPHA, depth=32)
+        string_surface.fill(pygame.Color("#00FF00FF"))
+        # not moved to the long term cache yet, saving does that
+        cache.add_surface_to_cache(string_surface, "doop")
+
+        assert cache.save_to_directory(tmp_path, "v1")
+        assert (tmp_path / SurfaceCache.persistent_index_file_name).exists()
+
+        loaded_cache = SurfaceCache()
+        assert loaded_cache.load_from_directory(tmp_path, "v1")
+        loaded_shape = loaded_cache.find_surface_in_cache(shape_key)
+        assert loaded_shape.get_size() == (64, 32)
+        assert loaded_shape.get_at((10, 10)) == pygame.Color(100, 50, 25, 128)
+        assert loaded_cache.find_surface_in_cache("doop").get_at((8, 8)) == (
+            pygame.Color("#00FF00FF")
+        )
+
+        # with something already cached, loaded surfaces are packed in around it
+        busy_cache = SurfaceCache()
+        busy_cache.add_surface_to_cache(pygame.Surface((32, 32)), "busy")
+        busy_cache.update()
+        assert busy_cache.load_from_directory(tmp_path, "v1")
+        assert len(busy_cache.cache_long_term_lookup) == 3
+        assert busy_cache.find_surface_in_cache(shape_key).get_at((10, 10)) == (
+            pygame.Color(100, 50, 25, 128)
+        )
+
+        assert not SurfaceCache().load_from_directory(tmp_path, "v2")
+        assert not SurfaceCache().load_from_directory(tmp_path / "missing", "v1")
+
+        (tmp_path / SurfaceCache.persistent_index_file_name).write_text("{not json")
+        with pytest.warns(UserWarning, match="Unable to load shape cache"):
+            assert not SurfaceCache().load_from_directory(tmp_path, "v1")
+
     def test_expand_lt_cache(self, _init_pygame, _display_surface_return_none):
         cache = SurfaceCache()
         assert not cache.low_on_space
@@ -155,6 +270,258 @@ class TestSurfaceCache:
         cache._expand_lt_cache()
         assert cache.low_on_space
 
+    def test_free_clears_space(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache()
+        surface = pygame.Surface((64, 64), flags=pygame.SRCALPHA, depth=32)
+        surface.fill(pygame.Color("#FF0000FF"))
+        cache.add_surface_to_cache(surface, "doop")
+        cache.update()
+        cached_surface = cache.cache_long_term_lookup["doop"]["surface"]
+        offset = cached_surface.get_offset()
+
+        cache.remove_user_and_request_clean_up_of_cached_item("doop")
+        assert cache.cache_surfaces[0]["surface"].get_at(offset) == pygame.Color(
+            "#00000000"
+        )
+        assert cache.cache_surfaces[0]["packer"].get_occupancy() == 0.0
+
+    def test_defragment(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache()
+        cache.cache_surface_size = (256, 256)
+        cache.cache_surfaces = [cache._create_cache_surface()]
+
+        colours = {}
+        for index in range(16):
+            surface = pygame.Surface((64, 64), flags=pygame.SRCALPHA, depth=32)
+            colours[str(index)] = pygame.Color(index * 10, 255 - index * 10, 100, 255)
+            surface.fill(colours[str(index)])
+            cache.add_surface_to_cache(surface, str(index))
+            cache.update()
+        assert cache.cache_surfaces[0]["packer"].get_occupancy() == 1.0
+
+        # free a checkerboard, leaving plenty of space but no 128x128 gap
+        for index in range(16):
+            if (index % 4 + index // 4) % 2 == 0:
+                cache.remove_user_and_request_clean_up_of_cached_item(str(index))
+                del colours[str(index)]
+        assert cache.cache_surfaces[0]["packer"].get_occupancy() == 0.5
+
+        big_surface = pygame.Surface((128, 128), flags=pygame.SRCALPHA, depth=32)
+        big_surface.fill(pygame.Color("#FFFFFFFF"))
+        cache.add_surface_to_cache(big_surface, "big")
+        cache.update()
+        assert len(cache.cache_surfaces) == 2
+        assert cache._defragment_check_needed
+
+        # repacking happens a few surfaces at a time when the cache is otherwise idle
+        cache.update()
+        assert cache._defragment_source is cache.cache_surfaces[0]
+        cache.update()
+        assert cache._defragment_source is None
+
+        packer = cache.cache_surfaces[0]["packer"]
+        assert packer.get_fragmentation() < cache.defragment_threshold
+        assert packer.insert((128, 128)) is not None
+        for string_id, colour in colours.items():
+            assert cache.find_surface_in_cache(string_id).get_at((32, 32)) == colour
+        assert cache.find_surface_in_cache("big").get_at((64, 64)) == pygame.Color(
+            "#FFFFFFFF"
+        )
+
+    def test_set_memory_budget(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache()
+        assert cache.max_cache_surfaces == 3
+        assert cache.get_memory_usage() == 1024 * 1024 * 4
+
+        cache.set_memory_budget(8 * 1024 * 1024 * 4)
+        assert cache.max_cache_surfaces == 8
+
+        for index in range(3):
+            cache.add_surface_to_cache(pygame.Surface((1024, 1024)), str(index))
+            cache.update()
+        assert len(cache.cache_surfaces) == 3
+        assert cache.get_memory_usage() == 3 * 1024 * 1024 * 4
+
+        # shrinking throws away whole atlases
+        cache.set_memory_budget(2 * 1024 * 1024 * 4)
+        assert len(cache.cache_surfaces) == 2
+        assert len(cache.cache_long_term_lookup) == 2
+
+        # less than one full atlas uses one smaller atlas
+        cache.set_memory_budget(1024 * 1024)
+        assert cache.cache_surface_size == (512, 512)
+        assert cache.get_memory_usage() <= 1024 * 1024
+        assert len(cache.cache_long_term_lookup) == 0
+
+        with pytest.raises(ValueError):
+            cache.set_memory_budget(0)
+
+    def test_eviction(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(memory_budget=256 * 256 * 4)
+        assert isinstance(cache.eviction_policy, LRUEvictionPolicy)
+        for index in range(4):
+            cache.add_surface_to_cache(pygame.Surface((128, 128)), str(index))
+            cache.update()
+            cache.remove_user_from_cache_item(str(index))
+        assert len(cache.cache_long_term_lookup) == 4
+
+        # used twice then abandoned, so the old purging would have kept it forever
+        cache.find_surface_in_cache("0")
+        cache.remove_user_from_cache_item("0")
+        # still in use, so can't be evicted
+        cache.find_surface_in_cache("1")
+
+        cache.add_surface_to_cache(pygame.Surface((128, 128)), "new")
+        cache.update()
+        assert "new" in cache.cache_long_term_lookup
+        # the least recently used unused surface went first
+        assert "2" not in cache.cache_long_term_lookup
+        assert cache.get_memory_usage() == 256 * 256 * 4
+
+    def test_eviction_lfu(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(memory_budget=256 * 256 * 4, eviction_policy="lfu")
+        for index in range(4):
+            cache.add_surface_to_cache(pygame.Surface((128, 128)), str(index))
+            cache.update()
+            cache.remove_user_from_cache_item(str(index))
+        for string_id in ["0", "0", "1", "1", "3", "3", "2"]:
+            cache.find_surface_in_cache(string_id)
+            cache.remove_user_from_cache_item(string_id)
+
+        cache.add_surface_to_cache(pygame.Surface((128, 128)), "new")
+        cache.update()
+        assert "2" not in cache.cache_long_term_lookup
+        assert len(cache.cache_long_term_lookup) == 4
+
+    def test_eviction_gdsf(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(memory_budget=256 * 256 * 4)
+        cache.set_eviction_policy("gdsf")
+        assert isinstance(cache.eviction_policy, GDSFEvictionPolicy)
+        cache.add_surface_to_cache(pygame.Surface((256, 128)), "big")
+        cache.update()
+        for index in range(4):
+            cache.add_surface_to_cache(pygame.Surface((64, 64)), str(index))
+            cache.update()
+        for string_id in ["big"] + [str(index) for index in range(4)]:
+            cache.remove_user_from_cache_item(string_id)
+        cache.find_surface_in_cache("big")
+        cache.remove_user_from_cache_item("big")
+
+        # the big surface is used most, but least for its size
+        cache.add_surface_to_cache(pygame.Surface((256, 128)), "new")
+        cache.update()
+        assert "big" not in cache.cache_long_term_lookup
+        assert len(cache.cache_long_term_lookup) == 5
+        assert cache.eviction_policy.inflation > 0.0
+
+        with pytest.raises(ValueError):
+            cache.set_eviction_policy("random")
+
+    def test_short_term_users_released(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        cache = SurfaceCache()
+        cache.add_surface_to_cache(pygame.Surface((64, 64)), "doop")
+        cache.find_surface_in_cache("doop")
+        cache.remove_user_from_cache_item("doop")
+        cache.update()
+
+        assert cache.cache_long_term_lookup["doop"]["current_uses"] == 1
+        assert cache.cache_long_term_lookup["doop"]["total_uses"] == 2
+
+    def test_promotion_time_budget(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(promotion_time_budget=None)
+        for index in range(3):
+            cache.add_surface_to_cache(pygame.Surface((32, 32)), str(index))
+        cache.update()
+        assert len(cache.cache_short_term_lookup) == 2
+
+        cache = SurfaceCache(promotion_time_budget=10.0)
+        for index in range(3):
+            cache.add_surface_to_cache(pygame.Surface((32, 32)), str(index))
+        cache.add_surface_to_cache(pygame.Surface((32, 64)), "tall")
+        cache.update()
+        assert len(cache.cache_short_term_lookup) == 0
+        assert len(cache.cache_long_term_lookup) == 4
+        # promoted tallest first, so the tall one went in the corner
+        assert cache.cache_long_term_lookup["tall"]["surface"].get_offset() == (0, 0)
+
+        # a zero budget still moves one surface each update
+        cache.set_promotion_time_budget(0.0)
+        cache.add_surface_to_cache(pygame.Surface((32, 32)), "a")
+        cache.add_surface_to_cache(pygame.Surface((32, 32)), "b")
+        cache.update()
+        assert len(cache.cache_short_term_lookup) == 1
+
+    def test_flush(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(memory_budget=256 * 256 * 4, promotion_time_budget=0.0)
+        for index in range(20):
+            surface = pygame.Surface((64, 64), flags=pygame.SRCALPHA, depth=32)
+            surface.fill(pygame.Color(index * 10, 0, 0, 255))
+            cache.add_surface_to_cache(surface, str(index))
+            cache.remove_user_from_cache_item(str(index))
+        cache.flush()
+
+        assert len(cache.cache_short_term_lookup) == 0
+        # only sixteen fit, the single use surfaces made way for the rest
+        assert len(cache.cache_long_term_lookup) == 16
+        for string_id, cached_item in cache.cache_long_term_lookup.items():
+            assert cached_item["surface"].get_at((32, 32)) == pygame.Color(
+                int(string_id) * 10, 0, 0, 255
+            )
+
+    def test_find_shared_surface_in_cache(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        cache = SurfaceCache()
+        assert cache.find_shared_surface_in_cache("doop") is None
+        cache.add_surface_to_cache(pygame.Surface((64, 64)), "doop")
+        cache.update()
+
+        shared_surface = cache.find_shared_surface_in_cache("doop")
+        assert shared_surface.get_parent() is None
+        assert cache.find_shared_surface_in_cache("doop") is shared_surface
+        assert cache.get_stats()["shared_hits"] == 1
+        assert cache.get_stats()["shared_count"] == 1
+
+        # only kept while someone is using it
+        del shared_surface
+        assert cache.get_stats()["shared_count"] == 0
+        assert cache.find_shared_surface_in_cache("doop") is not None
+
+    def test_get_stats(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(memory_budget=256 * 256 * 4)
+        stats = cache.get_stats()
+        assert stats["hits"] == 0 and stats["misses"] == 0
+        assert stats["hit_rate"] == 0.0
+
+        assert cache.find_surface_in_cache("doop") is None
+        cache.add_surface_to_cache(pygame.Surface((128, 128)), "doop")
+        cache.find_surface_in_cache("doop")
+        cache.update()
+        cache.find_surface_in_cache("doop")
+        for index in range(4):
+            cache.add_surface_to_cache(pygame.Surface((128, 128)), str(index))
+            cache.update()
+            cache.remove_user_from_cache_item(str(index))
+
+        stats = cache.get_stats()
+        assert stats["short_term_hits"] == 1
+        assert stats["long_term_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["evictions"] == 1
+        assert stats["short_term_count"] == 0
+        assert stats["long_term_count"] == 4
+        assert stats["cache_surfaces"] == 1
+        assert stats["occupancy"] == 1.0
+        assert stats["bytes_used"] == stats["memory_budget"] == 256 * 256 * 4
+
+        cache.reset_stats()
+        stats = cache.get_stats()
+        assert stats["hits"] == stats["misses"] == stats["evictions"] == 0
+        assert stats["long_term_count"] == 4
+
 
 if __name__ == "__main__":
     pytest.console_main()
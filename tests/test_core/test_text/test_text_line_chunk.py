@@ -517,6 +517,87 @@ class TestTextLineChunkFTFont:
         letter_index = chunk.x_pos_to_letter_index(x_pos=100)
         assert letter_index == 8
 
+    def test_prefix_widths(self, _init_pygame, _display_surface_return_none):
+        the_font = GUIFontFreetype(None, 30)
+
+        chunk = TextLineChunkFTFont(
+            text="test this text to wrap",
+            font=the_font,
+            underlined=False,
+            colour=pygame.Color("#FFFFFF"),
+            using_default_text_colour=False,
+            bg_colour=pygame.Color("#FF00FF"),
+        )
+
+        prefix_widths = chunk._get_prefix_widths()
+        assert len(prefix_widths) == len(chunk.text) + 1
+        assert prefix_widths[0] == 0
+        assert prefix_widths[-1] == the_font.get_rect(chunk.text).width
+        assert chunk._get_prefix_widths() is prefix_widths
+
+        # the split points found match the widest rendered prefix that fits
+        for requested_x in range(0, chunk.width, 5):
+            expected_point = 0
+            for point in chunk.split_points:
+                if the_font.get_rect(chunk.text[:point]).width <= requested_x:
+                    expected_point = point
+            assert chunk._find_optimum_split_point(requested_x) == expected_point
+
+        chunk.insert_text("longer ", 5)
+        assert chunk._prefix_widths is None
+        assert len(chunk._get_prefix_widths()) == len(chunk.text) + 1
+        chunk.delete_letter_at_index(0)
+        assert len(chunk._get_prefix_widths()) == len(chunk.text) + 1
+
+    def test_shadow_mask(self, _init_pygame, _display_surface_return_none):
+        the_font = GUIFontFreetype(None, 30)
+
+        chunk = TextLineChunkFTFont(
+            text="test this",
+            font=the_font,
+            underlined=False,
+            colour=pygame.Color("#FFFFFF"),
+            using_default_text_colour=False,
+            bg_colour=pygame.Color("#00000000"),
+            text_shadow_data=(2, 0, 0, pygame.Color("#FF0000"), False),
+        )
+
+        shadow_mask = chunk._get_shadow_mask(chunk.text, (100, 40), (0, 0), 2)
+        assert shadow_mask.get_size() == (104, 44)
+        assert chunk._get_shadow_mask(chunk.text, (100, 40), (0, 0), 2) is shadow_mask
+        assert chunk._get_shadow_mask(chunk.text, (100, 40), (0, 0), 3) is not shadow_mask
+
+        # a second chunk with the same text and shadow shares the mask
+        other_chunk = TextLineChunkFTFont(
+            text="test this",
+            font=the_font,
+            underlined=False,
+            colour=pygame.Color("#00FF00"),
+            using_default_text_colour=False,
+            bg_colour=pygame.Color("#00000000"),
+            text_shadow_data=(2, 0, 0, pygame.Color("#FF0000"), False),
+        )
+        assert other_chunk._get_shadow_mask(chunk.text, (100, 40), (0, 0), 2) is (
+            shadow_mask
+        )
+
+        layout_surface = pygame.Surface((200, 300), depth=32, flags=pygame.SRCALPHA)
+        layout_surface.fill((0, 0, 0, 0))
+        chunk.finalise(
+            layout_surface,
+            pygame.Rect(0, 0, 200, 300),
+            chunk.y_origin,
+            chunk.height,
+            chunk.height,
+            chunk.row_line_spacing_height,
+        )
+        # the red shadow is drawn around the white text
+        assert any(
+            layout_surface.get_at((x, y)) == pygame.Color("#FF0000")
+            for x in range(chunk.width)
+            for y in range(chunk.height)
+        )
+
     def test_redraw(
         self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager
     ):
@@ -0,0 +1,42 @@
+import pytest
+import pygame
+
+from pygame_gui.core.text_measurement_cache import TextMeasurementCache
+
+
+class TestTextMeasurementCache:
+    def test_creation(self, _init_pygame):
+        TextMeasurementCache()
+
+    def test_find_measurement(self, _init_pygame):
+        cache = TextMeasurementCache()
+        assert cache.find_measurement("hello") is None
+
+        cache.add_measurement("hello", pygame.Rect(0, 0, 40, 12))
+        assert cache.find_measurement("hello") == pygame.Rect(0, 0, 40, 12)
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["count"] == 1
+
+        cache.reset_stats()
+        assert cache.get_stats()["hits"] == 0
+        cache.clear()
+        assert cache.get_stats()["count"] == 0
+
+    def test_least_recently_used_dropped(self, _init_pygame):
+        cache = TextMeasurementCache(max_measurements=2)
+        cache.add_measurement("one", 1)
+        cache.add_measurement("two", 2)
+        assert cache.find_measurement("one") == 1
+
+        cache.add_measurement("three", 3)
+        assert cache.find_measurement("two") is None
+        assert cache.find_measurement("one") == 1
+        assert cache.find_measurement("three") == 3
+
+
+if __name__ == "__main__":
+    pytest.console_main()
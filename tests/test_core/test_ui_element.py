@@ -735,11 +735,28 @@ class TestUIElement:
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
         assert after_clip_out_clip_colour == pygame.Color(200, 80, 80, 255)
         element._set_image_clip(pygame.Rect(0, 0, 25, 50))
-        after_clip_in_clip_colour = element.image.get_at((15, 25))
-        after_clip_out_clip_colour = element.image.get_at((35, 25))
-        assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
-        assert after_clip_out_clip_colour == pygame.Color(0, 0, 0, 0)
+        assert element.blit_data[2] == pygame.Rect(0, 0, 25, 50)
+        default_ui_manager.update(0.01)
+        test_surface = pygame.Surface((50, 50), flags=pygame.SRCALPHA, depth=32)
+        default_ui_manager.get_sprite_group().draw(test_surface)
+        assert test_surface.get_at((15, 25)) == pygame.Color(200, 80, 80, 255)
+        assert test_surface.get_at((35, 25)) == pygame.Color(0, 0, 0, 0)
+        # the image itself is not altered by clipping
+        assert element.image.get_at((35, 25)) == pygame.Color(200, 80, 80, 255)
+
+        element._set_image_clip(pygame.Rect(25, 0, 25, 50))
+        assert element.blit_data[1] == pygame.Rect(25, 0, 25, 50)
+        element.rect.topleft = (10, 10)
+        element._update_blit_position()
+        assert element.blit_data[1] == pygame.Rect(35, 10, 25, 50)
+        test_surface.fill(pygame.Color(0, 0, 0, 0))
+        default_ui_manager.get_sprite_group().draw(test_surface)
+        assert test_surface.get_at((30, 25)) == pygame.Color(0, 0, 0, 0)
+        assert test_surface.get_at((40, 25)) == pygame.Color(200, 80, 80, 255)
+
         element._set_image_clip(None)
+        assert element.blit_data[1] is element.rect
+        assert element.blit_data[2] is None
         after_clip_in_clip_colour = element.image.get_at((15, 25))
         after_clip_out_clip_colour = element.image.get_at((35, 25))
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
@@ -772,7 +789,8 @@ class TestUIElement:
 
         element._set_image_clip(pygame.Rect(0, 0, 0, 0))
         element._set_image(coloured_surface_1)
-        assert element.image == default_ui_manager.get_universal_empty_surface()
+        assert element.image.get_at((10, 10)) == pygame.Color(200, 80, 80, 255)
+        assert element.blit_data[2].size == (0, 0)
 
         element._set_image_clip(None)
         element._set_image(None)
@@ -11,6 +11,22 @@ class TestUIFontDictionary:
         )
         assert font_dictionary.loaded_fonts is not None
 
+    def test_set_glyph_atlas_rendering(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        font_dictionary = UIFontDictionary(
+            BlockingThreadedResourceLoader(), locale="en"
+        )
+        assert not font_dictionary.get_default_font().use_glyph_atlas
+
+        font_dictionary.set_glyph_atlas_rendering(True)
+        assert font_dictionary.get_default_font().use_glyph_atlas
+        font_dictionary.preload_font(18, "noto_sans", force_immediate_load=True)
+        assert font_dictionary.find_font(18, "noto_sans").use_glyph_atlas
+
+        font_dictionary.set_glyph_atlas_rendering(False)
+        assert not font_dictionary.find_font(18, "noto_sans").use_glyph_atlas
+
     def test_load_default_font_from_strings(
         self, _init_pygame, _display_surface_return_none
     ):
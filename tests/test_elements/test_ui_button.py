@@ -3272,6 +3272,42 @@ class TestUIButton:
         finally:
             os.unlink(theme_file)
 
+    def test_shared_state_surfaces(
+        self, _init_pygame, default_ui_manager, _display_surface_return_none
+    ):
+        buttons = [
+            UIButton(
+                relative_rect=pygame.Rect(10, 10 + (index * 40), 150, 30),
+                text="" if index < 3 else "Same",
+                manager=default_ui_manager,
+            )
+            for index in range(5)
+        ]
+        for _ in range(3):
+            default_ui_manager.update(0.01)
+            default_ui_manager.update(0.01)
+        for button in buttons:
+            button.rebuild()
+
+        # identical buttons without text all show the same surface
+        first_state = buttons[1].drawable_shape.states["normal"]
+        second_state = buttons[2].drawable_shape.states["normal"]
+        assert first_state.surface_is_shared
+        assert first_state.surface is second_state.surface
+        assert buttons[1].image is buttons[2].image
+
+        # with text each gets its own surface on top of the same background
+        text_state = buttons[3].drawable_shape.states["normal"]
+        other_text_state = buttons[4].drawable_shape.states["normal"]
+        assert text_state.surface is not other_text_state.surface
+        assert text_state.pre_text_surface is other_text_state.pre_text_surface
+        assert text_state.pre_text_surface is not text_state.surface
+
+        # images that may be drawn on are always the element's own copy
+        buttons[1]._set_image(first_state.surface)
+        assert buttons[1].image is not first_state.surface
+        assert buttons[2].image is first_state.surface
+
 
 if __name__ == "__main__":
     pytest.console_main()
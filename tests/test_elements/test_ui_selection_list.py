@@ -256,6 +256,77 @@ class TestUISelectionList:
         with pytest.raises(ValueError):
             selection_list.set_item_list([1, 2, 3])
 
+    def test_virtualized(
+        self, _init_pygame, default_ui_manager, _display_surface_return_none: None
+    ):
+        selection_list = UISelectionList(
+            relative_rect=pygame.Rect(50, 50, 150, 106),
+            item_list=[f"item {index}" for index in range(100000)]
+            + [("special item", "#special")],
+            manager=default_ui_manager,
+            virtualized=True,
+            default_selection="item 1",
+        )
+        pygame.event.clear()
+
+        # a fixed pool of rows, however long the list
+        assert selection_list.item_list == []
+        row_count = len(selection_list._row_buttons)
+        assert row_count == (100 // 20) + 2
+        assert len(selection_list.item_list_container.elements) == row_count
+        assert selection_list._row_buttons[1].text == "item 1"
+        assert selection_list._row_buttons[1].is_selected
+        assert selection_list.get_single_selection() == "item 1"
+
+        # scrolling hands the rows new items
+        selection_list.scroll_bar.start_percentage = 0.5
+        selection_list.scroll_bar.has_moved_recently = True
+        selection_list.update(0.01)
+        assert len(selection_list.item_list_container.elements) == row_count
+        first_index = int(
+            0.5 * selection_list.total_height_of_list
+        ) // selection_list.list_item_height
+        first_button = selection_list._row_buttons[first_index % row_count]
+        assert first_button.text == f"item {first_index}"
+        assert not any(button.is_selected for button in selection_list._row_buttons)
+
+        # pressing a row selects the item it is showing, and drops the old selection
+        select_event = pygame.event.Event(
+            pygame_gui.UI_BUTTON_PRESSED, {"ui_element": first_button}
+        )
+        selection_list.process_event(select_event)
+        event_texts = {
+            event.type: event.text
+            for event in pygame.event.get()
+            if event.type
+            in [
+                pygame_gui.UI_SELECTION_LIST_NEW_SELECTION,
+                pygame_gui.UI_SELECTION_LIST_DROPPED_SELECTION,
+            ]
+        }
+        assert event_texts == {
+            pygame_gui.UI_SELECTION_LIST_NEW_SELECTION: f"item {first_index}",
+            pygame_gui.UI_SELECTION_LIST_DROPPED_SELECTION: "item 1",
+        }
+        assert first_button.is_selected
+        assert selection_list.get_single_selection() == f"item {first_index}"
+        assert selection_list.get_single_selection_start_percentage() == pytest.approx(
+            first_index / 100001
+        )
+
+        # rows keep their object IDs in step with their items
+        selection_list.scroll_bar.start_percentage = 1.0
+        selection_list.scroll_bar.has_moved_recently = True
+        selection_list.update(0.01)
+        last_button = selection_list._get_row_button_for_item(100000)
+        assert last_button is not None
+        assert last_button.text == "special item"
+        assert last_button.object_ids[-1] == "#special"
+
+        # resizing grows the pool to match
+        selection_list.set_dimensions((150, 206))
+        assert len(selection_list._row_buttons) == (200 // 20) + 2
+
     def test_process_event(
         self, _init_pygame, default_ui_manager, _display_surface_return_none: None
     ):
@@ -48,6 +48,66 @@ class TestUIStatusBar:
 
         assert health_bar.percent_full == 0.5
 
+    def test_incremental_redraw(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        health_bar = UIStatusBar(
+            relative_rect=pygame.Rect(100, 100, 150, 30),
+            manager=default_ui_manager,
+        )
+
+        for percent_full in [0.0, 0.33, 1.0, 0.5]:
+            health_bar.percent_full = percent_full
+            health_bar.update(0.01)
+            full_redraw = health_bar._create_bar_shape(percent_full, None)
+            assert compare_surfaces(full_redraw.get_fresh_surface(), health_bar.image)
+
+        # changes smaller than a pixel of bar don't redraw anything
+        image = health_bar.image
+        health_bar.percent_full = 0.501
+        health_bar.update(0.01)
+        assert health_bar.image is image
+
+        # bars set directly, rather than monitoring something, can sleep
+        assert health_bar.can_sleep()
+        health_bar.percent_full = 0.75
+        assert not health_bar.can_sleep()
+        health_bar.update(0.01)
+        assert health_bar.can_sleep()
+
+    def test_incremental_redraw_rounded_rectangle(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        manager = UIManager(
+            (800, 600),
+            os.path.join(
+                "tests", "data", "themes", "ui_status_bar_rounded_rectangle.json"
+            ),
+        )
+        health_bar = UIStatusBar(
+            relative_rect=pygame.Rect(100, 100, 150, 30),
+            manager=manager,
+        )
+        assert health_bar.shape == "rounded_rectangle"
+        assert health_bar._filled_bar_surface is not None
+
+        for percent_full in [0.0, 0.02, 0.33, 1.0, 0.5]:
+            health_bar.percent_full = percent_full
+            health_bar.update(0.01)
+            full_redraw = health_bar._create_bar_shape(
+                percent_full, None
+            ).get_fresh_surface()
+            # a full redraw anti-aliases a filled edge that falls part way into a pixel,
+            # the pasted together bar fills whole pixels, so skip that one column
+            edge_x = health_bar.capacity_rect.x + int(
+                percent_full * health_bar.capacity_rect.width
+            )
+            for x in range(full_redraw.get_width()):
+                if x == edge_x:
+                    continue
+                for y in range(full_redraw.get_height()):
+                    assert full_redraw.get_at((x, y)) == health_bar.image.get_at((x, y))
+
     def test_rebuild_from_theme_data_non_default(
         self, _init_pygame, _display_surface_return_none
     ):
@@ -115,6 +115,38 @@ class TestUITextBox:
         text_box.clear()
         assert text_box.image is not None
 
+    def test_append_html_text(
+        self,
+        _init_pygame: None,
+        default_ui_manager: UIManager,
+        _display_surface_return_none,
+    ):
+        text_box = UITextBox(
+            html_text="First line<br>",
+            relative_rect=pygame.Rect(100, 100, 200, 100),
+            manager=default_ui_manager,
+        )
+        for line in range(40):
+            text_box.append_html_text(f"Appended line {line}<br>")
+        layout = text_box.text_box_layout
+
+        # the finalised surface grows in steps, rather than being made anew every line
+        grown_surface = layout.finalised_surface
+        assert grown_surface.get_height() >= layout.layout_rect.height
+        text_box.append_html_text("One more line<br>")
+        assert layout.finalised_surface is grown_surface
+        assert layout.plain_text.endswith("Appended line 39\nOne more line\n")
+
+        # the rows finalised one at a time match finalising the whole layout again
+        appended_rows = grown_surface.subsurface(
+            (0, 0), (grown_surface.get_width(), layout.layout_rect.height)
+        ).copy()
+        assert compare_surfaces(appended_rows, layout.finalise_to_new())
+
+        # chunks finalised before the surface grew redraw onto the new one
+        first_chunk = layout.layout_rows[0].items[0]
+        assert first_chunk.target_surface is layout.finalised_surface
+
     def test_creation_grow_to_fit_width(
         self,
         _init_pygame: None,
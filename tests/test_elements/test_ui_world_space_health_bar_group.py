@@ -0,0 +1,90 @@
+import pygame
+import pytest
+
+from pygame_gui.ui_manager import UIManager
+from pygame_gui.elements.ui_world_space_health_bar_group import (
+    UIWorldSpaceHealthBarGroup,
+)
+
+
+class ArrayLike(list):
+    """Stands in for a NumPy array, which we turn into a list before drawing."""
+
+    def tolist(self):
+        return list(self)
+
+
+class TestUIWorldSpaceHealthBarGroup:
+    def test_creation(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        bar_group = UIWorldSpaceHealthBarGroup(
+            relative_rect=pygame.Rect(0, 0, 400, 300), manager=default_ui_manager
+        )
+        assert bar_group.image is not None
+        assert bar_group.image.get_size() == (400, 300)
+
+    def test_set_bars(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        bar_group = UIWorldSpaceHealthBarGroup(
+            relative_rect=pygame.Rect(0, 0, 400, 300),
+            bar_size=(50, 12),
+            manager=default_ui_manager,
+        )
+        bar_group.set_bars(
+            ArrayLike([(100, 100), (200, 150), (1000, 1000)]),
+            ArrayLike([0.5, 1.0, 0.25]),
+        )
+        assert not bar_group.can_sleep()
+        default_ui_manager.update(0.01)
+        assert bar_group.can_sleep()
+
+        # the bar off-camera is culled
+        assert bar_group.get_drawn_bar_count() == 2
+        assert bar_group.image.get_at((100, 100)).a == 255
+        assert bar_group.image.get_at((300, 250)).a == 0
+
+        bar_group.set_camera_position((800, 800))
+        default_ui_manager.update(0.01)
+        assert bar_group.get_drawn_bar_count() == 1
+        assert bar_group.image.get_at((100, 100)).a == 0
+        assert bar_group.image.get_at((200, 200)).a == 255
+
+        # one pre-rendered bar per fill width used
+        assert len(bar_group._bar_surface_cache) == 3
+
+        with pytest.raises(ValueError):
+            bar_group.set_bars([(0, 0)], [0.5, 0.5])
+
+    def test_never_hovered(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        bar_group = UIWorldSpaceHealthBarGroup(
+            relative_rect=pygame.Rect(0, 0, 800, 600), manager=manager
+        )
+        bar_group.set_bars([(100, 100)], [0.5])
+        manager.update(0.01)
+
+        assert bar_group not in manager.get_sprite_group().get_sprites_near_point(
+            100, 100
+        )
+        assert not bar_group.hover_point(100, 100)
+
+    def test_rebuild_from_changed_theme_data(
+        self, _init_pygame, _display_surface_return_none, default_ui_manager
+    ):
+        bar_group = UIWorldSpaceHealthBarGroup(
+            relative_rect=pygame.Rect(0, 0, 400, 300), manager=default_ui_manager
+        )
+        bar_group.set_bars([(100, 100)], [0.5])
+        default_ui_manager.update(0.01)
+        assert len(bar_group._bar_surface_cache) == 1
+
+        bar_group.bar_filled_colour = pygame.Color("#00FF00")
+        bar_group.rebuild()
+        assert len(bar_group._bar_surface_cache) == 1
+        assert bar_group.image.get_at((80, 100)) == pygame.Color("#00FF00")
+
+
+if __name__ == "__main__":
+    pytest.console_main()
@@ -0,0 +1,45 @@
+import pytest
+import pytest_benchmark
+
+import pygame
+
+from pygame_gui.ui_manager import UIManager
+from pygame_gui.core.drawable_shapes import RoundedRectangleShape
+
+
+def resize_rounded_rectangle(shape: RoundedRectangleShape, sizes: list):
+    """
+    Resize a large panel shape through a series of sizes, as when dragging out a window,
+    fully redrawing it at each one.
+    """
+    for size in sizes:
+        shape.set_dimensions(size)
+        shape.full_rebuild_on_size_change()
+
+
+def test_rounded_rectangle_resize_performance(
+    benchmark, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+):
+    shape = RoundedRectangleShape(
+        containing_rect=pygame.Rect(0, 0, 600, 400),
+        theming_parameters={
+            "shadow_width": 2,
+            "border_width": 1,
+            "border_overlap": 1,
+            "normal_border": pygame.Color("#DDDDDD"),
+            "normal_bg": pygame.Color("#25292e"),
+            "hovered_border": pygame.Color("#B0B0B0"),
+            "hovered_bg": pygame.Color("#35393e"),
+            "shape_corner_radius": [8, 8, 8, 8],
+        },
+        states=["normal", "hovered"],
+        manager=default_ui_manager,
+    )
+    sizes = [(600 + (step * 7), 400 + (step * 5)) for step in range(20)]
+
+    benchmark(resize_rounded_rectangle, shape, sizes)
+    assert shape.states["normal"].surface.get_size() == sizes[-1]
+
+
+if __name__ == "__main__":
+    pytest.console_main()
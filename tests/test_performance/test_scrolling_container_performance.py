@@ -0,0 +1,47 @@
+import pytest
+import pytest_benchmark
+
+import pygame
+
+from pygame_gui.ui_manager import UIManager
+from pygame_gui.elements.ui_button import UIButton
+from pygame_gui.elements.ui_scrolling_container import UIScrollingContainer
+
+
+def create_scrolling_container_of_buttons(manager: UIManager) -> UIScrollingContainer:
+    scroll_container = UIScrollingContainer(
+        pygame.Rect(0, 0, 400, 400), manager=manager, allow_scroll_x=False
+    )
+    scroll_container.set_scrollable_area_dimensions((380, 5000))
+    for index in range(500):
+        UIButton(
+            pygame.Rect((index % 5) * 76, (index // 5) * 50, 76, 50),
+            text=f"Button {index}",
+            manager=manager,
+            container=scroll_container,
+        )
+    return scroll_container
+
+
+def test_scrolling_container_performance(
+    benchmark, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+):
+    screen = pygame.display.get_surface()
+    scroll_container = create_scrolling_container_of_buttons(default_ui_manager)
+    default_ui_manager.update(0.01)
+
+    scroll_positions = [-y for y in range(0, 4600, 23)]
+    frame_index = [0]
+
+    def scroll_one_frame():
+        position = scroll_positions[frame_index[0] % len(scroll_positions)]
+        frame_index[0] += 1
+        scroll_container.scrollable_container.set_relative_position((0, position))
+        default_ui_manager.update(0.016)
+        default_ui_manager.draw_ui(screen)
+
+    benchmark.pedantic(scroll_one_frame, rounds=50, warmup_rounds=5)
+
+
+if __name__ == "__main__":
+    pytest.console_main()
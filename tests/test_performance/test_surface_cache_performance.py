@@ -0,0 +1,109 @@
+import random
+import time
+
+import pytest
+import pytest_benchmark
+
+import pygame
+
+from pygame_gui.core.surface_cache import SurfaceCache
+
+
+def replay_cache_churn(cycles: int, seed: int) -> dict:
+    """
+    Add and free a stream of randomly sized surfaces, roughly the mix of sizes UI shapes come
+    in, and measure how long it takes to get each one into the long term cache.
+    """
+    rng = random.Random(seed)
+    cache = SurfaceCache()
+    live_ids = []
+    insert_times = []
+    for index in range(cycles):
+        if live_ids and rng.random() < 0.45:
+            string_id = live_ids.pop(rng.randrange(len(live_ids)))
+            cache.remove_user_and_request_clean_up_of_cached_item(string_id)
+        else:
+            surface = pygame.Surface(
+                (rng.randint(8, 160), rng.randint(8, 60)),
+                flags=pygame.SRCALPHA,
+                depth=32,
+            )
+            string_id = f"shape_{index}"
+            cache.add_surface_to_cache(surface, string_id)
+            live_ids.append(string_id)
+            start_time = time.perf_counter()
+            cache.update()
+            insert_times.append(time.perf_counter() - start_time)
+            continue
+        cache.update()
+
+    live_area = sum(
+        cached_item["surface"].get_width() * cached_item["surface"].get_height()
+        for cached_item in cache.cache_long_term_lookup.values()
+    )
+    total_area = len(cache.cache_surfaces) * (
+        cache.cache_surface_size[0] * cache.cache_surface_size[1]
+    )
+    return {
+        "occupancy": live_area / total_area,
+        "cache_surfaces": len(cache.cache_surfaces),
+        "cached_count": len(cache.cache_long_term_lookup),
+        "uncached_count": len(live_ids) - len(cache.cache_long_term_lookup),
+        "mean_insert_ms": 1000.0 * sum(insert_times) / len(insert_times),
+        "max_insert_ms": 1000.0 * max(insert_times),
+    }
+
+
+def replay_shape_requests(requests: int, seed: int, eviction_policy: str) -> dict:
+    """
+    Look up a stream of shapes, where a few shapes are far more popular than the rest, through
+    a cache with a small memory budget. Shapes that aren't found are added, and every shape is
+    released straight after use.
+    """
+    rng = random.Random(seed)
+    cache = SurfaceCache(memory_budget=512 * 512 * 4, eviction_policy=eviction_policy)
+    hits = 0
+    for _ in range(requests):
+        shape_index = min(int(rng.expovariate(1.0 / 60.0)), 1000)
+        string_id = f"shape_{shape_index}"
+        if cache.find_surface_in_cache(string_id) is not None:
+            hits += 1
+        else:
+            shape_rng = random.Random(shape_index)
+            surface = pygame.Surface(
+                (shape_rng.randint(8, 200), shape_rng.randint(8, 60)),
+                flags=pygame.SRCALPHA,
+                depth=32,
+            )
+            cache.add_surface_to_cache(surface, string_id)
+        cache.remove_user_from_cache_item(string_id)
+        cache.update()
+    return {
+        "hit_rate": hits / requests,
+        "memory_usage": cache.get_memory_usage(),
+    }
+
+
+def test_surface_cache_churn_performance(
+    benchmark, _init_pygame, _display_surface_return_none
+):
+    results = benchmark.pedantic(
+        replay_cache_churn, args=(4000, 1234), rounds=3, warmup_rounds=1
+    )
+    benchmark.extra_info.update(results)
+    assert results["uncached_count"] == 0
+
+
+@pytest.mark.parametrize("eviction_policy", ["lru", "lfu", "gdsf"])
+def test_surface_cache_eviction_performance(
+    benchmark, _init_pygame, _display_surface_return_none, eviction_policy
+):
+    results = benchmark.pedantic(
+        replay_shape_requests, args=(5000, 1234, eviction_policy), rounds=3
+    )
+    benchmark.extra_info.update(results)
+    assert results["memory_usage"] <= 512 * 512 * 4
+
+
+if __name__ == "__main__":
+    pytest.console_main()
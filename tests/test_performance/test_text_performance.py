@@ -5,6 +5,8 @@ import pygame
 
 from pygame_gui.ui_manager import UIManager
 from pygame_gui.elements.ui_text_box import UITextBox
+from pygame_gui.elements.ui_label import UILabel
+from pygame_gui.core.gui_font_pygame import GUIFontPygame
 
 
 def create_new_text_box(default_ui_manager):
@@ -35,5 +37,151 @@ def test_new_style_text_box_performance(
     benchmark(create_new_text_box, default_ui_manager)
 
 
+def drag_select_and_wrap_text(text_box: UITextBox, positions: list):
+    """
+    Drag a selection across a long paragraph, then lay it out again at a new width.
+    """
+    layout = text_box.text_box_layout
+    for position in positions:
+        layout.set_cursor_from_click_pos(position)
+    text_box.set_dimensions((380, 600))
+    text_box.set_dimensions((400, 600))
+
+
+def test_long_paragraph_wrap_and_click_performance(
+    benchmark, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+):
+    text_box = UITextBox(
+        html_text=" ".join(["More text a bunch more text a whole lotta text."] * 60),
+        relative_rect=pygame.Rect(0, 0, 400, 600),
+        manager=default_ui_manager,
+    )
+    positions = [(x, y) for y in range(10, 300, 40) for x in range(10, 380, 30)]
+
+    benchmark(drag_select_and_wrap_text, text_box, positions)
+    assert text_box.text_box_layout.layout_rows
+
+
+def count_up_label(label: UILabel, frames: int):
+    """
+    Update a numeric counter label every frame, as with an FPS or score display.
+    """
+    for frame in range(frames):
+        label.set_text(f"{frame}")
+
+
+@pytest.mark.parametrize("use_glyph_atlas", [False, True])
+def test_counter_label_performance(
+    benchmark,
+    _init_pygame,
+    default_ui_manager: UIManager,
+    _display_surface_return_none,
+    use_glyph_atlas,
+):
+    default_ui_manager.get_theme().get_font_dictionary().set_glyph_atlas_rendering(
+        use_glyph_atlas
+    )
+    label = UILabel(pygame.Rect(10, 10, 200, 30), "0", default_ui_manager)
+
+    benchmark(count_up_label, label, 200)
+    assert label.text == "199"
+
+
+def render_counter_text(font: GUIFontPygame, frames: int):
+    """
+    Measure and render a changing number every frame, as a text chunk redraw does.
+    """
+    for frame in range(frames):
+        text = str(frame)
+        text_rect = font.get_rect(text)
+        font.render_premul_to(
+            text, pygame.Color("#FFFFFF"), text_rect.size, (0, text_rect.y)
+        )
+
+
+@pytest.mark.parametrize("use_glyph_atlas", [False, True])
+def test_counter_text_render_performance(
+    benchmark, _init_pygame, _display_surface_return_none, use_glyph_atlas
+):
+    font = GUIFontPygame(
+        "tests/data/Roboto-Regular.ttf", 32, use_glyph_atlas=use_glyph_atlas
+    )
+
+    benchmark(render_counter_text, font, 500)
+
+
+def create_long_paragraph_text_box(default_ui_manager):
+    return UITextBox(
+        html_text=" ".join(["More text a bunch more text a whole lotta text."] * 60),
+        relative_rect=pygame.Rect(0, 0, 400, 600),
+        manager=default_ui_manager,
+    )
+
+
+@pytest.mark.parametrize("use_glyph_atlas", [False, True])
+def test_long_paragraph_performance(
+    benchmark,
+    _init_pygame,
+    default_ui_manager: UIManager,
+    _display_surface_return_none,
+    use_glyph_atlas,
+):
+    default_ui_manager.get_theme().get_font_dictionary().set_glyph_atlas_rendering(
+        use_glyph_atlas
+    )
+
+    text_box = benchmark(create_long_paragraph_text_box, default_ui_manager)
+    assert text_box.text_box_layout.layout_rows
+
+
 if __name__ == "__main__":
     pytest.console_main()
+
+
+def redraw_shadowed_text(text_box: UITextBox, frames: int):
+    """
+    Redraw the chunks of a text box full of shadowed text, as hovering styled links does.
+    """
+    for _ in range(frames):
+        for row in text_box.text_box_layout.layout_rows:
+            for chunk in row.items:
+                chunk.redraw()
+
+
+def test_text_shadow_redraw_performance(
+    benchmark, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+):
+    text_box = UITextBox(
+        html_text="<shadow size=3 offset=1,1 color=#000000>"
+        + " ".join(["Shadowed link text to redraw."] * 4)
+        + "</shadow>",
+        relative_rect=pygame.Rect(0, 0, 400, 300),
+        manager=default_ui_manager,
+    )
+
+    benchmark(redraw_shadowed_text, text_box, 20)
+
+
+def append_log_lines(text_box: UITextBox, lines: int):
+    """
+    Append lines to the bottom of a text box, as a log or console does.
+    """
+    for line in range(lines):
+        text_box.append_html_text(f"<b>log line {line}</b> some output text<br>")
+
+
+def test_append_to_long_log_performance(
+    benchmark, _init_pygame, default_ui_manager: UIManager, _display_surface_return_none
+):
+    default_ui_manager.preload_fonts(
+        [{"name": "noto_sans", "point_size": 14, "style": "bold"}]
+    )
+    text_box = UITextBox(
+        html_text="Log start<br>",
+        relative_rect=pygame.Rect(0, 0, 400, 300),
+        manager=default_ui_manager,
+    )
+    append_log_lines(text_box, 1000)
+
+    benchmark(append_log_lines, text_box, 20)
+    assert len(text_box.text_box_layout.layout_rows) > 1000
@@ -334,6 +334,30 @@ class TestUIManager:
             pass
         pygame.display.quit()
 
+    def test_draw_ui_dirty_rects(self, _init_pygame, _display_surface_return_none):
+        test_surface = pygame.display.set_mode((300, 200), 0, 32)
+        manager = UIManager((300, 200))
+        button = UIButton(
+            relative_rect=pygame.Rect(10, 10, 100, 30), text="Test", manager=manager
+        )
+        manager.update(0.01)
+        assert manager.draw_ui(test_surface) == [test_surface.get_rect()]
+
+        manager.set_dirty_rect_mode(True)
+        manager.draw_ui(test_surface)
+        manager.update(0.01)
+        assert manager.draw_ui(test_surface) == []
+
+        button.set_relative_position((10, 100))
+        manager.update(0.01)
+        dirty_rects = manager.draw_ui(test_surface)
+        assert len(dirty_rects) == 2
+        assert pygame.Rect(10, 10, 100, 30) in dirty_rects
+        assert pygame.Rect(10, 100, 100, 30) in dirty_rects
+
+        manager.set_window_resolution((300, 200))
+        assert manager.draw_ui(test_surface) == [test_surface.get_rect()]
+
     def test_add_font_paths_and_preload_fonts(
         self, _init_pygame, default_ui_manager, _display_surface_return_none
     ):
@@ -527,6 +551,186 @@ class TestUIManager:
 
         assert manager.get_hovering_any_element()
 
+    def test_hover_follows_moved_elements(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        manager = UIManager((800, 600))
+        button = UIButton(pygame.Rect(0, 0, 100, 50), "Moving", manager=manager)
+
+        manager.mouse_position = (650, 525)
+        manager._handle_hovering(0.05)
+        assert not button.hovered
+
+        button.set_position((600, 500))
+        manager._handle_hovering(0.05)
+        assert button.hovered
+
+        # far away from where the button is, it should still be un-hovered
+        manager.mouse_position = (10, 10)
+        manager._handle_hovering(0.05)
+        assert not button.hovered
+        assert not manager.get_hovering_any_element()
+
+        button.set_dimensions((30, 30))
+        manager.mouse_position = (650, 525)
+        manager._handle_hovering(0.05)
+        assert not button.hovered
+
+    def test_process_events_routes_by_event_type(
+        self, _init_pygame, _display_surface_return_none
+    ):
+        manager = UIManager((800, 600))
+
+        class CountingButton(UIButton):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.seen_event_types = []
+
+            def process_event(self, event: pygame.event.Event) -> bool:
+                self.seen_event_types.append(event.type)
+                return super().process_event(event)
+
+        class DeclaredButton(CountingButton):
+            handled_event_types = UIButton.handled_event_types
+
+        counting_button = CountingButton(
+            pygame.Rect(0, 0, 100, 30), "Counting", manager=manager
+        )
+        declared_button = DeclaredButton(
+            pygame.Rect(0, 40, 100, 30), "Declared", manager=manager
+        )
+
+        # undeclared overrides of process_event get every event to be safe
+        assert CountingButton.get_handled_event_types() is None
+        assert DeclaredButton.get_handled_event_types() == UIButton.handled_event_types
+
+        custom_event_type = pygame.event.custom_type()
+        manager.process_events(pygame.event.Event(custom_event_type, {}))
+        assert counting_button.seen_event_types == [custom_event_type]
+        assert declared_button.seen_event_types == []
+
+        manager.process_events(
+            pygame.event.Event(pygame.MOUSEBUTTONUP, {"button": 1, "pos": (500, 500)})
+        )
+        assert declared_button.seen_event_types == [pygame.MOUSEBUTTONUP]
+        assert counting_button.seen_event_types == [
+            custom_event_type,
+            pygame.MOUSEBUTTONUP,
+        ]
+
+        # routes are rebuilt once elements change
+        counting_button.kill()
+        manager.process_events(pygame.event.Event(custom_event_type, {}))
+        assert len(counting_button.seen_event_types) == 2
+        assert manager._get_event_route(custom_event_type) == []
+
+    def test_idle_elements_sleep(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        button = UIButton(pygame.Rect(100, 100, 100, 30), "Sleepy", manager=manager)
+        for _ in range(30):
+            manager.update(0.05)
+        assert manager.get_sprite_group().get_awake_sprite_count() == 0
+
+        # hovering changes the button's state, which wakes it up to collect the new image
+        normal_image = button.image
+        manager.mouse_position = (150, 115)
+        manager._update_mouse_position = lambda: None
+        manager.update(0.05)
+        assert button.hovered
+        assert button.image is not normal_image
+
+    def test_persistent_shape_cache(
+        self, _init_pygame, _display_surface_return_none, tmp_path
+    ):
+        manager = UIManager((800, 600), shape_cache_directory=tmp_path)
+        assert len(manager.get_theme().shape_cache.cache_long_term_lookup) == 0
+        UIButton(pygame.Rect(100, 100, 100, 30), "Cached", manager=manager)
+        for _ in range(10):
+            manager.update(0.05)
+        cached_ids = set(manager.get_theme().shape_cache.cache_long_term_lookup)
+        assert len(cached_ids) > 0
+        assert manager.save_shape_cache()
+
+        new_manager = UIManager((800, 600), shape_cache_directory=tmp_path)
+        assert set(new_manager.get_theme().shape_cache.cache_long_term_lookup) == (
+            cached_ids
+        )
+
+        # a different theme could have drawn different shapes, so nothing is loaded
+        themed_manager = UIManager(
+            (800, 600),
+            {"button": {"misc": {"shape": "rounded_rectangle"}}},
+            shape_cache_directory=tmp_path,
+        )
+        assert len(themed_manager.get_theme().shape_cache.cache_long_term_lookup) == 0
+
+        assert not UIManager((800, 600)).save_shape_cache()
+
+    def test_persistent_shape_cache_later_theme(
+        self, _init_pygame, _display_surface_return_none, tmp_path
+    ):
+        later_theme = {"button": {"colours": {"normal_bg": "#336699"}}}
+        manager = UIManager((800, 600), shape_cache_directory=tmp_path)
+        manager.get_theme().load_theme(later_theme)
+        UIButton(pygame.Rect(100, 100, 100, 30), "Cached", manager=manager)
+        for _ in range(10):
+            manager.update(0.05)
+        cached_ids = set(manager.get_theme().shape_cache.cache_long_term_lookup)
+        assert len(cached_ids) > 0
+        assert manager.save_shape_cache()
+
+        # the saved cache was drawn with the later theme, so it isn't loaded without it
+        new_manager = UIManager((800, 600), shape_cache_directory=tmp_path)
+        assert len(new_manager.get_theme().shape_cache.cache_long_term_lookup) == 0
+
+        # it is loaded once the same theme is loaded again
+        new_manager.get_theme().load_theme(later_theme)
+        new_manager.update(0.05)
+        assert set(new_manager.get_theme().shape_cache.cache_long_term_lookup) == (
+            cached_ids
+        )
+
+        # loading theme data that is already loaded doesn't change anything
+        theme_hash = new_manager.get_theme().get_theme_data_hash()
+        new_manager.get_theme().load_theme(later_theme)
+        assert new_manager.get_theme().get_theme_data_hash() == theme_hash
+
+    def test_get_cache_stats(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        UIButton(pygame.Rect(100, 100, 100, 30), "Stats", manager=manager)
+        UIButton(pygame.Rect(100, 200, 100, 30), "Stats", manager=manager)
+        stats = manager.get_cache_stats()
+        assert stats["shape_cache"]["hits"] > 0
+        assert 0.0 < stats["shape_cache"]["hit_rate"] <= 1.0
+        assert "hit_rate" in stats["shadow_generator"]
+
+    def test_cache_stats_overlay(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        UIButton(pygame.Rect(300, 300, 100, 30), "Stats", manager=manager)
+        surface = pygame.Surface((800, 600), depth=32)
+        background = pygame.Surface((800, 600), depth=32)
+        background.fill(pygame.Color("#FF0000"))
+        manager.set_dirty_rect_mode(True)
+        manager.update(0.01)
+        surface.blit(background, (0, 0))
+        manager.draw_ui(surface, background)
+        assert manager.draw_ui(surface, background) == []
+
+        manager.set_visual_debug_mode(True)
+        manager.update(0.01)
+        manager.draw_ui(surface, background)
+        assert surface.get_at((1, 1)) != pygame.Color("#FF0000")
+        # the overlay is redrawn every frame, over anything that changes underneath
+        changed_rects = manager.draw_ui(surface, background)
+        assert len(changed_rects) == 1 and changed_rects[0].topleft == (0, 0)
+        assert changed_rects[0].width < 800
+
+        manager.set_visual_debug_mode(False)
+        manager.update(0.01)
+        manager.draw_ui(surface, background)
+        assert surface.get_at((1, 1)) == pygame.Color("#FF0000")
+        assert manager.draw_ui(surface, background) == []
+
 
 if __name__ == "__main__":
     os.chdir("..")